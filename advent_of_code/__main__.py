@@ -2,23 +2,253 @@
 Advent of Code!
 
 https://adventofcode.com/
+
+Run with no arguments to print today's solution, or use one of the
+subcommands::
+
+    python -m advent_of_code run --year 2022 --day 11
+    python -m advent_of_code run --year 2022 --all --timeout 60 --max-memory 2048
+    python -m advent_of_code bench --year 2022 --day 11 --repeat 10
+    python -m advent_of_code bench --year 2022 --check --tolerance 25
+    python -m advent_of_code bench --year 2022 --day 8 --scale 1 10 100
+
+Use ``--list`` to list the days that have a solution.
 """
 
+import argparse
+import pathlib
+import sys
+
+import advent_of_code.registry
 import advent_of_code.solutions
 import advent_of_code.utils
 
 
+def _parse_args(args: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+    """
+    parser = argparse.ArgumentParser(prog="advent_of_code")
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List the days that have a solution.",
+    )
+    parser.add_argument(
+        "--import-times",
+        action="store_true",
+        help="With --list, also show how long each day takes to import.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    run = subparsers.add_parser("run", help="Print the solutions.")
+    run.add_argument("--year", type=int, nargs="+", default=[2023])
+    run.add_argument("--day", type=int, help="Defaults to today.")
+    run.add_argument(
+        "--part",
+        type=int,
+        choices=[1, 2],
+        help="Defaults to both parts.",
+    )
+    run.add_argument(
+        "--all",
+        action="store_true",
+        help="Print every day up to and including the day.",
+    )
+    run.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Solve the days in a process pool.",
+    )
+    run.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the solutions with cProfile.",
+    )
+    run.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Profile the solutions' allocations with tracemalloc.",
+    )
+    run.add_argument(
+        "--timeout",
+        type=float,
+        help="Solve each day in a child process, stopping it after this many seconds.",
+    )
+    run.add_argument(
+        "--max-memory",
+        type=int,
+        help="Solve each day in a child process, limited to this many MiB.",
+    )
+    run.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute the answers even if they are in the answer cache.",
+    )
+
+    bench = subparsers.add_parser("bench", help="Benchmark the solutions.")
+    bench.add_argument("--year", type=int, required=True)
+    bench.add_argument(
+        "--day",
+        type=int,
+        nargs="+",
+        help="Defaults to every day.",
+    )
+    bench.add_argument(
+        "--part",
+        type=int,
+        choices=[1, 2],
+        help="Defaults to both parts.",
+    )
+    bench.add_argument("--warmup", type=int, default=1)
+    bench.add_argument("--repeat", type=int, default=5)
+    bench.add_argument(
+        "--sample",
+        action="store_true",
+        help="Use the sample*.data files rather than input.data.",
+    )
+    bench.add_argument(
+        "--output",
+        type=pathlib.Path,
+        help="Write the results to this JSON file.",
+    )
+    bench.add_argument(
+        "--scale",
+        type=int,
+        nargs="+",
+        help=(
+            "Time generated inputs at these multiples of the puzzle size and "
+            "plot the runtime against the input size."
+        ),
+    )
+    bench.add_argument("--seed", type=int, default=0, help="For --scale.")
+    bench.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Record the results as the baselines in baselines.json.",
+    )
+    bench.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if any part is slower than its baseline by the tolerance.",
+    )
+    bench.add_argument(
+        "--tolerance",
+        type=float,
+        default=20.0,
+        help="The percentage slowdown allowed by --check (default: %(default)s).",
+    )
+
+    parsed = parser.parse_args(args)
+    if parsed.command == "run" and parsed.parallel:
+        if parsed.timeout or parsed.max_memory:
+            parser.error("--parallel can't be used with --timeout or --max-memory")
+    if parsed.command == "bench" and (parsed.sample or parsed.scale):
+        if parsed.save_baseline or parsed.check:
+            parser.error("the baselines are only for input.data")
+
+    return parsed
+
+
 def main() -> None:
     """
     Print the solutions.
     """
     # advent_of_code.utils.create_files(year=2023, day=None)
 
-    advent_of_code.solutions.print_solutions(
-        print_all=False,
-        year=2023,
-        # print_day=1,
-    )
+    args = _parse_args()
+    if args.list:
+        advent_of_code.registry.print_days(import_times=args.import_times)
+        return
+
+    match args.command:
+        case "run" if args.profile or args.profile_memory:
+            # Only imported when it's needed to keep the other commands quick to
+            # start
+            import advent_of_code.profiling as profiling
+
+            profile = (
+                profiling.profile_memory
+                if args.profile_memory
+                else profiling.profile_solution
+            )
+            for year, day in advent_of_code.solutions.get_days(
+                print_all=args.all,
+                year=args.year,
+                print_day=args.day,
+            ):
+                print(f"--- Year {year} Day {day:02d} Profile ---")
+                solution = advent_of_code.solutions.Solution(year=year, day=day)
+                print(profile(solution, part=args.part), "\n", sep="")
+        case "run" if args.timeout or args.max_memory:
+            # Only imported when it's needed to keep the other commands quick to
+            # start
+            import advent_of_code.sandbox as sandbox
+
+            outcomes = sandbox.print_solutions_in_sandbox(
+                days=advent_of_code.solutions.get_days(
+                    print_all=args.all,
+                    year=args.year,
+                    print_day=args.day,
+                ),
+                part=args.part,
+                use_cache=not args.no_cache,
+                timeout=args.timeout,
+                max_memory_mib=args.max_memory,
+            )
+            if any(outcome.status != sandbox.OK for outcome in outcomes.values()):
+                sys.exit(1)
+        case "run":
+            advent_of_code.solutions.print_solutions(
+                print_all=args.all,
+                year=args.year,
+                print_day=args.day,
+                parallel=args.parallel,
+                use_cache=not args.no_cache,
+                part=args.part,
+            )
+        case "bench":
+            # Only imported when it's needed to keep the other commands quick to
+            # start
+            import advent_of_code.benchmark as benchmark
+
+            days = args.day or [
+                day for _, day in advent_of_code.registry.find_days(args.year)
+            ]
+            parts = (args.part,) if args.part else (1, 2)
+            if args.scale:
+                benchmark.scaling(
+                    year=args.year,
+                    days=days,
+                    scales=args.scale,
+                    seed=args.seed,
+                    warmup=args.warmup,
+                    repeat=args.repeat,
+                    parts=parts,
+                )
+                return
+
+            results = benchmark.benchmark(
+                year=args.year,
+                days=days,
+                warmup=args.warmup,
+                repeat=args.repeat,
+                sample=args.sample,
+                parts=parts,
+            )
+            if args.output:
+                benchmark.write_results(results, args.output)
+            if args.save_baseline:
+                benchmark.save_baselines(results)
+            if args.check and benchmark.check_baselines(results, args.tolerance):
+                sys.exit("Some solutions are slower than their baselines")
+        case _:
+            advent_of_code.solutions.print_solutions(
+                print_all=False,
+                year=2023,
+                # print_day=1,
+                # parallel=True,
+            )
 
 
 if __name__ == "__main__":
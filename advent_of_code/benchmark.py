@@ -0,0 +1,494 @@
+"""
+Benchmark the solutions to the Advent of Code problems.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import dataclasses
+import datetime
+import functools
+import importlib
+import itertools
+import json
+import math
+import os
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, TypeVar
+
+from advent_of_code.constants import ROOT
+from advent_of_code.solutions import Solution
+
+BASELINES = ROOT / "baselines.json"
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    """
+    The timings of one part of a solution over a single input file.
+
+    The ``part`` is ``None`` for the days that can only solve both parts at
+    once, which are timed solving both. The times are wall-clock seconds and
+    the peak RSS is in kibibytes.
+    """
+
+    year: int
+    day: int
+    part: int | None
+    input_file: str
+    warmup: int
+    repeat: int
+    times: list[float]
+    peak_rss_kib: int
+
+    @property
+    def min(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.times, 95)
+
+    def as_dict(self) -> dict:
+        """
+        Return the result as a JSON-serialisable dictionary.
+        """
+        return dataclasses.asdict(self) | {
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+        }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Return the nearest-rank percentile of the values.
+    """
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+
+    return ordered[max(rank, 1) - 1]
+
+
+def _peak_rss_kib() -> int:
+    """
+    Return the peak resident set size of the current process in kibibytes.
+
+    Linux reports ``ru_maxrss`` in kibibytes, but macOS reports it in bytes.
+    The ``resource`` module isn't available on Windows, so this is 0 there.
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return peak_rss // 1024 if sys.platform == "darwin" else peak_rss
+
+
+def input_files(year: int, day: int, sample: bool) -> list[pathlib.Path]:
+    """
+    Return the input files to benchmark the day's solution against.
+
+    These are the ``sample*.data`` files when ``sample`` is set, and the
+    ``input.data`` file otherwise.
+    """
+    path = ROOT / f"year_{year}/day_{day:02d}"
+    if sample:
+        return sorted(path.glob("sample*.data"))
+
+    return [file for file in [path / "input.data"] if file.exists()]
+
+
+def _part_name(part: int | None) -> str:
+    return "both parts" if part is None else f"part {part}"
+
+
+def _solvable_parts(year: int, day: int) -> set[int]:
+    """
+    Return the parts that the day can solve on their own.
+    """
+    return set(Solution(year=year, day=day).parts)
+
+
+def _parts_to_time(
+    year: int, day: int, parts: tuple[int, ...]
+) -> tuple[int | None, ...]:
+    """
+    Return the parts to time one at a time, or ``(None,)`` to time solving
+    both parts at once.
+
+    The days that only expose ``solution`` have to solve both parts to solve
+    either of them, so timing each part would take twice as long and record
+    the time for both parts as each part's time. The day is imported in a
+    child process so that it isn't already imported in the benchmarks.
+    """
+    if set(parts) <= _run_in_child(_solvable_parts, year, day):
+        return parts
+
+    return (None,)
+
+
+def _time_part(
+    solution: Solution,
+    part: int | None,
+    input_: str,
+    warmup: int,
+    repeat: int,
+) -> list[float]:
+    """
+    Return the times taken to solve the part (or both parts, when the part is
+    ``None``), without the warmup runs.
+    """
+    if part is None:
+        solve = functools.partial(solution.solution, input_=input_)
+    else:
+        solve = functools.partial(solution.solve_part, part, input_)
+
+    times = []
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(warmup):
+            solve()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            solve()
+            times.append(time.perf_counter() - start)
+
+    return times
+
+
+def _run_in_child(function: Callable[..., T], *args: Any) -> T:
+    """
+    Run the function in a fresh process and return its result.
+    """
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=1, max_tasks_per_child=1
+    ) as executor:
+        return executor.submit(function, *args).result()
+
+
+def _run_benchmark(
+    year: int,
+    day: int,
+    part: int | None,
+    input_file: pathlib.Path,
+    warmup: int,
+    repeat: int,
+) -> BenchmarkResult:
+    """
+    Time the part of the day's solution against the input file.
+
+    This is run in a fresh process per part and input file so that the peak
+    RSS belongs to the part alone.
+    """
+    solution = Solution(year=year, day=day)
+    input_ = input_file.read_text().strip()
+
+    return BenchmarkResult(
+        year=year,
+        day=day,
+        part=part,
+        input_file=input_file.name,
+        warmup=warmup,
+        repeat=repeat,
+        times=_time_part(solution, part, input_, warmup, repeat),
+        peak_rss_kib=_peak_rss_kib(),
+    )
+
+
+def benchmark(
+    year: int,
+    days: list[int],
+    warmup: int = 1,
+    repeat: int = 5,
+    sample: bool = False,
+    parts: tuple[int, ...] = (1, 2),
+) -> list[BenchmarkResult]:
+    """
+    Benchmark the solutions for the days, one part and input file at a time.
+
+    The days that can only solve both parts at once are timed solving both,
+    once per input file.
+    """
+    if repeat < 1:
+        raise ValueError(f"Must repeat at least once, found {repeat}")
+
+    results = []
+    for day in days:
+        for input_file, part in itertools.product(
+            input_files(year, day, sample), _parts_to_time(year, day, parts)
+        ):
+            result = _run_in_child(
+                _run_benchmark, year, day, part, input_file, warmup, repeat
+            )
+            print(
+                f"{year} day {day:02d} {_part_name(part)} ({result.input_file}): "
+                f"min {result.min:.4f}s, "
+                f"median {result.median:.4f}s, "
+                f"p95 {result.p95:.4f}s, "
+                f"peak RSS {result.peak_rss_kib:,} KiB"
+            )
+            results.append(result)
+
+    return results
+
+
+def _git_commit() -> str | None:
+    """
+    Return the hash of the commit that is checked out, if there is one.
+    """
+    with contextlib.suppress(OSError, subprocess.CalledProcessError):
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+
+
+def write_results(results: list[BenchmarkResult], output: pathlib.Path) -> None:
+    """
+    Write the benchmark results to a JSON file, alongside enough metadata to
+    compare runs across commits.
+    """
+    output.write_text(
+        json.dumps(
+            {
+                "commit": _git_commit(),
+                "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": [result.as_dict() for result in results],
+            },
+            indent=2,
+        )
+    )
+
+
+def read_baselines(file: pathlib.Path = BASELINES) -> dict:
+    """
+    Read the baselines, keyed like ``solutions.yaml`` by year, day and part
+    (or ``both-parts`` for the days that can only solve both at once).
+    """
+    try:
+        return json.loads(file.read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def _baseline_keys(result: BenchmarkResult) -> tuple[str, str, str]:
+    part = "both-parts" if result.part is None else f"part-{result.part}"
+
+    return f"year-{result.year}", f"day-{result.day:02d}", part
+
+
+def save_baselines(results: list[BenchmarkResult], file: pathlib.Path = BASELINES):
+    """
+    Record the median runtime and peak RSS of the results as the baselines.
+
+    Baselines for the parts that weren't benchmarked are kept as they are.
+    """
+    baselines = read_baselines(file)
+    for result in results:
+        year, day, part = _baseline_keys(result)
+        baselines.setdefault(year, {}).setdefault(day, {})[part] = {
+            "median": round(result.median, 6),
+            "peak_rss_kib": result.peak_rss_kib,
+        }
+
+    file.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+
+def check_baselines(
+    results: list[BenchmarkResult],
+    tolerance: float,
+    file: pathlib.Path = BASELINES,
+    min_seconds: float = 0.001,
+) -> list[BenchmarkResult]:
+    """
+    Compare the results with their baselines and return the regressions.
+
+    A result is a regression when its median runtime is more than
+    ``tolerance`` percent over its baseline. Slowdowns of less than
+    ``min_seconds`` are ignored, since the fastest days are mostly noise.
+    """
+    baselines = read_baselines(file)
+    regressions = []
+    for result in results:
+        year, day, part = _baseline_keys(result)
+        name = f"{result.year} day {result.day:02d} {_part_name(result.part)}"
+        try:
+            baseline = baselines[year][day][part]
+        except KeyError:
+            print(f"{name}: no baseline")
+            continue
+
+        change = 100 * (result.median / baseline["median"] - 1)
+        regressed = (
+            change > tolerance and result.median - baseline["median"] > min_seconds
+        )
+        print(
+            f"{name}: median {result.median:.4f}s vs {baseline['median']:.4f}s "
+            f"({change:+.1f}%), "
+            f"peak RSS {result.peak_rss_kib:,} KiB "
+            f"vs {baseline['peak_rss_kib']:,} KiB"
+            f"{' REGRESSION' if regressed else ''}"
+        )
+        if regressed:
+            regressions.append(result)
+
+    return regressions
+
+
+@dataclasses.dataclass
+class ScalingResult:
+    """
+    The timings of one part (or both parts, when the part is ``None``) of a
+    solution over a generated input.
+    """
+
+    year: int
+    day: int
+    part: int | None
+    scale: int
+    input_bytes: int
+    times: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+
+def _run_scaling(
+    year: int,
+    day: int,
+    part: int | None,
+    scale: int,
+    seed: int,
+    warmup: int,
+    repeat: int,
+) -> ScalingResult:
+    """
+    Time the part of the day's solution against an input generated at the
+    scale.
+    """
+    solution = Solution(year=year, day=day)
+    generator = importlib.import_module(f"{solution.module.__name__}.generator")
+    input_ = generator.generate(scale=scale, seed=seed).strip()
+
+    return ScalingResult(
+        year=year,
+        day=day,
+        part=part,
+        scale=scale,
+        input_bytes=len(input_.encode()),
+        times=_time_part(solution, part, input_, warmup, repeat),
+    )
+
+
+def fit_slope(points: list[tuple[float, float]]) -> float:
+    """
+    Return the slope of the least-squares line through the points on log-log
+    axes.
+
+    This is the exponent ``k`` in ``y ~ x^k``, so a slope of about 1 means
+    the runtime is linear in the input size and about 2 means it's
+    quadratic.
+    """
+    if len(points) < 2:
+        raise ValueError(f"Need at least 2 points to fit a slope, found {len(points)}")
+
+    xs = [math.log(x) for x, _ in points]
+    ys = [math.log(y) for _, y in points]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum(
+        (x - mean_x) ** 2 for x in xs
+    )
+
+
+def plot(points: list[tuple[float, float]], width: int = 50, height: int = 12) -> str:
+    """
+    Return an ASCII plot of the points on log-log axes, with the x values
+    along the bottom and the y values up the side.
+    """
+    xs = [math.log(x) for x, _ in points]
+    ys = [math.log(y) for _, y in points]
+    min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+
+    grid = [[" "] * width for _ in range(height)]
+    for x, y in zip(xs, ys):
+        column = round((x - min_x) / ((max_x - min_x) or 1) * (width - 1))
+        row = round((y - min_y) / ((max_y - min_y) or 1) * (height - 1))
+        grid[height - 1 - row][column] = "*"
+
+    top, bottom = f"{math.exp(max_y):.3g}s", f"{math.exp(min_y):.3g}s"
+    margin = max(len(top), len(bottom))
+    lines = [
+        f"{top if i == 0 else bottom if i == height - 1 else '':>{margin}} |{''.join(row)}"
+        for i, row in enumerate(grid)
+    ]
+    left, right = f"{math.exp(min_x):,.0f}B", f"{math.exp(max_x):,.0f}B"
+    lines.append(f"{'':>{margin}} +{'-' * width}")
+    lines.append(f"{'':>{margin}}  {left}{right:>{width - len(left)}}")
+
+    return "\n".join(lines)
+
+
+def scaling(
+    year: int,
+    days: list[int],
+    scales: list[int],
+    seed: int = 0,
+    warmup: int = 0,
+    repeat: int = 3,
+    parts: tuple[int, ...] = (1, 2),
+) -> list[ScalingResult]:
+    """
+    Time the solutions for the days against generated inputs of increasing
+    size, then plot the runtime against the input size for each part.
+
+    Days without a ``generator.py`` are skipped.
+    """
+    if repeat < 1:
+        raise ValueError(f"Must repeat at least once, found {repeat}")
+
+    results = []
+    for day in days:
+        if not (ROOT / f"year_{year}/day_{day:02d}/generator.py").exists():
+            print(f"{year} day {day:02d}: no generator, skipping")
+            continue
+
+        for part in _parts_to_time(year, day, parts):
+            part_results = []
+            for scale in sorted(scales):
+                result = _run_in_child(
+                    _run_scaling, year, day, part, scale, seed, warmup, repeat
+                )
+                print(
+                    f"{year} day {day:02d} {_part_name(part)} (x{scale}, "
+                    f"{result.input_bytes:,} bytes): median {result.median:.4f}s"
+                )
+                part_results.append(result)
+
+            points = [(result.input_bytes, result.median) for result in part_results]
+            if len(points) > 1:
+                print(f"Slope on log-log axes: {fit_slope(points):.2f}")
+                print(plot(points), "\n", sep="")
+            results.extend(part_results)
+
+    return results
@@ -0,0 +1,97 @@
+"""
+An on-disk cache for the answers to the Advent of Code problems.
+
+The answers are keyed by a hash of the input and of the source code that
+produced them, so a cached answer is only used when neither has changed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+from typing import Any
+
+from advent_of_code.constants import CACHE, ROOT
+
+
+def answer_key(input_file: pathlib.Path, path: pathlib.Path) -> str:
+    """
+    Return the cache key for the answers to the input file of the day at the
+    path.
+
+    The key is a hash of the input file and of every Python file in the day's
+    directory (so local helpers such as ``utils.py`` and ``constants.py``
+    are included) and in the shared ``utils`` package. The input file is
+    hashed in chunks, so it's never read into memory all at once.
+    """
+    sources = sorted(path.glob("*.py")) + sorted((ROOT / "utils").rglob("*.py"))
+    with open(input_file, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256")
+    for source in sources:
+        digest.update(source.relative_to(ROOT).as_posix().encode())
+        digest.update(source.read_bytes())
+
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    """
+    A directory of JSON files, one per cached answer.
+
+    When the files take up more than ``max_bytes``, the least recently used
+    files are removed until they fit again.
+    """
+
+    directory: pathlib.Path
+    max_bytes: int
+
+    def __init__(self, directory: pathlib.Path, max_bytes: int = 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def __contains__(self, key: str) -> bool:
+        return self._file(key).exists()
+
+    def __getitem__(self, key: str) -> Any:
+        file = self._file(key)
+        try:
+            answers = json.loads(file.read_text())
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            raise KeyError(key) from e
+
+        os.utime(file)  # Mark as recently used
+
+        return answers
+
+    def __setitem__(self, key: str, answers: Any) -> None:
+        try:
+            contents = json.dumps(answers)
+        except TypeError:
+            return  # Answers that can't be written to JSON are never cached
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._file(key).write_text(contents)
+        self.evict()
+
+    def _file(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}.json"
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used files until the cache fits in
+        ``max_bytes``.
+        """
+        files = [(file, file.stat()) for file in self.directory.glob("*.json")]
+        total_bytes = sum(stat.st_size for _, stat in files)
+        for file, stat in sorted(files, key=lambda file_stat: file_stat[1].st_mtime):
+            if total_bytes <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                file.unlink()
+            total_bytes -= stat.st_size
+
+
+ANSWER_CACHE = AnswerCache(CACHE / "answers")
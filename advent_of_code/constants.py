@@ -6,3 +6,5 @@ import pathlib
 
 ROOT = pathlib.Path(__file__).parent  # Resolves to `advent_of_code/`
 assert ROOT.name == "advent_of_code"
+
+CACHE = ROOT.parent / ".aoc-cache"  # Local run artefacts, such as timings
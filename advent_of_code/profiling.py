@@ -0,0 +1,196 @@
+"""
+Profile the solutions to the Advent of Code problems.
+"""
+
+from __future__ import annotations
+
+import collections
+import cProfile
+import linecache
+import pathlib
+import pstats
+import threading
+import tracemalloc
+from typing import Any
+
+from advent_of_code.constants import CACHE
+from advent_of_code.solutions import Solution
+
+PROFILES = CACHE / "profiles"
+
+Function = tuple[str, int, str]  # The (file, line, name) keys used by pstats
+
+
+def _frame(function: Function) -> str:
+    """
+    Return the flame graph frame name for the function.
+    """
+    file, line, name = function
+    if file == "~":  # Built-ins
+        return name
+
+    return f"{name} ({pathlib.Path(file).name}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats, max_depth: int = 64) -> dict[str, int]:
+    """
+    Convert the profile into collapsed stacks, with the time (in microseconds)
+    spent in each stack.
+
+    cProfile only records each caller-callee pair rather than the full stacks,
+    so the stacks are rebuilt from the roots of the call graph by splitting
+    each function's time between its callees in proportion to the time
+    recorded for each pair. Recursive calls are folded into the caller.
+    """
+    callees: dict[Function, dict[Function, float]] = collections.defaultdict(dict)
+    for function, (*_, callers) in stats.stats.items():
+        for caller, (*_, cumulative_time) in callers.items():
+            callees[caller][function] = cumulative_time
+
+    stacks: dict[str, int] = collections.defaultdict(int)
+
+    def visit(function: Function, stack: tuple[str, ...], budget: float) -> None:
+        _, _, own_time, cumulative_time, _ = stats.stats[function]
+        if cumulative_time <= 0:
+            return
+
+        stack = (*stack, _frame(function))
+        scale = budget / cumulative_time
+        stacks[";".join(stack)] += round(1_000_000 * own_time * scale)
+        if len(stack) >= max_depth:
+            return
+
+        for callee, edge_time in callees[function].items():
+            if _frame(callee) in stack:
+                continue
+            if (callee_budget := edge_time * scale) >= 1e-6:
+                visit(callee, stack, callee_budget)
+
+    for function, (*_, cumulative_time, callers) in stats.stats.items():
+        if not callers:
+            visit(function, (), cumulative_time)
+
+    return {stack: time for stack, time in stacks.items() if time > 0}
+
+
+def profile_solution(
+    solution: Solution,
+    part: int | None = None,
+    top: int = 20,
+) -> Any:
+    """
+    Solve the day's problem under cProfile and return the answers.
+
+    The profile is saved as a ``.prof`` file and as a collapsed-stack text
+    file (for tools such as ``flamegraph.pl`` and speedscope), and the
+    ``top`` functions by cumulative time are printed.
+    """
+    solution.module  # Import the day before profiling so that it's not counted
+
+    profiler = cProfile.Profile()
+    answers = profiler.runcall(solution.solve, part=part)
+
+    PROFILES.mkdir(parents=True, exist_ok=True)
+    name = f"{solution.year}-day-{solution.day:02d}"
+    profiler.dump_stats(PROFILES / f"{name}.prof")
+    stats = pstats.Stats(profiler)
+    (PROFILES / f"{name}.collapsed").write_text(
+        "".join(
+            f"{stack} {time}\n"
+            for stack, time in sorted(collapsed_stacks(stats).items())
+        )
+    )
+
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    print(f"Profiles saved to {PROFILES / name}.{{prof,collapsed}}")
+
+    return answers
+
+
+class _PeakSnapshots:
+    """
+    Take tracemalloc snapshots in the background, keeping the one with the
+    most memory traced.
+
+    Most of what a solution allocates has been freed by the time it returns,
+    so a snapshot taken at the end would miss the allocations that matter.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._traced = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> _PeakSnapshots:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.take_snapshot()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.take_snapshot()
+
+    def take_snapshot(self) -> None:
+        """
+        Take a snapshot if more memory is traced than in the last one.
+        """
+        traced, _ = tracemalloc.get_traced_memory()
+        if traced > self._traced:
+            self._traced = traced
+            self.snapshot = tracemalloc.take_snapshot()
+
+
+def profile_memory(
+    solution: Solution,
+    part: int | None = None,
+    top: int = 20,
+    interval: float = 0.05,
+) -> Any:
+    """
+    Solve the day's problem under tracemalloc and return the answers.
+
+    The ``top`` lines by the size of their allocations are printed, along
+    with the peak memory traced. The allocations are taken from the snapshot
+    with the most memory traced, where snapshots are taken every ``interval``
+    seconds while the solution runs.
+    """
+    solution.module  # Import the day before tracing so that it's not counted
+
+    tracemalloc.start()
+    try:
+        with _PeakSnapshots(interval) as peak_snapshots:
+            answers = solution.solve(part=part)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    if peak_snapshots.snapshot is None:
+        print("No memory was traced")
+        return answers
+
+    snapshot = peak_snapshots.snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    print(f"Peak memory traced: {peak / 1024:,.1f} KiB")
+    print(f"Top {top} allocation sites:")
+    for i, statistic in enumerate(snapshot.statistics("lineno")[:top], start=1):
+        frame = statistic.traceback[0]
+        print(
+            f"{i:>3}. {frame.filename}:{frame.lineno}: "
+            f"{statistic.size / 1024:,.1f} KiB in {statistic.count:,} blocks"
+        )
+        if line := linecache.getline(frame.filename, frame.lineno).strip():
+            print(f"       {line}")
+
+    return answers
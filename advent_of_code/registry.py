@@ -0,0 +1,94 @@
+"""
+Find the days that have solutions without importing them.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+
+from advent_of_code.constants import ROOT
+
+YEAR_DIRECTORY = re.compile(r"year_(\d{4})")
+DAY_DIRECTORY = re.compile(r"day_(\d{2})")
+
+
+def module_name(year: int, day: int) -> str:
+    """
+    Return the name of the day's package, such as
+    ``advent_of_code.year_2022.day_01``.
+    """
+    return f"advent_of_code.year_{year}.day_{day:02d}"
+
+
+def find_days(year: int | None = None) -> list[tuple[int, int]]:
+    """
+    Return the ``(year, day)`` pairs that have a solution, optionally just for
+    the year.
+
+    This only looks at the ``year_*/day_*`` directory names (and checks that
+    they contain a ``main.py``), so nothing is imported.
+    """
+    days = []
+    for year_directory in ROOT.glob("year_*"):
+        if not (match := YEAR_DIRECTORY.fullmatch(year_directory.name)):
+            continue
+        year_ = int(match[1])
+        if year not in {None, year_}:
+            continue
+        for day_directory in year_directory.glob("day_*"):
+            if (match := DAY_DIRECTORY.fullmatch(day_directory.name)) and (
+                day_directory / "main.py"
+            ).exists():
+                days.append((year_, int(match[1])))
+
+    return sorted(days)
+
+
+def import_time(year: int, day: int) -> float:
+    """
+    Return the time, in seconds, that it takes to import the day's package
+    (including everything that it imports) in a fresh interpreter.
+
+    This is the ``cumulative`` column of ``python -X importtime`` for the day's
+    package. The parent packages are imported first, so they aren't counted.
+    ``ROOT`` is on the path, as some of the days import the bare ``utils``
+    package. An ``ImportError`` is raised if the package can't be imported.
+    """
+    import subprocess  # Only needed here, and slow enough to import to matter
+
+    name = module_name(year, day)
+    parents = ".".join(name.split(".")[:-1])
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {parents}; import {name}"],
+        capture_output=True,
+        text=True,
+        env=os.environ | {"PYTHONPATH": os.pathsep.join([str(ROOT), *sys.path])},
+    )
+    if process.returncode != 0:
+        *_, error = process.stderr.strip().splitlines() or ["Unknown error"]
+        raise ImportError(f"Couldn't import {name}: {error}")
+
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        *_, cumulative, package = line.split("|")
+        if package.strip() == name:
+            return int(cumulative) / 1_000_000
+
+    raise ValueError(f"Import time not reported for {name}")
+
+
+def print_days(year: int | None = None, import_times: bool = False) -> None:
+    """
+    Print the days that have a solution, optionally with their import times.
+    """
+    for year_, day in find_days(year):
+        if not import_times:
+            print(f"{year_} day {day:02d}")
+            continue
+
+        try:
+            print(f"{year_} day {day:02d}: {1000 * import_time(year_, day):.1f}ms")
+        except (ImportError, ValueError) as error:
+            print(f"{year_} day {day:02d}: {error}")
@@ -0,0 +1,166 @@
+"""
+Run the solutions in child processes with limits on their time and memory.
+
+A day that runs away is killed and reported as ``TIMEOUT`` or ``OOM``
+rather than holding up (or taking down) the rest of the run.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import multiprocessing
+import multiprocessing.connection
+import signal
+import time
+import traceback
+from typing import Any, Callable
+
+import advent_of_code.solutions as solutions
+
+OK = "OK"
+TIMEOUT = "TIMEOUT"
+OOM = "OOM"
+ERROR = "ERROR"
+
+
+@dataclasses.dataclass
+class Outcome:
+    """
+    How a function got on in the sandbox.
+
+    The ``value`` is the function's return value when the status is ``OK``,
+    and the traceback when the status is ``ERROR``.
+    """
+
+    status: str
+    value: Any
+    seconds: float
+
+
+def _limit_memory(max_bytes: int) -> None:
+    """
+    Limit the address space of the current process.
+
+    Linux doesn't enforce ``RLIMIT_RSS``, so the address space is limited
+    instead. This is always at least the RSS, so the ceiling is a little
+    stricter than it would be on the RSS alone.
+    """
+    import resource  # Not available on Windows
+
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (max_bytes, hard))
+
+
+def _child(
+    connection: multiprocessing.connection.Connection,
+    max_bytes: int | None,
+    function: Callable,
+    args: tuple,
+) -> None:
+    """
+    Run the function with the memory limit and send back how it got on.
+    """
+    try:
+        if max_bytes:
+            _limit_memory(max_bytes)
+        result = (OK, function(*args))
+    except MemoryError:
+        result = (OOM, None)
+    except Exception:  # noqa
+        result = (ERROR, traceback.format_exc())
+
+    connection.send(result)
+    connection.close()
+
+
+def run_in_sandbox(
+    function: Callable,
+    *args: Any,
+    timeout: float | None = None,
+    max_bytes: int | None = None,
+) -> Outcome:
+    """
+    Run the function in a child process, killing it if it takes longer than
+    ``timeout`` seconds, and limiting it to ``max_bytes`` of memory.
+
+    A child that is killed by a signal without sending anything back is
+    assumed to have been stopped by the kernel's OOM killer when it was
+    ``SIGKILL``.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_child,
+        args=(sender, max_bytes, function, args),
+        daemon=True,
+    )
+    start = time.perf_counter()
+    process.start()
+    sender.close()  # So that the receiver sees EOF if the child dies
+
+    try:
+        if not receiver.poll(timeout):
+            process.kill()
+            process.join()
+            return Outcome(TIMEOUT, None, time.perf_counter() - start)
+
+        try:
+            status, value = receiver.recv()
+        except EOFError:
+            process.join()
+            status = OOM if process.exitcode == -signal.SIGKILL else ERROR
+            value = f"Exited with code {process.exitcode}"
+    finally:
+        receiver.close()
+
+    process.join()
+
+    return Outcome(status, value, time.perf_counter() - start)
+
+
+def print_solutions_in_sandbox(
+    days: list[tuple[int, int]],
+    part: int | None = None,
+    use_cache: bool = False,
+    timeout: float | None = None,
+    max_memory_mib: int | None = None,
+) -> dict[tuple[int, int], Outcome]:
+    """
+    Print the solutions for the ``(year, day)`` pairs, solving each day in its
+    own sandbox, and return how each day got on.
+
+    The days that hit a limit (or fail) are reported in place of their
+    answers, and the rest of the days are still solved.
+    """
+    max_bytes = max_memory_mib * 1024 * 1024 if max_memory_mib else None
+    outcomes = {}
+    timings = {}
+    for year, day in days:
+        outcome = run_in_sandbox(
+            solutions._solve,
+            year,
+            day,
+            part,
+            use_cache,
+            timeout=timeout,
+            max_bytes=max_bytes,
+        )
+        outcomes[(year, day)] = outcome
+
+        if outcome.status == OK:
+            answers, stdout, seconds = outcome.value
+            solutions._print_answers(year, day, answers, stdout)
+            if seconds is not None:
+                timings[f"{year}-{day}"] = seconds
+            continue
+
+        print(f"--- Year {year} Day {day:02d} Solution ---")
+        if outcome.status == TIMEOUT:
+            print(f"TIMEOUT after {timeout}s\n")
+        elif outcome.status == OOM:
+            print(f"OOM above {max_memory_mib} MiB\n" if max_memory_mib else "OOM\n")
+        else:
+            print(outcome.status, outcome.value, sep="\n", end="\n\n")
+
+    solutions._write_timings(timings)
+
+    return outcomes
@@ -2,14 +2,26 @@
 Solutions to the Advent of Code problems.
 """
 
+from __future__ import annotations
+
+import contextlib
 import datetime
+import functools
 import importlib
+import io
+import json
 import os
 import pathlib
+import time
 import types
-from typing import Callable
+from typing import Any, Callable
+
+import advent_of_code.registry as registry
+from advent_of_code.cache import ANSWER_CACHE, answer_key
+from advent_of_code.constants import CACHE, ROOT
+from advent_of_code.utils.inputs import MappedInput
 
-from advent_of_code.constants import ROOT
+TIMINGS = CACHE / "timings.json"
 
 
 class Solution:
@@ -19,50 +31,317 @@ class Solution:
 
     Expects there to be a module called ``day_i`` with ``i`` replaced by the
     day number which exposes a ``solution`` function.
+
+    The module can also expose ``part_one`` and ``part_two`` functions so that
+    each part can be solved on its own. These take the output of the module's
+    ``parse`` function if it has one, and the input text otherwise. When both
+    parts are solved, the input is only parsed once and both parts are given
+    the same parsed input, so ``parse`` should return read-only data (see
+    ``advent_of_code.utils.freeze``) that each part builds its own model from.
     """
 
     day: int
     year: int
     path: pathlib.Path
-    module: types.ModuleType
-    solution: Callable
 
     def __init__(self, day: int, year: int):
         self.day = day
         self.year = year
         self.path = ROOT / f"year_{year}/day_{day:02d}"
-        self.module = importlib.import_module(
-            str("advent_of_code" / self.path.relative_to(ROOT)).replace(os.sep, "."),
-            str(ROOT),
-        )
-        self.solution = getattr(self.module, "solution")
+
+    @functools.cached_property
+    def module(self) -> types.ModuleType:
+        """
+        The day's package.
+
+        This is only imported when it's first needed, so a ``Solution`` whose
+        answers come from the answer cache never imports it.
+        """
+        return importlib.import_module(registry.module_name(self.year, self.day))
+
+    @property
+    def solution(self) -> Callable:
+        return getattr(self.module, "solution")
+
+    @property
+    def parse(self) -> Callable:
+        return getattr(self.module, "parse", lambda input_: input_)
+
+    @property
+    def parts(self) -> dict[int, Callable]:
+        return {
+            part: getattr(self.module, name)
+            for part, name in [(1, "part_one"), (2, "part_two")]
+            if hasattr(self.module, name)
+        }
+
+    @property
+    def input_file(self) -> pathlib.Path:
+        return self.path / "input.data"
 
     def read_input(self) -> str:
         """
         Open the input file and return its contents.
         """
-        return (self.path / "input.data").read_text().strip()
+        return self.input_file.read_text().strip()
 
-    def print_solution(self) -> None:
+    def open_input(self) -> contextlib.AbstractContextManager[str | MappedInput]:
+        """
+        Open the input file for solving the day's problem.
+
+        Days that set ``STREAMING_INPUT = True`` are given the memory-mapped
+        file, and all other days are given its contents.
+        """
+        if getattr(self.module, "STREAMING_INPUT", False):
+            return MappedInput(self.input_file)
+
+        return contextlib.nullcontext(self.read_input())
+
+    @functools.cached_property
+    def cache_key(self) -> str:
+        """
+        The key for the day's answers in the answer cache.
+        """
+        return answer_key(self.input_file, self.path)
+
+    def is_cached(self, part: int | None = None) -> bool:
+        """
+        Whether the answers for the part (or both parts) are in the answer
+        cache.
+        """
+        return self._part_cache_key(part) in ANSWER_CACHE
+
+    def _part_cache_key(self, part: int | None) -> str:
+        return self.cache_key if part is None else f"{self.cache_key}-part-{part}"
+
+    def solve_part(self, part: int, input_: str | MappedInput) -> Any:
+        """
+        Solve a single part of the day's problem.
+
+        Modules that only expose a ``solution`` function have to solve both
+        parts to get the answer to one of them.
+        """
+        if part not in {1, 2}:
+            raise ValueError(f"Bad `part` value. Must be 1 or 2, found {part}.")
+
+        if part in self.parts:
+            return self.parts[part](self.parse(input_))
+
+        return self.solution(input_=input_)[part - 1]
+
+    def solve(self, part: int | None = None, use_cache: bool = False) -> Any:
+        """
+        Solve the day's problem, either just the ``part`` or both parts.
+
+        Set ``use_cache`` to return the cached answers when neither the input
+        nor the source code has changed since they were cached.
+        """
+        if use_cache:
+            with contextlib.suppress(KeyError):
+                return ANSWER_CACHE[self._part_cache_key(part)]
+
+        with self.open_input() as input_:
+            if part is not None:
+                answers = self.solve_part(part, input_)
+            elif len(self.parts) == 2:
+                parsed = self.parse(input_)
+                answers = [self.parts[1](parsed), self.parts[2](parsed)]
+            else:
+                answers = self.solution(input_=input_)
+
+        if use_cache:
+            ANSWER_CACHE[self._part_cache_key(part)] = answers
+
+        return answers
+
+    def print_solution(self, part: int | None = None, use_cache: bool = False) -> None:
         """
         Print the day's solution!
         """
         print(f"--- Year {self.year} Day {self.day:02d} Solution ---")
-        print(self.solution(input_=self.read_input()), "\n", sep="")
+        print(self.solve(part=part, use_cache=use_cache), "\n", sep="")
+
+
+def _read_timings() -> dict[str, float]:
+    """
+    Read the run times (in seconds) of the previous runs, keyed by
+    ``year-day``.
+    """
+    try:
+        return json.loads(TIMINGS.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_timings(timings: dict[str, float]) -> None:
+    """
+    Merge the run times into the ones saved from the previous runs.
+    """
+    TIMINGS.parent.mkdir(parents=True, exist_ok=True)
+    TIMINGS.write_text(json.dumps(_read_timings() | timings, indent=2))
+
+
+def _solve(
+    year: int,
+    day: int,
+    part: int | None,
+    use_cache: bool,
+) -> tuple[Any, str, float | None]:
+    """
+    Solve the day's problem, capturing anything that it prints.
+
+    The run time is ``None`` when the answers came from the cache.
+
+    This needs to be a module-level function so that it can be sent to the
+    worker processes.
+    """
+    solution = Solution(year=year, day=day)
+    cache_hit = use_cache and solution.is_cached(part)
+    stdout = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(stdout):
+        answers = solution.solve(part=part, use_cache=use_cache)
+
+    seconds = None if cache_hit else time.perf_counter() - start
+
+    return answers, stdout.getvalue(), seconds
+
+
+def _print_answers(year: int, day: int, answers: Any, stdout: str) -> None:
+    """
+    Print the day's solution in the same format as ``Solution.print_solution``.
+    """
+    print(f"--- Year {year} Day {day:02d} Solution ---")
+    print(stdout, end="")
+    print(answers, "\n", sep="")
+
+
+def _print_error(year: int, day: int, error: Exception) -> None:
+    """
+    Print the error that the day's solution raised in place of its answers,
+    in the same format as ``sandbox.print_solutions_in_sandbox``.
+    """
+    import traceback
+
+    print(f"--- Year {year} Day {day:02d} Solution ---")
+    print("ERROR", "".join(traceback.format_exception(error)), sep="\n")
+
+
+def print_solutions_in_parallel(
+    days: list[tuple[int, int]],
+    part: int | None = None,
+    use_cache: bool = False,
+) -> None:
+    """
+    Print the solutions for the ``(year, day)`` pairs, solving each day in its
+    own process.
+
+    The days that were slowest in previous runs are started first (with days
+    that have never been timed counting as the slowest) so that the total run
+    time is close to the run time of the slowest day. The solutions are still
+    printed in order, each one as soon as it and all the days before it have
+    finished. A day that fails is reported in place of its answers, and the
+    rest of the days are still solved.
+    """
+    if not days:
+        return  # There's nothing to solve, and a pool needs at least 1 worker
+
+    # Only imported when it's needed since it's slow to import, and most runs
+    # are for a single day
+    import concurrent.futures
+
+    timings = _read_timings()
+    schedule = sorted(
+        days,
+        key=lambda year_day: timings.get(f"{year_day[0]}-{year_day[1]}", float("inf")),
+        reverse=True,
+    )
+    results: dict[tuple[int, int], tuple[Any, str, float | None] | Exception] = {}
+    next_to_print = 0
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(len(days), os.cpu_count() or 1)
+    ) as executor:
+        futures = {
+            executor.submit(_solve, year, day, part, use_cache): (year, day)
+            for year, day in schedule
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as error:  # Reported in place of the answers
+                results[futures[future]] = error
+            while next_to_print < len(days) and days[next_to_print] in results:
+                year, day = days[next_to_print]
+                result = results[(year, day)]
+                if isinstance(result, Exception):
+                    _print_error(year, day, result)
+                else:
+                    answers, stdout, _ = result
+                    _print_answers(year, day, answers, stdout)
+                next_to_print += 1
+
+    _write_timings(
+        {
+            f"{year}-{day}": result[2]
+            for (year, day), result in results.items()
+            if not isinstance(result, Exception) and result[2] is not None
+        }
+    )
+
+
+def get_days(
+    print_all: bool,
+    year: int | list[int],
+    print_day: int = None,
+) -> list[tuple[int, int]]:
+    """
+    Return the ``(year, day)`` pairs to solve.
+
+    This is just the day (defaulting to today) for each year, or every day up
+    to and including it if ``print_all`` is set. Only the days that have a
+    solution are included in the latter case.
+    """
+    day_today = print_day or datetime.date.today().day
+    years = [year] if isinstance(year, int) else year
+    if not print_all:
+        return [(year_, day_today) for year_ in years]
+
+    return [
+        year_day
+        for year_ in years
+        for year_day in registry.find_days(year_)
+        if year_day[1] <= day_today
+    ]
 
 
 def print_solutions(
     print_all: bool,
-    year: int,
+    year: int | list[int],
     print_day: int = None,
+    parallel: bool = False,
+    use_cache: bool = True,
+    part: int | None = None,
 ) -> None:
     """
-    Print the solutions.
+    Print the solutions, either just the ``part`` or both parts.
+
+    Set ``parallel`` to solve the days in a process pool rather than one after
+    another, and unset ``use_cache`` to recompute answers that are already in
+    the answer cache.
     """
-    day_today = print_day or datetime.date.today().day
+    days = get_days(print_all=print_all, year=year, print_day=print_day)
+
+    if parallel:
+        print_solutions_in_parallel(days, part=part, use_cache=use_cache)
+        return
 
-    if print_all:
-        for i in range(day_today):
-            Solution(year=year, day=i + 1).print_solution()
-    else:
-        Solution(year=year, day=day_today).print_solution()
+    timings = {}
+    for year_, day in days:
+        solution = Solution(year=year_, day=day)
+        cache_hit = use_cache and solution.is_cached(part)
+        start = time.perf_counter()
+        solution.print_solution(part=part, use_cache=use_cache)
+        if not cache_hit:
+            timings[f"{year_}-{day}"] = time.perf_counter() - start
+    _write_timings(timings)
@@ -4,8 +4,14 @@ Utilities to use throughout the Advent of Code solutions.
 
 from advent_of_code.constants import ROOT
 from advent_of_code.utils.daily_files import create_files
+from advent_of_code.utils.immutable import freeze
+from advent_of_code.utils.inputs import MappedInput, iter_blocks, iter_lines
 
 __all__ = [
     "ROOT",
+    "MappedInput",
     "create_files",
+    "freeze",
+    "iter_blocks",
+    "iter_lines",
 ]
@@ -4,8 +4,15 @@ Classes representing objects from geometry.
 
 from __future__ import annotations
 
+import array
 import itertools
-from typing import Any
+import operator
+from typing import Any, Iterable, Iterator
+
+from advent_of_code.utils.parsing import integers
+
+_new = tuple.__new__  # Looked up once, since creating positions is so common
+_TYPECODE = "q"  # Signed 64-bit integers
 
 
 def _intify(value: float) -> float | int:
@@ -22,9 +29,23 @@ class Position(tuple):
     - https://docs.python.org/3/library/collections.abc.html
     """
 
+    __slots__ = ()
+
     def __new__(cls, *args):
+        # Plain positions get the fixed-arity classes below, which do the same
+        # arithmetic without the per-coordinate work
+        if cls is Position:
+            if len(args) == 2:
+                return _new(Position2D, args)
+            if len(args) == 3:
+                return _new(Position3D, args)
+
         return super().__new__(cls, args)
 
+    def __getnewargs__(self):
+        # Copies and pickles call ``__new__`` with these arguments
+        return tuple(self)
+
     def __str__(self):
         return super().__str__()
 
@@ -54,7 +75,7 @@ class Position(tuple):
         )
 
     def __rsub__(self, other: Position | tuple[int,]):
-        return self.__sub__(other)
+        return Position.from_tuple(other).__sub__(self)
 
     def __isub__(self, other: Position | tuple[int,]):
         return self.__sub__(other)
@@ -111,7 +132,115 @@ class Position(tuple):
         """
         Construct a Position from text, such as ``123,4``.
         """
-        return cls.from_tuple(eval(f"({text})"))
+        return cls.from_tuple(integers(text))
+
+
+class Position2D(Position):
+    """
+    A position on a 2-dimensional plane of integers.
+
+    ``Position(x, y)`` returns one of these. The arithmetic works on the 2
+    coordinates directly, so it's several times faster than the generic
+    ``Position`` arithmetic, which matters since it's the innermost
+    operation of the grid puzzles.
+    """
+
+    __slots__ = ()
+
+    x = property(operator.itemgetter(0))
+    y = property(operator.itemgetter(1))
+
+    def __new__(cls, x: int, y: int):
+        return _new(cls, (x, y))
+
+    def __add__(self, other: Position | tuple[int,]):
+        try:
+            x, y = other
+        except ValueError:  # Other dimensions
+            return super().__add__(other)
+
+        return _new(type(self), (self[0] + x, self[1] + y))
+
+    def __sub__(self, other: Position | tuple[int,]):
+        try:
+            x, y = other
+        except ValueError:
+            return super().__sub__(other)
+
+        return _new(type(self), (self[0] - x, self[1] - y))
+
+    def __rsub__(self, other: Position | tuple[int,]):
+        try:
+            x, y = other
+        except ValueError:
+            return super().__rsub__(other)
+
+        return _new(type(self), (x - self[0], y - self[1]))
+
+    def __mul__(self, other: int):
+        if not isinstance(other, int):
+            raise ValueError(
+                f"Can't multiply a Position by an object of type {type(other)}"
+            )
+
+        return _new(type(self), (self[0] * other, self[1] * other))
+
+    __radd__ = __iadd__ = __add__
+    __isub__ = __sub__
+    __rmul__ = __imul__ = __mul__
+
+
+class Position3D(Position):
+    """
+    A position in a 3-dimensional space of integers.
+
+    ``Position(x, y, z)`` returns one of these. See ``Position2D``.
+    """
+
+    __slots__ = ()
+
+    x = property(operator.itemgetter(0))
+    y = property(operator.itemgetter(1))
+    z = property(operator.itemgetter(2))
+
+    def __new__(cls, x: int, y: int, z: int):
+        return _new(cls, (x, y, z))
+
+    def __add__(self, other: Position | tuple[int,]):
+        try:
+            x, y, z = other
+        except ValueError:
+            return super().__add__(other)
+
+        return _new(type(self), (self[0] + x, self[1] + y, self[2] + z))
+
+    def __sub__(self, other: Position | tuple[int,]):
+        try:
+            x, y, z = other
+        except ValueError:
+            return super().__sub__(other)
+
+        return _new(type(self), (self[0] - x, self[1] - y, self[2] - z))
+
+    def __rsub__(self, other: Position | tuple[int,]):
+        try:
+            x, y, z = other
+        except ValueError:
+            return super().__rsub__(other)
+
+        return _new(type(self), (x - self[0], y - self[1], z - self[2]))
+
+    def __mul__(self, other: int):
+        if not isinstance(other, int):
+            raise ValueError(
+                f"Can't multiply a Position by an object of type {type(other)}"
+            )
+
+        return _new(type(self), (self[0] * other, self[1] * other, self[2] * other))
+
+    __radd__ = __iadd__ = __add__
+    __isub__ = __sub__
+    __rmul__ = __imul__ = __mul__
 
 
 def manhattan_distance(x: Position, y: Position) -> int:
@@ -130,13 +259,343 @@ class Area:
         self.position_1 = position_1
         self.position_2 = position_2
 
+    def __repr__(self):
+        return f"Area({self.position_1}, {self.position_2})"
+
+    def __eq__(self, other: Area):
+        if not isinstance(other, Area):
+            return NotImplemented
+
+        return self.bounds == other.bounds
+
     def __iter__(self):
+        min_x, min_y, max_x, max_y = self.bounds
+
+        for y, x in itertools.product(range(min_y, max_y + 1), range(min_x, max_x + 1)):
+            yield Position(x, y)
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        min_x, min_y, max_x, max_y = self.bounds
+        x, y = position
+
+        return min_x <= x <= max_x and min_y <= y <= max_y
+
+    @classmethod
+    def from_bounds(cls, min_x: int, min_y: int, max_x: int, max_y: int) -> Area:
+        """
+        Construct an Area from its ``(min_x, min_y, max_x, max_y)``.
+        """
+        return cls(Position2D(min_x, min_y), Position2D(max_x, max_y))
+
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        """
+        The ``(min_x, min_y, max_x, max_y)`` of the area, whichever corners it
+        was created from.
+        """
         p1x, p1y = self.position_1
         p2x, p2y = self.position_2
-        if p1x > p2x:
-            p1x, p2x = p2x, p1x
-        if p1y > p2y:
-            p1y, p2y = p2y, p1y
 
-        for y, x in itertools.product(range(1 + p2y - p1y), range(1 + p2x - p1x)):
-            yield Position(p1x + x, p1y + y)
+        return min(p1x, p2x), min(p1y, p2y), max(p1x, p2x), max(p1y, p2y)
+
+    @property
+    def width(self) -> int:
+        """
+        The number of columns in the area.
+        """
+        return abs(self.position_1[0] - self.position_2[0]) + 1
+
+    @property
+    def height(self) -> int:
+        """
+        The number of rows in the area.
+        """
+        return abs(self.position_1[1] - self.position_2[1]) + 1
+
+    @property
+    def size(self) -> int:
+        """
+        The number of positions in the area.
+        """
+        return self.width * self.height
+
+    def intersection(self, other: Area) -> Area | None:
+        """
+        Return the area covered by both areas, or ``None`` if they don't
+        overlap.
+        """
+        min_x, min_y, max_x, max_y = self.bounds
+        other_min_x, other_min_y, other_max_x, other_max_y = other.bounds
+        min_x, min_y = max(min_x, other_min_x), max(min_y, other_min_y)
+        max_x, max_y = min(max_x, other_max_x), min(max_y, other_max_y)
+        if min_x > max_x or min_y > max_y:
+            return None
+
+        return Area.from_bounds(min_x, min_y, max_x, max_y)
+
+    def union(self, other: Area) -> Area:
+        """
+        Return the smallest area that covers both areas.
+        """
+        min_x, min_y, max_x, max_y = self.bounds
+        other_min_x, other_min_y, other_max_x, other_max_y = other.bounds
+
+        return Area.from_bounds(
+            min(min_x, other_min_x),
+            min(min_y, other_min_y),
+            max(max_x, other_max_x),
+            max(max_y, other_max_y),
+        )
+
+    def clip(self, position: tuple[int, int]) -> Position2D:
+        """
+        Return the position in the area that is closest to the position, which
+        is the position itself if it's in the area.
+        """
+        min_x, min_y, max_x, max_y = self.bounds
+        x, y = position
+
+        return Position2D(min(max(x, min_x), max_x), min(max(y, min_y), max_y))
+
+    def to_array(self) -> PositionArray:
+        """
+        Return the positions in the area as a ``PositionArray``, in the same
+        order as iterating over the area.
+        """
+        min_x, min_y, max_x, max_y = self.bounds
+        width = max_x - min_x + 1
+
+        return PositionArray(
+            array.array(_TYPECODE, range(min_x, max_x + 1)) * (max_y - min_y + 1),
+            itertools.chain.from_iterable(
+                map(itertools.repeat, range(min_y, max_y + 1), itertools.repeat(width))
+            ),
+        )
+
+
+class BoundsTracker:
+    """
+    The bounds of a growing set of positions.
+
+    Adding a position only compares it with the current bounds, so keeping
+    track of the bounds costs constant time per position rather than a scan
+    over all the positions each time the bounds are needed.
+    """
+
+    min_x: int | None
+    min_y: int | None
+    max_x: int | None
+    max_y: int | None
+
+    def __init__(self, positions: Iterable[tuple[int, int]] = ()):
+        self.min_x = self.min_y = self.max_x = self.max_y = None
+        self.update(positions)
+
+    def __repr__(self):
+        return f"BoundsTracker({self.min_x}, {self.min_y}, {self.max_x}, {self.max_y})"
+
+    def __bool__(self):
+        return self.min_x is not None
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        if self.min_x is None:
+            return False
+
+        x, y = position
+
+        return self.min_x <= x <= self.max_x and self.min_y <= y <= self.max_y
+
+    def add(self, position: tuple[int, int]) -> None:
+        """
+        Grow the bounds, if needed, to cover the position.
+        """
+        x, y = position
+        if self.min_x is None:
+            self.min_x = self.max_x = x
+            self.min_y = self.max_y = y
+            return
+
+        if x < self.min_x:
+            self.min_x = x
+        elif x > self.max_x:
+            self.max_x = x
+        if y < self.min_y:
+            self.min_y = y
+        elif y > self.max_y:
+            self.max_y = y
+
+    def update(self, positions: Iterable[tuple[int, int]]) -> None:
+        """
+        Grow the bounds, if needed, to cover all the positions.
+        """
+        for position in positions:
+            self.add(position)
+
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        """
+        The ``(min_x, min_y, max_x, max_y)`` of the positions added so far.
+        """
+        if self.min_x is None:
+            raise ValueError("No positions have been added to the tracker")
+
+        return self.min_x, self.min_y, self.max_x, self.max_y
+
+    @property
+    def area(self) -> Area:
+        """
+        The smallest area that covers the positions added so far.
+        """
+        return Area.from_bounds(*self.bounds)
+
+
+class PositionArray:
+    """
+    Many positions on a 2-dimensional plane of integers, stored as a column of
+    64-bit x values and a column of 64-bit y values.
+
+    The operations on the whole array are built from ``map`` and the
+    ``operator`` and ``itertools`` functions, so the loops over the positions
+    run in C rather than in the interpreter. They return new arrays (of
+    positions or of values, one per position), so that they can be chained::
+
+        grid = Area(Position(0, 0), Position(9, 9)).to_array()
+        distances = grid.manhattan_distance((4, 4))
+        nearby = grid[map(operator.le, distances, itertools.repeat(3))]
+    """
+
+    xs: array.array
+    ys: array.array
+
+    def __init__(self, xs: Iterable[int] = (), ys: Iterable[int] = ()):
+        self.xs = array.array(_TYPECODE, xs)
+        self.ys = array.array(_TYPECODE, ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError(
+                f"Need as many x values as y values, found {len(self.xs)} and"
+                f" {len(self.ys)}"
+            )
+
+    def __repr__(self):
+        return f"PositionArray({list(self)})"
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __iter__(self) -> Iterator[Position2D]:
+        return map(Position2D, self.xs, self.ys)
+
+    def __eq__(self, other: PositionArray):
+        if not isinstance(other, PositionArray):
+            return NotImplemented
+
+        return self.xs == other.xs and self.ys == other.ys
+
+    def __getitem__(self, index_: int | Iterable[bool]) -> Position2D | PositionArray:
+        """
+        Return the position at the index, or the positions where a boolean mask
+        (with one value per position) is true.
+        """
+        if isinstance(index_, int):
+            return Position2D(self.xs[index_], self.ys[index_])
+
+        mask = list(index_)
+        if len(mask) != len(self):
+            raise IndexError(f"Mask has {len(mask)} values for {len(self)} positions")
+
+        return PositionArray(
+            itertools.compress(self.xs, mask), itertools.compress(self.ys, mask)
+        )
+
+    def _columns(
+        self, other: tuple[int, int] | PositionArray
+    ) -> tuple[Iterable, Iterable]:
+        """
+        Return the x and y values of the other positions to line up with the
+        positions in this array, broadcasting a single position to all of them.
+        """
+        if isinstance(other, PositionArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    f"Can't line up {len(other)} positions with {len(self)}"
+                )
+            return other.xs, other.ys
+
+        x, y = other
+        return itertools.repeat(x, len(self)), itertools.repeat(y, len(self))
+
+    def __add__(self, other: tuple[int, int] | PositionArray) -> PositionArray:
+        other_xs, other_ys = self._columns(other)
+
+        return PositionArray(
+            map(operator.add, self.xs, other_xs), map(operator.add, self.ys, other_ys)
+        )
+
+    def __sub__(self, other: tuple[int, int] | PositionArray) -> PositionArray:
+        other_xs, other_ys = self._columns(other)
+
+        return PositionArray(
+            map(operator.sub, self.xs, other_xs), map(operator.sub, self.ys, other_ys)
+        )
+
+    def _absolute_differences(
+        self, other: tuple[int, int] | PositionArray
+    ) -> tuple[Iterator[int], Iterator[int]]:
+        other_xs, other_ys = self._columns(other)
+
+        return (
+            map(abs, map(operator.sub, self.xs, other_xs)),
+            map(abs, map(operator.sub, self.ys, other_ys)),
+        )
+
+    def manhattan_distance(self, other: tuple[int, int] | PositionArray) -> array.array:
+        """
+        Return the Manhattan distance from each position to a position, or to
+        the position at the same index of another array.
+        """
+        return array.array(
+            _TYPECODE, map(operator.add, *self._absolute_differences(other))
+        )
+
+    def chebyshev_distance(self, other: tuple[int, int] | PositionArray) -> array.array:
+        """
+        Return the Chebyshev distance from each position to a position, or to
+        the position at the same index of another array.
+        """
+        return array.array(_TYPECODE, map(max, *self._absolute_differences(other)))
+
+    def bounding_box(self) -> Area:
+        """
+        Return the smallest area that contains all the positions.
+        """
+        if not self:
+            raise ValueError("An empty array has no bounding box")
+
+        return Area(
+            Position2D(min(self.xs), min(self.ys)),
+            Position2D(max(self.xs), max(self.ys)),
+        )
+
+    def unique(self) -> PositionArray:
+        """
+        Return the distinct positions, sorted by their x and then y values.
+        """
+        positions = sorted(set(zip(self.xs, self.ys)))
+
+        return PositionArray(
+            map(operator.itemgetter(0), positions),
+            map(operator.itemgetter(1), positions),
+        )
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[tuple[int, int]]) -> PositionArray:
+        """
+        Construct a PositionArray from positions, such as a list of
+        ``Position`` objects.
+        """
+        xs, ys = array.array(_TYPECODE), array.array(_TYPECODE)
+        for x, y in positions:
+            xs.append(x)
+            ys.append(y)
+
+        return cls(xs, ys)
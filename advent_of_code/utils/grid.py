@@ -0,0 +1,145 @@
+"""
+Rectangular grids of characters, such as the maps in many of the puzzles.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+from advent_of_code.utils.geometry import Position2D
+
+# The (x, y) steps to the neighbours of a cell, where y counts down the rows
+NEIGHBOURS_4 = ((0, -1), (-1, 0), (1, 0), (0, 1))
+NEIGHBOURS_8 = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+class Grid:
+    """
+    A rectangular grid of single-byte characters, stored row by row in a flat
+    ``bytearray``.
+
+    A cell can be addressed by its ``(x, y)`` position, where ``x`` counts
+    from the left and ``y`` counts down from the top row (the order of the
+    lines in the text), or by its index in ``cells``, which is
+    ``y * width + x``. Stepping to a neighbour is just adding one of the
+    ``offsets_4`` or ``offsets_8`` to an index, but only ``neighbours`` checks
+    that the step doesn't wrap around the edges of the grid.
+    """
+
+    width: int
+    height: int
+    cells: bytearray
+    offsets_4: tuple[int, ...]
+    offsets_8: tuple[int, ...]
+
+    def __init__(self, cells: bytes | bytearray, width: int):
+        if width < 1 or len(cells) % width:
+            raise ValueError(f"Can't split {len(cells)} cells into rows of {width}")
+
+        self.cells = bytearray(cells)
+        self.width = width
+        self.height = len(cells) // width
+        self.offsets_4 = tuple(dy * width + dx for dx, dy in NEIGHBOURS_4)
+        self.offsets_8 = tuple(dy * width + dx for dx, dy in NEIGHBOURS_8)
+
+    def __str__(self):
+        return "\n".join(self.row(y).tobytes().decode() for y in range(self.height))
+
+    def __repr__(self):
+        return f"Grid(width={self.width}, height={self.height})"
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        x, y = position
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __getitem__(self, position: tuple[int, int]) -> str:
+        if position not in self:
+            raise IndexError(f"Position {position} is outside the grid")
+
+        return chr(self.cells[position[1] * self.width + position[0]])
+
+    def __setitem__(self, position: tuple[int, int], value: str) -> None:
+        if position not in self:
+            raise IndexError(f"Position {position} is outside the grid")
+
+        self.cells[position[1] * self.width + position[0]] = ord(value)
+
+    def get(self, position: tuple[int, int], default: str | None = None) -> str | None:
+        """
+        Return the character at the position, or the default if the position is
+        outside the grid.
+        """
+        return self[position] if position in self else default
+
+    def index(self, position: tuple[int, int]) -> int:
+        """
+        Return the index of the cell at the position.
+        """
+        return position[1] * self.width + position[0]
+
+    def position(self, index_: int) -> Position2D:
+        """
+        Return the ``(x, y)`` position of the cell at the index.
+        """
+        y, x = divmod(index_, self.width)
+        return Position2D(x, y)
+
+    def neighbours(self, index_: int, diagonal: bool = False) -> list[int]:
+        """
+        Return the indices of the (4, or 8 with ``diagonal``) neighbours of the
+        cell at the index that are inside the grid.
+        """
+        width = self.width
+        x = index_ % width
+        offsets = self.offsets_8 if diagonal else self.offsets_4
+        if 0 < x < width - 1 and width <= index_ < len(self.cells) - width:
+            return [index_ + offset for offset in offsets]
+
+        y = index_ // width
+        steps = NEIGHBOURS_8 if diagonal else NEIGHBOURS_4
+        return [
+            index_ + offset
+            for offset, (dx, dy) in zip(offsets, steps)
+            if 0 <= x + dx < width and 0 <= y + dy < self.height
+        ]
+
+    def row(self, y: int) -> memoryview:
+        """
+        Return a view of the cells in the row.
+        """
+        return memoryview(self.cells)[y * self.width : (y + 1) * self.width]
+
+    def column(self, x: int) -> memoryview:
+        """
+        Return a view of the cells in the column.
+        """
+        return memoryview(self.cells)[x :: self.width]
+
+    def find_all(self, character: str) -> Iterator[int]:
+        """
+        Yield the indices of the cells with the character, in order.
+        """
+        byte = ord(character)
+        index_ = self.cells.find(byte)
+        while index_ != -1:
+            yield index_
+            index_ = self.cells.find(byte, index_ + 1)
+
+    @classmethod
+    def from_text(cls, text: str) -> Grid:
+        """
+        Parse lines of text, which must all be the same length, into a grid.
+        """
+        data = text.encode().replace(b"\r", b"")
+        width = data.find(b"\n")
+        if width == -1:
+            width = len(data)
+
+        cells = data.replace(b"\n", b"")
+        if len(cells) != width * (data.count(b"\n") + 1):
+            raise ValueError("The lines of a grid must all be the same length")
+
+        return cls(cells, width)
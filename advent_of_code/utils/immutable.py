@@ -0,0 +1,30 @@
+"""
+Read-only views of data, so that it can be shared without being copied.
+"""
+
+from __future__ import annotations
+
+import types
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return a read-only version of the value.
+
+    Dictionaries become mapping proxies, lists become tuples, and sets become
+    frozensets, recursively. Anything else (including tuples and their
+    subclasses, such as ``Position``) is returned as-is.
+
+    This is for the output of a day's ``parse`` function: both parts are given
+    the same parsed input, so neither part can be allowed to change it.
+    """
+    match value:
+        case dict():
+            return types.MappingProxyType({k: freeze(v) for k, v in value.items()})
+        case list():
+            return tuple(freeze(item) for item in value)
+        case set():
+            return frozenset(value)
+        case _:
+            return value
@@ -0,0 +1,110 @@
+"""
+Lazy access to the input files, for inputs that are too big to read in one go.
+
+Days opt in by setting ``STREAMING_INPUT = True`` in their package, in which
+case they are given a ``MappedInput`` rather than the input text. The
+``iter_lines`` and ``iter_blocks`` functions work with either, so the same
+solution can still be run against the text of the sample files.
+"""
+
+from __future__ import annotations
+
+import mmap
+import pathlib
+from typing import Iterator
+
+
+class MappedInput:
+    """
+    An input file that is memory-mapped rather than read into memory.
+
+    This should be closed when it's no longer needed (or used as a context
+    manager), and any ``buffer`` taken from it must be released first.
+    """
+
+    path: pathlib.Path
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files can't be mapped
+            self._mmap = None
+
+    def __repr__(self):
+        return f"MappedInput(path={self.path})"
+
+    def __enter__(self) -> MappedInput:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self):
+        return len(self._mmap) if self._mmap else 0
+
+    @property
+    def buffer(self) -> memoryview:
+        """
+        A read-only, zero-copy view of the bytes in the file.
+        """
+        return memoryview(self._mmap if self._mmap else b"")
+
+    def close(self) -> None:
+        """
+        Unmap and close the file.
+        """
+        if self._mmap:
+            self._mmap.close()
+        self._file.close()
+
+    def lines(self) -> Iterator[str]:
+        """
+        Yield the lines in the file, without their line endings.
+        """
+        data = self._mmap if self._mmap else b""
+        start = 0
+        while start < len(data):
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = len(data)
+            yield data[start:end].rstrip(b"\r").decode()
+            start = end + 1
+
+
+def _text_lines(text: str) -> Iterator[str]:
+    """
+    Yield the lines in the text without splitting it all at once.
+    """
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        yield text[start:end].rstrip("\r")
+        start = end + 1
+
+
+def iter_lines(input_: str | MappedInput) -> Iterator[str]:
+    """
+    Yield the lines in the input, one at a time.
+    """
+    return input_.lines() if isinstance(input_, MappedInput) else _text_lines(input_)
+
+
+def iter_blocks(input_: str | MappedInput) -> Iterator[list[str]]:
+    """
+    Yield the blocks of lines in the input that are separated by blank lines,
+    one block at a time.
+    """
+    block = []
+    for line in iter_lines(input_):
+        if line:
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+
+    if block:
+        yield block
@@ -0,0 +1,290 @@
+"""
+Sets of integers stored as sorted, disjoint intervals.
+"""
+
+from __future__ import annotations
+
+import array
+import bisect
+from typing import Any, Callable, Iterable, Iterator
+
+_TYPECODE = "q"  # Signed 64-bit integers, as in ``geometry``
+
+
+class IntervalSet:
+    """
+    A set of integers, stored as the sorted, disjoint, half-open intervals
+    ``[start, end)`` that cover them.
+
+    The starts and ends are kept in two sorted arrays, so the operations take
+    time proportional to the number of intervals rather than the number of
+    integers that they cover::
+
+        >>> sections = IntervalSet([(2, 5), (4, 9), (12, 13)])
+        >>> sections
+        IntervalSet([(2, 9), (12, 13)])
+        >>> sections.length
+        8
+        >>> 7 in sections
+        True
+    """
+
+    starts: array.array
+    ends: array.array
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()):
+        self.starts = array.array(_TYPECODE)
+        self.ends = array.array(_TYPECODE)
+        for start, end in sorted(intervals):
+            if start >= end:
+                continue
+            if self.ends and start <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __repr__(self):
+        return f"IntervalSet({list(self)})"
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __bool__(self):
+        return bool(self.starts)
+
+    def __eq__(self, other: IntervalSet):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __contains__(self, point: int) -> bool:
+        index_ = bisect.bisect_right(self.starts, point) - 1
+        return index_ >= 0 and point < self.ends[index_]
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        return self.union(other)
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        return self.intersection(other)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        return self.difference(other)
+
+    @classmethod
+    def _from_sorted(cls, starts: Iterable[int], ends: Iterable[int]) -> IntervalSet:
+        """
+        Construct an IntervalSet from starts and ends that are already sorted,
+        disjoint, and not touching.
+        """
+        interval_set = cls()
+        interval_set.starts.extend(starts)
+        interval_set.ends.extend(ends)
+
+        return interval_set
+
+    @property
+    def length(self) -> int:
+        """
+        The number of integers in the set.
+        """
+        return sum(self.ends) - sum(self.starts)
+
+    @property
+    def start(self) -> int:
+        """
+        The smallest integer in the set.
+        """
+        if not self:
+            raise ValueError("An empty interval set has no start")
+
+        return self.starts[0]
+
+    @property
+    def end(self) -> int:
+        """
+        One more than the largest integer in the set.
+        """
+        if not self:
+            raise ValueError("An empty interval set has no end")
+
+        return self.ends[-1]
+
+    def add(self, start: int, end: int) -> None:
+        """
+        Add the integers in ``[start, end)`` to the set, merging the intervals
+        that they overlap or touch.
+        """
+        if start >= end:
+            return
+
+        first = bisect.bisect_left(self.ends, start)
+        last = bisect.bisect_right(self.starts, end)
+        if first < last:
+            start = min(start, self.starts[first])
+            end = max(end, self.ends[last - 1])
+
+        self.starts[first:last] = array.array(_TYPECODE, [start])
+        self.ends[first:last] = array.array(_TYPECODE, [end])
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        """
+        Return the integers in either set.
+        """
+        return IntervalSet([*self, *other])
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        """
+        Return the integers in both sets.
+        """
+        starts, ends = [], []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+
+        return IntervalSet._from_sorted(starts, ends)
+
+    def difference(self, other: IntervalSet) -> IntervalSet:
+        """
+        Return the integers in this set that aren't in the other.
+        """
+        starts, ends = [], []
+        j = 0
+        for start, end in self:
+            # Skip the other's intervals that end before this one starts
+            while j < len(other.starts) and other.ends[j] <= start:
+                j += 1
+
+            k = j
+            while k < len(other.starts) and other.starts[k] < end:
+                if start < other.starts[k]:
+                    starts.append(start)
+                    ends.append(other.starts[k])
+                start = max(start, other.ends[k])
+                k += 1
+
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+
+        return IntervalSet._from_sorted(starts, ends)
+
+    def map_offsets(self, offsets: Iterable[tuple[int, int, int]]) -> IntervalSet:
+        """
+        Return the set with the integers in each ``[start, end)`` of the
+        offsets moved by its ``offset``, and every other integer left where it
+        is.
+
+        The ``(start, end, offset)`` pieces must not overlap each other, but
+        the integers can land anywhere, so the intervals of the result are
+        merged again.
+        """
+        pieces = sorted(offsets)
+        piece_ends = [end for _, end, _ in pieces]
+        intervals = []
+        for start, end in self:
+            index_ = bisect.bisect_right(piece_ends, start)
+            while start < end:
+                if index_ == len(pieces) or end <= pieces[index_][0]:
+                    intervals.append((start, end))  # No more pieces overlap
+                    break
+
+                piece_start, piece_end, offset = pieces[index_]
+                if start < piece_start:
+                    intervals.append((start, piece_start))  # The gap before
+                    start = piece_start
+
+                stop = min(end, piece_end)
+                intervals.append((start + offset, stop + offset))
+                start = stop
+                index_ += 1
+
+        return IntervalSet(intervals)
+
+
+class IntervalIndex:
+    """
+    A fixed collection of values, each with a half-open interval
+    ``[start, end)``, indexed to find the values whose intervals contain a
+    point.
+
+    The index is a segment tree over the sorted starts and ends. Each value is
+    kept in the ``O(log n)`` nodes that exactly cover its interval, so the
+    nodes on the path from the root to a point hold every value whose
+    interval contains the point, each exactly once. A query takes
+    ``O(log n + k)`` time for ``k`` values found::
+
+        >>> index_ = IntervalIndex([(0, 10, "a"), (5, 15, "b"), (20, 30, "c")])
+        >>> sorted(index_.containing(7))
+        ['a', 'b']
+        >>> index_.containing(15)
+        []
+
+    Each node's values are passed to ``bucket`` (``tuple`` by default) when the
+    index is built. A bucket can be another index, such as an ``IntervalIndex``
+    over a second axis, which is how the values within rectangles are found.
+    """
+
+    def __init__(
+        self,
+        intervals: Iterable[tuple[int, int, Any]],
+        bucket: Callable[[list], Any] = tuple,
+    ):
+        intervals = [interval for interval in intervals if interval[0] < interval[1]]
+        self._bounds = sorted(
+            {bound for start, end, _ in intervals for bound in (start, end)}
+        )
+        self._slots = max(len(self._bounds) - 1, 0)
+
+        # The leaves are the slots between consecutive bounds, from ``slots``
+        # to ``2 * slots - 1``, and node ``i`` is the parent of ``2i`` and
+        # ``2i + 1``. This works for any number of leaves, not just powers of 2
+        nodes = [[] for _ in range(2 * self._slots)]
+        for start, end, value in intervals:
+            low = bisect.bisect_left(self._bounds, start) + self._slots
+            high = bisect.bisect_left(self._bounds, end) + self._slots
+            while low < high:
+                if low & 1:
+                    nodes[low].append(value)
+                    low += 1
+                if high & 1:
+                    high -= 1
+                    nodes[high].append(value)
+                low >>= 1
+                high >>= 1
+
+        self._buckets = [bucket(values) if values else None for values in nodes]
+
+    def buckets(self, point: int) -> list[Any]:
+        """
+        Return the (non-empty) buckets of the nodes on the path to the point,
+        which between them hold each value whose interval contains the point
+        exactly once.
+        """
+        slot = bisect.bisect_right(self._bounds, point) - 1
+        if not 0 <= slot < self._slots:
+            return []
+
+        found = []
+        node = slot + self._slots
+        while node:
+            if self._buckets[node] is not None:
+                found.append(self._buckets[node])
+            node >>= 1
+
+        return found
+
+    def containing(self, point: int) -> list[Any]:
+        """
+        Return the values whose intervals contain the point.
+        """
+        return [value for bucket in self.buckets(point) for value in bucket]
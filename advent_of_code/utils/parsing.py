@@ -0,0 +1,89 @@
+"""
+Fast, safe helpers for the patterns that the puzzle inputs are written in.
+
+Each helper makes a single pass over the input with a precompiled regex (or
+a C-level string method), so parsing takes time linear in the size of the
+input and never compiles or evaluates anything per line.
+"""
+
+from __future__ import annotations
+
+import array
+import re
+
+_TYPECODE = "q"  # Signed 64-bit integers, as in ``geometry``
+
+_INTEGER = re.compile(r"-?\d+")
+_INTEGER_BYTES = re.compile(rb"-?\d+")
+_NATURAL = re.compile(r"\d+")
+_NATURAL_BYTES = re.compile(rb"\d+")
+_BLANK_LINES = re.compile(r"\r?\n(?:[ \t]*\r?\n)+")
+
+Text = str | bytes | bytearray | memoryview
+
+
+def integers(text: Text, signed: bool = True) -> list[int]:
+    """
+    Return all the integers in the text, in order.
+
+    The text can be a string or a buffer of ASCII bytes, such as the
+    contents of a file opened in binary mode or a row of a ``Grid``. When
+    ``signed`` is false, a ``-`` is read as a separator (as in ranges such as
+    ``2-4``) rather than as a minus sign.
+
+    >>> integers("Sensor at x=2, y=-18: closest beacon is at x=-2, y=15")
+    [2, -18, -2, 15]
+    >>> integers("2-4,6-8", signed=False)
+    [2, 4, 6, 8]
+    """
+    if isinstance(text, str):
+        pattern = _INTEGER if signed else _NATURAL
+    else:
+        pattern = _INTEGER_BYTES if signed else _NATURAL_BYTES
+
+    return list(map(int, pattern.findall(text)))
+
+
+def blocks(text: str) -> list[str]:
+    """
+    Split the text into the blocks between blank lines.
+
+    Lines of only spaces count as blank, and ``\\r\\n`` line endings are
+    allowed. Leading and trailing blank lines are dropped, but the
+    indentation of the lines inside each block is kept.
+    """
+    return [block for block in _BLANK_LINES.split(text.strip("\r\n")) if block]
+
+
+def coordinates(text: Text, dimensions: int = 2) -> list[tuple[int, ...]]:
+    """
+    Return the coordinates written in the text, such as ``498,4 -> 498,6``,
+    as tuples of ``dimensions`` integers.
+
+    Any characters other than the (signed) integers separate the
+    coordinates, so this works for comma, arrow, and ``x=1, y=2`` separated
+    lists alike.
+    """
+    values = integers(text)
+    if len(values) % dimensions:
+        raise ValueError(
+            f"Can't split {len(values)} integers into {dimensions}-d coordinates"
+        )
+
+    return list(zip(*[iter(values)] * dimensions))
+
+
+def coordinate_arrays(text: Text, dimensions: int = 2) -> tuple[array.array, ...]:
+    """
+    Return the coordinates written in the text as one array per axis, such as
+    the ``xs`` and ``ys`` of a ``PositionArray``.
+    """
+    values = integers(text)
+    if len(values) % dimensions:
+        raise ValueError(
+            f"Can't split {len(values)} integers into {dimensions}-d coordinates"
+        )
+
+    return tuple(
+        array.array(_TYPECODE, values[axis::dimensions]) for axis in range(dimensions)
+    )
@@ -0,0 +1,280 @@
+"""
+Searches over graphs, such as the cells of a ``Grid`` or an adjacency
+mapping.
+
+A graph can be given as:
+
+- a ``Grid``, whose nodes are the cell indices, with the 4 neighbours of
+  each cell as its edges (each costing 1)
+- a mapping from each node to its neighbours (for ``bfs``) or to a mapping of
+  its neighbours to the cost of the edge (for ``dijkstra`` and ``a_star``)
+- a function from a node to its neighbours (for ``bfs``) or to its
+  ``(neighbour, cost)`` pairs (for ``dijkstra`` and ``a_star``)
+
+When the nodes are the integers ``0`` to ``size - 1``, such as the cells of
+a ``Grid``, the visited nodes are kept in a packed ``Bitmap`` and the parents
+in an array. Otherwise, they're kept in a set and a dictionary.
+"""
+
+from __future__ import annotations
+
+import array
+import dataclasses
+import heapq
+import itertools
+import math
+from typing import Any, Callable, Hashable, Iterable, Mapping
+
+from advent_of_code.utils.grid import Grid
+
+Node = Hashable
+Graph = Grid | Mapping | Callable[[Any], Iterable]
+
+
+class Bitmap:
+    """
+    A set of the integers ``0`` to ``size - 1``, packed into one bit each.
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, size: int):
+        self.bits = bytearray((size + 7) >> 3)
+
+    def __contains__(self, integer: int) -> bool:
+        return bool(self.bits[integer >> 3] & (1 << (integer & 7)))
+
+    def add(self, integer: int) -> None:
+        """
+        Add the integer to the set.
+        """
+        self.bits[integer >> 3] |= 1 << (integer & 7)
+
+
+@dataclasses.dataclass
+class SearchResult:
+    """
+    The outcome of a search.
+
+    The ``goal`` is the node that the search stopped at, or ``None`` if the
+    search ran out of nodes first. The ``distances`` are the (best known)
+    distances from the nearest source to each node reached, and the
+    ``parents`` are the previous node on that route, where a source is its
+    own parent.
+    """
+
+    goal: Node | None
+    distances: dict[Node, float]
+    parents: array.array | dict[Node, Node]
+
+    @property
+    def distance(self) -> float | None:
+        """
+        The distance to the goal, if one was found.
+        """
+        return None if self.goal is None else self.distances[self.goal]
+
+    def path(self, node: Node | None = None) -> list[Node]:
+        """
+        Return the route from a source to the node (by default, the goal),
+        including both ends.
+        """
+        node = self.goal if node is None else node
+        if node is None or node not in self.distances:
+            raise ValueError(f"The node {node} wasn't reached by the search")
+
+        path = [node]
+        while (parent := self.parents[node]) != node:
+            path.append(parent)
+            node = parent
+
+        return path[::-1]
+
+
+def _visited_and_parents(size: int | None) -> tuple[Bitmap | set, array.array | dict]:
+    if size is None:
+        return set(), {}
+
+    return Bitmap(size), array.array("q", [-1]) * size
+
+
+def _neighbours(
+    graph: Graph, size: int | None
+) -> tuple[Callable[[Node], Iterable[Node]], int | None]:
+    """
+    Return the function from a node to its neighbours, and the number of
+    nodes if they're the integers ``0`` to ``size - 1``.
+    """
+    if isinstance(graph, Grid):
+        return graph.neighbours, len(graph) if size is None else size
+    if isinstance(graph, Mapping):
+        return lambda node: graph.get(node, ()), size
+
+    return graph, size
+
+
+def _weighted_neighbours(
+    graph: Graph, size: int | None, cost: Callable[[Node, Node], float] | None
+) -> tuple[Callable[[Node], Iterable[tuple[Node, float]]], int | None]:
+    """
+    Return the function from a node to its ``(neighbour, cost)`` pairs, and
+    the number of nodes if they're the integers ``0`` to ``size - 1``.
+
+    When ``cost`` is given, the graph is read as unweighted and each edge
+    costs ``cost(node, neighbour)``.
+    """
+    if cost is not None:
+        neighbours, size = _neighbours(graph, size)
+        return lambda node: [(n, cost(node, n)) for n in neighbours(node)], size
+    if isinstance(graph, Grid):
+        size = len(graph) if size is None else size
+        return lambda node: [(n, 1) for n in graph.neighbours(node)], size
+    if isinstance(graph, Mapping):
+        return lambda node: graph.get(node, {}).items(), size
+
+    return graph, size
+
+
+def multi_source_bfs(
+    graph: Graph,
+    sources: Iterable[Node],
+    is_goal: Callable[[Node], bool] | None = None,
+    size: int | None = None,
+) -> SearchResult:
+    """
+    Search outwards from all the sources at once, one step at a time, until a
+    node for which ``is_goal`` is true is reached.
+
+    Without ``is_goal``, every node that can be reached is visited. Every
+    edge costs 1, so the distances are the fewest steps from any source.
+    """
+    neighbours, size = _neighbours(graph, size)
+    visited, parents = _visited_and_parents(size)
+    distances = {}
+
+    frontier = []
+    for source in sources:
+        if source in visited:
+            continue
+        visited.add(source)
+        parents[source] = source
+        distances[source] = 0
+        if is_goal is not None and is_goal(source):
+            return SearchResult(source, distances, parents)
+        frontier.append(source)
+
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbour in neighbours(node):
+                if neighbour in visited:
+                    continue
+                visited.add(neighbour)
+                parents[neighbour] = node
+                distances[neighbour] = distance
+                if is_goal is not None and is_goal(neighbour):
+                    return SearchResult(neighbour, distances, parents)
+                next_frontier.append(neighbour)
+
+        frontier = next_frontier
+
+    return SearchResult(None, distances, parents)
+
+
+def bfs(
+    graph: Graph,
+    source: Node,
+    is_goal: Callable[[Node], bool] | None = None,
+    size: int | None = None,
+) -> SearchResult:
+    """
+    Search outwards from the source, one step at a time, until a node for
+    which ``is_goal`` is true is reached.
+    """
+    return multi_source_bfs(graph, [source], is_goal=is_goal, size=size)
+
+
+def _best_first(
+    graph: Graph,
+    sources: Iterable[Node],
+    is_goal: Callable[[Node], bool] | None,
+    heuristic: Callable[[Node], float] | None,
+    cost: Callable[[Node, Node], float] | None,
+    size: int | None,
+) -> SearchResult:
+    """
+    Settle the nodes in order of their distance plus their heuristic.
+    """
+    neighbours, size = _weighted_neighbours(graph, size, cost)
+    settled, parents = _visited_and_parents(size)
+    distances = {}
+    counter = itertools.count()  # Breaks ties, so that nodes are never compared
+
+    queue = []
+    for source in sources:
+        parents[source] = source
+        distances[source] = 0
+        priority = heuristic(source) if heuristic is not None else 0
+        queue.append((priority, next(counter), source))
+    heapq.heapify(queue)
+
+    while queue:
+        _, _, node = heapq.heappop(queue)
+        if node in settled:
+            continue
+        settled.add(node)
+        if is_goal is not None and is_goal(node):
+            return SearchResult(node, distances, parents)
+
+        distance = distances[node]
+        for neighbour, weight in neighbours(node):
+            if neighbour in settled:
+                continue
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbour, math.inf):
+                distances[neighbour] = new_distance
+                parents[neighbour] = node
+                priority = new_distance
+                if heuristic is not None:
+                    priority += heuristic(neighbour)
+                heapq.heappush(queue, (priority, next(counter), neighbour))
+
+    return SearchResult(None, distances, parents)
+
+
+def dijkstra(
+    graph: Graph,
+    source: Node,
+    is_goal: Callable[[Node], bool] | None = None,
+    cost: Callable[[Node, Node], float] | None = None,
+    size: int | None = None,
+) -> SearchResult:
+    """
+    Find the cheapest routes from the source, settling the nearest node
+    first, until a node for which ``is_goal`` is true is settled.
+
+    Without ``is_goal``, every node that can be reached is settled. The costs
+    of the edges must not be negative.
+    """
+    return _best_first(graph, [source], is_goal, None, cost, size)
+
+
+def a_star(
+    graph: Graph,
+    source: Node,
+    is_goal: Callable[[Node], bool],
+    heuristic: Callable[[Node], float],
+    cost: Callable[[Node, Node], float] | None = None,
+    size: int | None = None,
+) -> SearchResult:
+    """
+    Find the cheapest route from the source to a node for which ``is_goal`` is
+    true, settling the node with the lowest distance plus ``heuristic`` first.
+
+    The heuristic must never overestimate the cost to the goal, and must not
+    drop by more than the cost of any edge (such as the Manhattan distance on
+    a grid), for the route to be the cheapest.
+    """
+    return _best_first(graph, [source], is_goal, heuristic, cost, size)
@@ -4,4 +4,4 @@ Day 1: Calorie Counting!
 https://adventofcode.com/2022/day/1/input
 """
 
-from advent_of_code.year_2022.day_01.main import solution
+from advent_of_code.year_2022.day_01.main import STREAMING_INPUT, solution
@@ -0,0 +1,18 @@
+"""
+Generate inputs for day 1 of any size.
+"""
+
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return the calories carried by ``250 * scale`` elves.
+    """
+    rng = random.Random(seed)
+    elves = [
+        "\n".join(str(rng.randint(1_000, 60_000)) for _ in range(rng.randint(1, 15)))
+        for _ in range(250 * scale)
+    ]
+
+    return "\n\n".join(elves)
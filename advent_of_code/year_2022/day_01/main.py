@@ -6,67 +6,84 @@ OOP solution for day 1.
 
 from __future__ import annotations
 
-from typing import Any
+import heapq
+from typing import Any, Iterable
+
+from advent_of_code.utils import MappedInput, iter_blocks
+
+# Read the input one elf at a time, rather than all at once
+STREAMING_INPUT = True
 
 
 class Elves:
     """
-    Container for Elf objects.
+    Container for the Elf objects with the most calories.
+
+    Only the ``top`` largest elves seen so far are kept, in a min-heap, so
+    any number of elves can be added in O(``top``) memory.
     """
 
-    def __init__(self):
+    def __init__(self, top: int = 3):
+        self.top = top
         self.number_of_elves = 0
-        self.largest_elf: Elf | None = None
-        self.largest_elves: list[Elf] = []
-        self._elves: list[Elf] = []
-
-    def __getitem__(self, item):
-        return self._elves[item]
+        self._largest_elves: list[Elf] = []  # A min-heap
 
     def __len__(self):
-        return len(self._elves)
+        return self.number_of_elves
 
-    def _update_largest_elf(self, new_elf):
-        if self.largest_elf is None:
-            self.largest_elf = new_elf
-        elif new_elf.calories > self.largest_elf.calories:
-            self.largest_elf = new_elf
+    @property
+    def largest_elves(self) -> list[Elf]:
+        """
+        The ``top`` elves with the most calories, largest first.
+        """
+        return sorted(self._largest_elves, reverse=True)
 
-    def _update_largest_elves(self, new_elf):
-        self.largest_elves.append(new_elf)
-        if len(self.largest_elves) > 3:
-            self.largest_elves.sort()
-            self.largest_elves.pop(0)
+    @property
+    def largest_elf(self) -> Elf | None:
+        """
+        The elf with the most calories.
+        """
+        return max(self._largest_elves, default=None)
 
-    def add_elf(self, calorie_list: str) -> None:
+    def add_elf(self, calorie_lines: Iterable[str]) -> None:
         """
         Add an elf.
 
-        If this elf has more calories than any previous elves, this elf will be
-        saved to ``largest_elf``.
+        If this elf has more calories than the smallest of the ``top`` largest
+        elves, it replaces that elf.
         """
-        new_elf = Elf(self.number_of_elves + 1, calorie_list)
-        self._elves.append(new_elf)
         self.number_of_elves += 1
-        self._update_largest_elf(new_elf)
-        self._update_largest_elves(new_elf)
+        new_elf = Elf.from_lines(self.number_of_elves, calorie_lines)
+        if len(self._largest_elves) < self.top:
+            heapq.heappush(self._largest_elves, new_elf)
+        elif new_elf > self._largest_elves[0]:
+            heapq.heapreplace(self._largest_elves, new_elf)
+
+    @classmethod
+    def from_blocks(cls, blocks: Iterable[Iterable[str]], top: int = 3) -> Elves:
+        """
+        Add an elf for each block of calorie lines, in one pass over the
+        blocks.
+        """
+        elves = cls(top)
+        for calorie_lines in blocks:
+            elves.add_elf(calorie_lines)
+
+        return elves
 
 
 # sourcery skip: name-type-suffix
 class Elf:
     """
-    An elf, defined only by an ID and a list of calories.
+    An elf, defined only by an ID and the total of its calories.
     """
 
-    def __init__(self, elf_id: int, calorie_list: str):
+    def __init__(self, elf_id: int, calories: int):
         self.id = elf_id
-        self.calorie_list = calorie_list
+        self.calories = calories
 
     def __repr__(self):
-        calorie_list = self.calorie_list.replace("\n", ",")
-        return (
-            f"Elf(id={self.id}, calorie_list={calorie_list}, calories={self.calories})"
-        )
+        return f"Elf(id={self.id}, calories={self.calories})"
 
     def __lt__(self, other: Elf):
         return self.calories < other.calories
@@ -86,22 +103,19 @@ class Elf:
     def __radd__(self, other: int):
         return self + other
 
-    @property
-    def calories(self) -> int:
+    @classmethod
+    def from_lines(cls, elf_id: int, calorie_lines: Iterable[str]) -> Elf:
         """
-        The calories for the elf.
-
-        Just the sum of calories in the list.
+        Create an elf from its lines of calories, which are only parsed here.
         """
-        return sum(int(calories) for calories in self.calorie_list.split("\n"))
+        return cls(elf_id, sum(map(int, calorie_lines)))
 
 
-def solution(input_: str) -> list[Any]:
+def solution(input_: str | MappedInput) -> list[Any]:
     """
     Solve the day 1 problem!
     """
-    elves = Elves()
-    [elves.add_elf(elf_list) for elf_list in input_.strip().split("\n\n")]
+    elves = Elves.from_blocks(iter_blocks(input_))
 
     return [
         elves.largest_elf.calories,
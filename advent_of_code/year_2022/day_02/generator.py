@@ -0,0 +1,16 @@
+"""
+Generate inputs for day 2 of any size.
+"""
+
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return a strategy guide with ``2_500 * scale`` rounds.
+    """
+    rng = random.Random(seed)
+
+    return "\n".join(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(2_500 * scale)
+    )
@@ -5,6 +5,7 @@ OOP solution for day 2.
 from __future__ import annotations
 
 import enum
+import itertools
 from typing import Any
 
 import advent_of_code.year_2022.day_02.constants as constants
@@ -170,41 +171,68 @@ class Round:
         )
 
 
+def score_table(part: int) -> dict[str, int]:
+    """
+    Return the player's score for each of the 9 possible round inputs, such as
+    ``A Y``, when the second key is read as in the part.
+
+    :param part: The part of the problem, 1 or 2.
+    :raises ValueError: If the part isn't 1 or 2.
+    :return: The score per round input.
+    """
+    if part == 1:
+        from_input = Round.from_part_1
+    elif part == 2:
+        from_input = Round.from_part_2
+    else:
+        raise ValueError(f"Bad `part` value. Must be 1 or 2, found {part}.")
+
+    return {
+        f"{opponent} {player}": from_input(f"{opponent} {player}").score
+        for opponent, player in itertools.product(
+            constants.ENCODING_OPPONENT, constants.ENCODING_PLAYER_1
+        )
+    }
+
+
+SCORE_TABLES = {part: score_table(part) for part in (1, 2)}
+
+
 class Strategy:
     """
     The strategy guide.
+
+    There are only 9 different rounds, so the guide is kept as the number of
+    times each round appears, and is scored with a lookup per distinct round
+    rather than a ``Round`` per line. Each round is counted with a C-level
+    ``str.count`` over the whole input, which is safe since one round's
+    text can't straddle two lines. Both parts read the same 9 rounds, so the
+    counts are shared between them.
     """
 
-    def __init__(self, strategy_input: str, part: int):
+    def __init__(self, strategy_input: str):
         """"""
-        if part == 1:
-            self.rounds = [
-                Round.from_part_1(round_strategy)
-                for round_strategy in strategy_input.split("\n")
-            ]
-        elif part == 2:
-            self.rounds = [
-                Round.from_part_2(round_strategy)
-                for round_strategy in strategy_input.split("\n")
-            ]
-        else:
-            raise ValueError(f"Bad `part` value. Must be 1 or 2, found {part}.")
+        self.round_counts = {rnd: strategy_input.count(rnd) for rnd in SCORE_TABLES[1]}
 
-    def get_total_score(self) -> int:
+    def get_total_score(self, part: int) -> int:
         """
-        Return the sum of the player's scores for each round.
+        Return the sum of the player's scores for each round, when the rounds
+        are read as in the part.
         """
-        return sum(rnd.score for rnd in self.rounds)
+        if part not in SCORE_TABLES:
+            raise ValueError(f"Bad `part` value. Must be 1 or 2, found {part}.")
+
+        scores = SCORE_TABLES[part]
+        return sum(scores[rnd] * count for rnd, count in self.round_counts.items())
 
 
 def solution(input_: str) -> list[Any]:
     """
     Solve the day 2 problem!
     """
-    strategy_1 = Strategy(input_.strip(), 1)
-    strategy_2 = Strategy(input_.strip(), 2)
+    strategy = Strategy(input_.strip())
 
     return [
-        strategy_1.get_total_score(),
-        strategy_2.get_total_score(),
+        strategy.get_total_score(1),
+        strategy.get_total_score(2),
     ]
@@ -0,0 +1,43 @@
+"""
+Generate inputs for day 3 of any size.
+"""
+
+import random
+import string
+
+ITEMS = string.ascii_lowercase + string.ascii_uppercase
+
+
+def _rucksack(rng: random.Random, pool: list[str], badge: str) -> str:
+    """
+    Return a rucksack whose compartments only share ``pool[0]`` and which
+    holds the badge in one of them.
+    """
+    shared, left_items, right_items = pool[0], pool[1:9], pool[9:]
+    size = rng.randint(8, 24)
+    left = [shared] + rng.choices(left_items, k=size - 1)
+    right = [shared] + rng.choices(right_items, k=size - 1)
+    compartment = rng.choice([left, right])
+    compartment[rng.randrange(1, size)] = badge
+    rng.shuffle(left)
+    rng.shuffle(right)
+
+    return "".join(left + right)
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return the contents of ``300 * scale`` rucksacks, in groups of 3.
+
+    Each group only shares its badge, so every rucksack in a group gets its
+    own third of the other items.
+    """
+    rng = random.Random(seed)
+    rucksacks = []
+    for _ in range(100 * scale):
+        items = rng.sample(ITEMS, k=len(ITEMS))
+        badge, items = items[0], items[1:]
+        for pool in (items[:17], items[17:34], items[34:]):
+            rucksacks.append(_rucksack(rng, pool, badge))
+
+    return "\n".join(rucksacks)
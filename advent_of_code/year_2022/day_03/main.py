@@ -2,22 +2,49 @@
 OOP solution for day 3.
 """
 
+import functools
+import operator
 import warnings
 from typing import Any
 
 import advent_of_code.year_2022.day_03.constants as constants
 
+# Each item is a bit in a mask, in priority order, so a mask with 1 item's bit
+# set has a bit length equal to the item's priority
+ITEMS = sorted(constants.PRIORITY, key=constants.PRIORITY.__getitem__)
+BITS = {item: 1 << (priority - 1) for item, priority in constants.PRIORITY.items()}
 
-def get_priority(item: str) -> int:
+
+def to_mask(items: str) -> int:
+    """
+    Encode the items as a 52-bit mask, with a bit set for each type of item.
+    """
+    return functools.reduce(operator.or_, map(BITS.__getitem__, set(items)), 0)
+
+
+def to_priority(mask: int) -> int:
     """
-    Get the priority for the corresponding item.
+    Decode a mask with exactly one bit set into its item's priority.
     """
-    return constants.PRIORITY[item]
+    if mask == 0 or mask & (mask - 1):
+        raise ValueError(f"Expected exactly one item in the mask, found {mask:b}")
+
+    return mask.bit_length()
+
+
+def from_mask(mask: int) -> str:
+    """
+    Decode a mask with exactly one bit set into its item.
+    """
+    return ITEMS[to_priority(mask) - 1]
 
 
 class Rucksack:
     """
     An elf's rucksack, consisting of items across 2 compartments.
+
+    The contents of each compartment are encoded as masks once, so the items
+    in common are found with an AND rather than by comparing items.
     """
 
     def __init__(self, contents: str):
@@ -26,6 +53,8 @@ class Rucksack:
             contents[: len(contents) // 2],
             contents[len(contents) // 2 :],
         )
+        self.compartment_masks = tuple(map(to_mask, self.compartments))
+        self.mask = self.compartment_masks[0] | self.compartment_masks[1]
 
     def __repr__(self):
         return f"Rucksack({self.contents=}, {self.compartments=})"
@@ -34,10 +63,7 @@ class Rucksack:
         """
         Find the item shared between the compartments.
         """
-        for item_1 in self.compartments[0]:
-            for item_2 in self.compartments[1]:
-                if item_1 == item_2:
-                    return item_1
+        return from_mask(self.compartment_masks[0] & self.compartment_masks[1])
 
 
 class Group:
@@ -53,14 +79,11 @@ class Group:
 
     def find_badge(self) -> str:
         """
-        Find the item shared between the compartments.
+        Find the item shared between the rucksacks.
         """
-        for item_1 in self.rucksacks[0].contents:
-            for item_2 in self.rucksacks[1].contents:
-                if item_1 == item_2:
-                    for item_3 in self.rucksacks[2].contents:
-                        if item_1 == item_3:
-                            return item_1
+        return from_mask(
+            functools.reduce(operator.and_, (r.mask for r in self.rucksacks))
+        )
 
 
 class Rucksacks:
@@ -76,19 +99,35 @@ class Rucksacks:
             for i in range(len(self.rucksacks) // 3)
         ]
 
+    def shared_item_priorities(self) -> list[int]:
+        """
+        Return the priority of the item shared between the compartments of each
+        rucksack.
+        """
+        lefts, rights = zip(*(r.compartment_masks for r in self.rucksacks))
+        return list(map(to_priority, map(operator.and_, lefts, rights)))
+
+    def badge_priorities(self) -> list[int]:
+        """
+        Return the priority of the item (badge) shared within each group.
+        """
+        masks = [rucksack.mask for rucksack in self.rucksacks[: 3 * len(self.groups)]]
+        badges = map(
+            operator.and_, masks[0::3], map(operator.and_, masks[1::3], masks[2::3])
+        )
+        return list(map(to_priority, badges))
+
     def sum_shared_item_priorities(self) -> int:
         """
         Sum the priority of the items shared between the compartments.
         """
-        return sum(
-            get_priority(rucksack.find_shared_item()) for rucksack in self.rucksacks
-        )
+        return sum(self.shared_item_priorities())
 
     def sum_group_item_priorities(self) -> int:
         """
         Sum the priority of the items (badges) shared within the groups.
         """
-        return sum(get_priority(group.find_badge()) for group in self.groups)
+        return sum(self.badge_priorities())
 
 
 def solution(input_: str) -> list[Any]:
@@ -0,0 +1,20 @@
+"""
+Generate inputs for day 4 of any size.
+"""
+
+import random
+
+
+def _sections(rng: random.Random) -> str:
+    start, end = sorted(rng.choices(range(1, 100), k=2))
+
+    return f"{start}-{end}"
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return the section assignments of ``1_000 * scale`` pairs of elves.
+    """
+    rng = random.Random(seed)
+
+    return "\n".join(f"{_sections(rng)},{_sections(rng)}" for _ in range(1_000 * scale))
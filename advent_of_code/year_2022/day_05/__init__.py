@@ -4,4 +4,4 @@ Day 5: Supply Stacks
 https://adventofcode.com/2022/day/5/input
 """
 
-from advent_of_code.year_2022.day_05.main import solution
+from advent_of_code.year_2022.day_05.main import parse, part_one, part_two, solution
@@ -0,0 +1,38 @@
+"""
+Generate inputs for day 5 of any size.
+"""
+
+import random
+import string
+
+STACKS = 9
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return 9 stacks that start ``8 * scale`` crates high, followed by
+    ``500 * scale`` moves.
+
+    The moves never take the last crate from a stack, so every stack has a
+    top crate at the end. They move the same numbers of crates with either
+    crane, so this holds for both parts.
+    """
+    rng = random.Random(seed)
+    height = 8 * scale
+    rows = [
+        " ".join(f"[{rng.choice(string.ascii_uppercase)}]" for _ in range(STACKS))
+        for _ in range(height)
+    ]
+    labels = " ".join(f" {number} " for number in range(1, STACKS + 1))
+
+    heights = [height] * STACKS
+    moves = []
+    for _ in range(500 * scale):
+        from_stack = rng.choice([i for i, h in enumerate(heights) if h > 1])
+        to_stack = rng.choice([i for i in range(STACKS) if i != from_stack])
+        quantity = rng.randint(1, min(heights[from_stack] - 1, 30))
+        heights[from_stack] -= quantity
+        heights[to_stack] += quantity
+        moves.append(f"move {quantity} from {from_stack + 1} to {to_stack + 1}")
+
+    return "\n".join(rows + [labels, ""] + moves)
@@ -4,7 +4,10 @@ OOP solution for day 5.
 
 from __future__ import annotations
 
-from typing import Any
+import random
+from typing import Any, Iterable, Iterator, Mapping
+
+from advent_of_code.utils import freeze
 
 
 class Stack(list):
@@ -29,6 +32,203 @@ class Stack(list):
     # def __str__(self):
     #     return "\n".join(f"[{item}]" for item in self)
 
+    def move_to(self, other: Stack, quantity: int, one_at_a_time: bool) -> None:
+        """
+        Move the top ``quantity`` items onto the other stack, with one slice
+        rather than an item at a time.
+
+        Moving the items one at a time reverses their order, which is the same
+        as moving the reversed slice all at once.
+        """
+        start = len(self) - quantity
+        if start < 0:
+            raise IndexError(f"Can't move {quantity} items from a stack of {len(self)}")
+        if other is self:
+            return  # Putting the items back where they were taken from
+
+        other.extend(self[start:][::-1] if one_at_a_time else self[start:])
+        del self[start:]
+
+
+# Seeded so that the shape of the trees (and so the run time) is the same on
+# every run. The items never depend on the priorities.
+_PRIORITIES = random.Random(0)
+
+
+class _Node:
+    """
+    A node of the treap behind a ``RopeStack``, holding one item.
+
+    The items in the node's left subtree are below its item in the stack, and
+    the items in its right subtree are above it. When ``reversed`` is set, the
+    order of the whole subtree is reversed, but the reversal hasn't been
+    passed down to the children yet.
+    """
+
+    __slots__ = ("item", "priority", "size", "left", "right", "reversed")
+
+    def __init__(self, item: str):
+        self.item = item
+        self.priority = _PRIORITIES.random()
+        self.size = 1
+        self.left: _Node | None = None
+        self.right: _Node | None = None
+        self.reversed = False
+
+
+def _size(node: _Node | None) -> int:
+    return 0 if node is None else node.size
+
+
+def _resize(node: _Node) -> None:
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _push_down(node: _Node) -> None:
+    """
+    Pass the node's pending reversal down to its children.
+    """
+    if node.reversed:
+        node.left, node.right = node.right, node.left
+        for child in (node.left, node.right):
+            if child is not None:
+                child.reversed = not child.reversed
+        node.reversed = False
+
+
+def _build(items: Iterable[str]) -> _Node | None:
+    """
+    Build the treap of the items, from the bottom of the stack to the top, in
+    linear time.
+
+    The nodes on the right edge of the tree are kept on a stack, and each new
+    node takes the nodes with lower priorities as its left subtree.
+    """
+    right_edge: list[_Node] = []
+    for item in items:
+        node = _Node(item)
+        while right_edge and right_edge[-1].priority < node.priority:
+            node.left = right_edge.pop()
+            _resize(node.left)
+        if right_edge:
+            right_edge[-1].right = node
+        right_edge.append(node)
+
+    root = None
+    while right_edge:
+        root = right_edge.pop()
+        _resize(root)
+
+    return root
+
+
+def _split(node: _Node | None, size: int) -> tuple[_Node | None, _Node | None]:
+    """
+    Split the tree into the bottom ``size`` items and the rest.
+    """
+    if node is None:
+        return None, None
+
+    _push_down(node)
+    if _size(node.left) >= size:
+        bottom, node.left = _split(node.left, size)
+        _resize(node)
+        return bottom, node
+
+    node.right, top = _split(node.right, size - _size(node.left) - 1)
+    _resize(node)
+    return node, top
+
+
+def _join(bottom: _Node | None, top: _Node | None) -> _Node | None:
+    """
+    Join the trees, with the items of ``top`` above the items of ``bottom``.
+    """
+    if bottom is None:
+        return top
+    if top is None:
+        return bottom
+
+    if bottom.priority > top.priority:
+        _push_down(bottom)
+        bottom.right = _join(bottom.right, top)
+        _resize(bottom)
+        return bottom
+
+    _push_down(top)
+    top.left = _join(bottom, top.left)
+    _resize(top)
+    return top
+
+
+class RopeStack:
+    """
+    A stack of items, kept in a treap (a binary tree that is balanced by
+    random priorities) ordered from the bottom of the stack to the top.
+
+    Moving items splits the top off one tree and joins it onto another, and
+    the reversal of a CrateMover 9000 move is just a flag on the root of the
+    moved tree, so a move takes O(log n) expected time however many items it
+    moves. So does indexing. This is slower than ``Stack`` for the small
+    stacks in the puzzle, but scales to millions of items and instructions.
+    """
+
+    def __init__(self, items: Iterable[str] = ()):
+        self._root = _build(items)
+
+    def __repr__(self):
+        return f"RopeStack({list(self)})"
+
+    def __len__(self):
+        return _size(self._root)
+
+    def __iter__(self) -> Iterator[str]:
+        path, node = [], self._root
+        while path or node is not None:
+            if node is not None:
+                _push_down(node)
+                path.append(node)
+                node = node.left
+            else:
+                node = path.pop()
+                yield node.item
+                node = node.right
+
+    def __getitem__(self, index_: int) -> str:
+        length = len(self)
+        if not -length <= index_ < length:
+            raise IndexError("Stack index out of range")
+
+        index_ %= length
+        node = self._root
+        while True:
+            _push_down(node)
+            if index_ < _size(node.left):
+                node = node.left
+            elif index_ == _size(node.left):
+                return node.item
+            else:
+                index_ -= _size(node.left) + 1
+                node = node.right
+
+    def move_to(self, other: RopeStack, quantity: int, one_at_a_time: bool) -> None:
+        """
+        Move the top ``quantity`` items onto the other stack.
+
+        Moving the items one at a time reverses their order, which is the same
+        as reversing the tree of the moved items.
+        """
+        if quantity > len(self):
+            raise IndexError(f"Can't move {quantity} items from a stack of {len(self)}")
+        if other is self or quantity == 0:
+            return  # Putting the items back where they were taken from
+
+        self._root, moved = _split(self._root, len(self) - quantity)
+        if one_at_a_time:
+            moved.reversed = not moved.reversed
+
+        other._root = _join(other._root, moved)
+
 
 class Stacks(dict):
     """
@@ -178,17 +378,11 @@ class StackHandler:
         crates.
         """
         for instruction in self.procedure:
-            if move_multiple_at_once:
-                crates = [
-                    self.stacks[instruction.from_stack].pop()
-                    for _ in range(instruction.move_quantity)
-                ]
-                self.stacks[instruction.to_stack] += crates[::-1]
-            else:
-                for _ in range(instruction.move_quantity):
-                    self.stacks[instruction.to_stack].append(
-                        self.stacks[instruction.from_stack].pop()
-                    )
+            self.stacks[instruction.from_stack].move_to(
+                self.stacks[instruction.to_stack],
+                instruction.move_quantity,
+                one_at_a_time=not move_multiple_at_once,
+            )
 
     def get_top_of_each_stack(self) -> str:
         """
@@ -197,27 +391,67 @@ class StackHandler:
         return "".join(stack[-1] for stack in self.stacks.values())
 
 
-def solution(input_: str) -> list[Any]:
+def parse(input_: str) -> tuple[Mapping[int, tuple[str, ...]], Procedure]:
     """
-    Solve the day 5 problem!
+    Parse the input into read-only stacks and the procedure.
     """
     _stacks, _procedure = input_.split("\n\n")
 
-    # Need to create the Stacks objects separately otherwise they'll share the
-    # same one
-    stack_handler_one = StackHandler(
-        stacks=Stacks.from_graphical_representation(_stacks),
-        procedure=Procedure.from_procedure_text(_procedure),
+    return (
+        freeze(Stacks.from_graphical_representation(_stacks)),
+        Procedure.from_procedure_text(_procedure),
     )
-    stack_handler_many = StackHandler(
-        stacks=Stacks.from_graphical_representation(_stacks),
-        procedure=Procedure.from_procedure_text(_procedure),
+
+
+def _get_top_of_each_stack(
+    parsed: tuple[Mapping[int, tuple[str, ...]], Procedure],
+    move_multiple_at_once: bool,
+    rope: bool = False,
+) -> str:
+    """
+    Rearrange a copy of the stacks and return the top crate from each stack.
+
+    The stacks are ``RopeStack`` objects when ``rope`` is true, which
+    is only worth it for very large stacks.
+    """
+    stacks, procedure = parsed
+    stack_type = RopeStack if rope else Stack
+    stack_handler = StackHandler(
+        stacks=Stacks(
+            {number: stack_type(list(items)) for number, items in stacks.items()}
+        ),
+        procedure=procedure,
     )
+    stack_handler.execute_procedure(move_multiple_at_once=move_multiple_at_once)
+
+    return stack_handler.get_top_of_each_stack()
+
+
+def part_one(
+    parsed: tuple[Mapping[int, tuple[str, ...]], Procedure], rope: bool = False
+) -> str:
+    """
+    Solve part one of the day 5 problem!
+    """
+    return _get_top_of_each_stack(parsed, move_multiple_at_once=False, rope=rope)
+
+
+def part_two(
+    parsed: tuple[Mapping[int, tuple[str, ...]], Procedure], rope: bool = False
+) -> str:
+    """
+    Solve part two of the day 5 problem!
+    """
+    return _get_top_of_each_stack(parsed, move_multiple_at_once=True, rope=rope)
 
-    stack_handler_one.execute_procedure(move_multiple_at_once=False)
-    stack_handler_many.execute_procedure(move_multiple_at_once=True)
+
+def solution(input_: str) -> list[Any]:
+    """
+    Solve the day 5 problem!
+    """
+    parsed = parse(input_)
 
     return [
-        stack_handler_one.get_top_of_each_stack(),
-        stack_handler_many.get_top_of_each_stack(),
+        part_one(parsed),
+        part_two(parsed),
     ]
@@ -0,0 +1,21 @@
+"""
+Generate inputs for day 6 of any size.
+"""
+
+import random
+import string
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return a datastream of ``4_096 * scale`` characters whose markers are
+    right at the end.
+
+    Everything before the markers only uses 3 letters, so neither marker can
+    be found early.
+    """
+    rng = random.Random(seed)
+    marker = rng.sample(string.ascii_lowercase, k=14)
+    length = 4_096 * scale - len(marker)
+
+    return "".join(rng.choices(marker[:3], k=length) + marker)
@@ -0,0 +1,59 @@
+"""
+Generate inputs for day 7 of any size.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+
+MAX_DEPTH = 12
+
+
+def _name(rng: random.Random, taken: set[str], extension: bool) -> str:
+    while True:
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+        if extension and rng.random() < 0.5:
+            name += "." + "".join(rng.choices(string.ascii_lowercase, k=3))
+        if name not in taken:
+            taken.add(name)
+            return name
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return the terminal output from browsing a file system of about
+    ``180 * scale`` directories and ``300 * scale`` files.
+    """
+    rng = random.Random(seed)
+
+    # Each directory is a (depth, {name: directory}, {name: size}, names)
+    root = (0, {}, {}, set())
+    directories = [root]
+    parents = [root]  # The directories that aren't too deep to have children
+    for _ in range(180 * scale):
+        depth, children, _, names = rng.choice(parents)
+        child = (depth + 1, {}, {}, set())
+        children[_name(rng, names, extension=False)] = child
+        directories.append(child)
+        if depth + 1 < MAX_DEPTH:
+            parents.append(child)
+    for _ in range(300 * scale):
+        _, _, files, names = rng.choice(directories)
+        files[_name(rng, names, extension=True)] = rng.randint(1_000, 300_000)
+
+    lines = ["$ cd /"]
+
+    def browse(directory: tuple) -> None:
+        _, children, files, _ = directory
+        lines.append("$ ls")
+        lines.extend(f"dir {name}" for name in children)
+        lines.extend(f"{size} {name}" for name, size in files.items())
+        for name, child in children.items():
+            lines.append(f"$ cd {name}")
+            browse(child)
+            lines.append("$ cd ..")
+
+    browse(root)
+
+    return "\n".join(lines)
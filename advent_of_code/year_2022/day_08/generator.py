@@ -0,0 +1,17 @@
+"""
+Generate inputs for day 8 of any size.
+"""
+
+import math
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return a square forest with ``scale`` times as many trees as the puzzle's
+    99 by 99 forest.
+    """
+    rng = random.Random(seed)
+    size = round(99 * math.sqrt(scale))
+
+    return "\n".join("".join(rng.choices("0123456789", k=size)) for _ in range(size))
@@ -4,4 +4,4 @@ Day 9: Rope Bridge
 https://adventofcode.com/2022/day/9/input
 """
 
-from advent_of_code.year_2022.day_09.main import solution
+from advent_of_code.year_2022.day_09.main import parse, part_one, part_two, solution
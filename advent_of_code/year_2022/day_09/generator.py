@@ -0,0 +1,16 @@
+"""
+Generate inputs for day 9 of any size.
+"""
+
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return ``2_000 * scale`` motions of the head of the rope.
+    """
+    rng = random.Random(seed)
+
+    return "\n".join(
+        f"{rng.choice('UDLR')} {rng.randint(1, 20)}" for _ in range(2_000 * scale)
+    )
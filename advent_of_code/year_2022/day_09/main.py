@@ -133,16 +133,40 @@ DIRECTIONS = {
 }
 
 
+def parse(input_: str) -> tuple[str, ...]:
+    """
+    Parse the input into the instructions for moving the head of the rope.
+    """
+    return tuple(input_.strip().split("\n"))
+
+
+def part_one(instructions: tuple[str, ...]) -> int:
+    """
+    Solve part one of the day 9 problem!
+    """
+    rope = Rope(starting_position=Position(0, 0), knots=2)
+    rope.follow_instructions(instructions=instructions)
+
+    return len(set(rope.tail_knot.position_history))
+
+
+def part_two(instructions: tuple[str, ...]) -> int:
+    """
+    Solve part two of the day 9 problem!
+    """
+    rope = Rope(starting_position=Position(0, 0), knots=10)
+    rope.follow_instructions(instructions=instructions)
+
+    return len(set(rope.tail_knot.position_history))
+
+
 def solution(input_: str) -> list[Any]:
     """
     Solve the day 9 problem!
     """
-    rope_1 = Rope(starting_position=Position(0, 0), knots=2)
-    rope_1.follow_instructions(instructions=input_.strip().split("\n"))
-    rope_2 = Rope(starting_position=Position(0, 0), knots=10)
-    rope_2.follow_instructions(instructions=input_.strip().split("\n"))
+    instructions = parse(input_)
 
     return [
-        len(set(rope_1.tail_knot.position_history)),
-        len(set(rope_2.tail_knot.position_history)),
+        part_one(instructions),
+        part_two(instructions),
     ]
@@ -0,0 +1,28 @@
+"""
+Generate inputs for day 10 of any size.
+"""
+
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return a program of ``140 * scale`` instructions.
+
+    The X register is kept on the screen, like it is in the puzzle inputs.
+    """
+    rng = random.Random(seed)
+    x = 1
+    instructions = []
+    for _ in range(140 * scale):
+        if rng.random() < 0.3:
+            instructions.append("noop")
+            continue
+
+        value = rng.randint(-10, 10) or 1
+        if not 0 <= x + value < 40:
+            value = -value
+        x += value
+        instructions.append(f"addx {value}")
+
+    return "\n".join(instructions)
@@ -0,0 +1,41 @@
+"""
+Generate inputs for day 11 of any size.
+"""
+
+import random
+
+MONKEYS = 8
+DIVISORS = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return 8 monkeys holding ``36 * scale`` items between them.
+
+    Like the puzzle inputs, each monkey tests for a different prime and
+    exactly one monkey squares the worry levels.
+    """
+    rng = random.Random(seed)
+    items = [[] for _ in range(MONKEYS)]
+    for _ in range(36 * scale):
+        rng.choice(items).append(rng.randint(50, 99))
+
+    divisors = rng.sample(DIVISORS, k=MONKEYS)
+    squares = rng.randrange(MONKEYS)
+    monkeys = []
+    for monkey in range(MONKEYS):
+        if monkey == squares:
+            operation = "old * old"
+        else:
+            operation = f"old {rng.choice('+*')} {rng.randint(1, 19)}"
+        if_true, if_false = rng.sample([m for m in range(MONKEYS) if m != monkey], 2)
+        monkeys.append(
+            f"Monkey {monkey}:\n"
+            f"  Starting items: {', '.join(map(str, items[monkey]))}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {divisors[monkey]}\n"
+            f"    If true: throw to monkey {if_true}\n"
+            f"    If false: throw to monkey {if_false}"
+        )
+
+    return "\n\n".join(monkeys)
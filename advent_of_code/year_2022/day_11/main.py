@@ -5,7 +5,15 @@ OOP solution for day 11.
 from __future__ import annotations
 
 import math
-from typing import Any
+import operator
+from typing import Any, Callable
+
+from advent_of_code.utils.parsing import blocks, integers
+
+OPERATORS: dict[str, Callable[[int, int], int]] = {
+    "+": operator.add,
+    "*": operator.mul,
+}
 
 
 class Item:
@@ -59,6 +67,7 @@ class Monkey:
         self.id = monkey_id
         self.items = items
         self._operation = operation
+        self._operator, self._operand = self._parse_operation(operation)
         self._test = test
         self._outcome = test_outcome
         self.inspection_count: int = 0
@@ -91,9 +100,8 @@ class Monkey:
         """
         lines = [line.strip() for line in text.strip().split("\n")]
 
-        monkey_id = int(lines[0][:-1].replace("Monkey ", ""))
-        items = eval(f"[{lines[1].replace('Starting items: ', '')}]")
-        starting_items = [Item(item) for item in items]
+        monkey_id = integers(lines[0])[0]
+        starting_items = [Item(item) for item in integers(lines[1])]
         operation = lines[2].replace("Operation: ", "")
         test = lines[3].replace("Test: ", "")
         test_outcome = {
@@ -109,12 +117,25 @@ class Monkey:
             test_outcome=test_outcome,
         )
 
+    @staticmethod
+    def _parse_operation(
+        operation: str,
+    ) -> tuple[Callable[[int, int], int], int | None]:
+        """
+        Split an operation such as ``new = old * 19`` into its operator and its
+        operand, where an operand of ``None`` stands for ``old``.
+        """
+        old, symbol, operand = operation.replace("new = ", "").split()
+        if old != "old" or symbol not in OPERATORS:
+            raise ValueError(f"Can't evaluate the operation '{operation}'")
+
+        return OPERATORS[symbol], None if operand == "old" else int(operand)
+
     def evaluate_worry(self, old: int) -> int:
         """
         Evaluate the operation.
         """
-        assert "old" in self._operation
-        return eval(self._operation.replace("new = ", ""))
+        return self._operator(old, old if self._operand is None else self._operand)
 
     def test(self, num: int) -> bool:
         """
@@ -218,7 +239,7 @@ def make_monkeys(input_: str) -> dict[int, Monkey]:
     """
     return {
         monkey.id: monkey
-        for monkey in [Monkey.from_string_block(line) for line in input_.split("\n\n")]
+        for monkey in [Monkey.from_string_block(line) for line in blocks(input_)]
     }
 
 
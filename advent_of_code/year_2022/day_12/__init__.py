@@ -4,4 +4,4 @@ Day 12: Hill Climbing Algorithm
 https://adventofcode.com/2022/day/12/input
 """
 
-from advent_of_code.year_2022.day_12.main import solution
+from advent_of_code.year_2022.day_12.main import parse, part_one, part_two, solution
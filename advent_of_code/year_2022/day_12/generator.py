@@ -0,0 +1,36 @@
+"""
+Generate inputs for day 12 of any size.
+"""
+
+import math
+import random
+import string
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return a heightmap with ``scale`` times as many squares as the puzzle's
+    41 by 161 heightmap.
+
+    The hill slopes up towards the best signal in the bottom right corner,
+    with some bumps in the way. A ramp along the top and right edges makes
+    sure there is always a route from the start in the top left corner.
+    """
+    rng = random.Random(seed)
+    height = round(41 * math.sqrt(scale))
+    width = round(161 * math.sqrt(scale))
+    distance = width + height - 2
+
+    rows = [
+        [max(0, 25 * (x + y) // distance - rng.randint(0, 2)) for x in range(width)]
+        for y in range(height)
+    ]
+    ramp = [(0, x) for x in range(width)] + [(y, width - 1) for y in range(1, height)]
+    for i, (y, x) in enumerate(ramp):
+        rows[y][x] = min(25, 26 * i // (len(ramp) - 2))
+
+    text = [[string.ascii_lowercase[z] for z in row] for row in rows]
+    text[0][0] = "S"
+    text[-1][-1] = "E"
+
+    return "\n".join("".join(row) for row in text)
@@ -4,215 +4,136 @@ OOP solution for day 12.
 
 from __future__ import annotations
 
-import re
-import time
 from typing import Any
 
-import utils.geometry
+import advent_of_code.utils.search as search
+from advent_of_code.utils.grid import Grid
 
+# The heights used for comparison, where the start and end are special cases:
+# ` comes before a, and { comes after z
+HEIGHTS = bytes.maketrans(b"SE", b"`{")
 
-class Position(utils.geometry.Position):
-    """
-    A position on a 2-dimensional plane of integers.
-    """
-
-    @property
-    def neighbours(self) -> list[Position]:
-        """
-        Return the positions of the 4 immediate neighbours of the current
-        position.
-        """
-        return [self + direction for direction in [UP, DOWN, LEFT, RIGHT]]
-
-
-# noinspection DuplicatedCode
-# Math co-ordinates
-UP = Position(0, 1)
-DOWN = Position(0, -1)
-LEFT = Position(-1, 0)
-RIGHT = Position(1, 0)
 
-
-class Height:
+class Hill:
     """
-    A height, determined by a character from ``a`` to ``z``.
+    A hill, which is a grid of points with a corresponding height value.
     """
 
-    _START_END = {
-        "S": "`",  # ` comes before a
-        "E": "{",  # { comes after z
-    }
-
-    def __init__(self, height: str):
-        if not re.match(r"^[a-zSE]$", height):
-            raise ValueError(f"Characters between `a` and `z` only, found {height}")
-        self.height = height
-
-    def __str__(self):
-        return f"'{self.height}'"
-
-    def __repr__(self):
-        # return f"Height(height='{self.height}')"
-        return f"'{self.height}'"
-
-    def __eq__(self, other: Height):
-        return self._height == other._height
-
-    def __gt__(self, other: Height):
-        return self._height > other._height
-
-    def __ge__(self, other: Height):
-        return self.__eq__(other) or self.__gt__(other)
-
-    def __lt__(self, other: Height):
-        return not self.__ge__(other)
-
-    def __le__(self, other: Height):
-        return not self.__gt__(other)
-
-    def __sub__(self, other: Height):
-        return ord(self._height) - ord(other._height)
-
-    def __rsub__(self, other: Height):
-        return self.__sub__(other)
-
-    @property
-    def _height(self) -> str:
+    def __init__(self, grid: Grid, starting_index: int, ending_letter: str):
         """
-        Return the height used for comparison. This is specific for the case
-        where the height are the special cases 'S' and 'E'.
-        """
-        return self._START_END.get(self.height, self.height)
-
+        Create a hill from the grid, with a start point and end point of the
+        route to be found.
 
-class Point:
-    """
-    A point on a map, which has a position, a height, and whether it has been
-    visited.
-    """
-
-    def __init__(self, position: Position, height: Height):
-        self.position = position
-        self.height = height
-        self.visited = False
+        The grid is only read, never changed, so the same grid can be shared by
+        several hills, and a hill can be searched more than once.
+        """
+        self.grid = grid
+        self.heights = grid.cells.translate(HEIGHTS)
+        self.starting_index = starting_index
+        self.end = HEIGHTS[ord(ending_letter)]
+        self.direction = 1 if ending_letter == "E" else -1
 
     def __str__(self):
-        return f"({self.position[0]}, {self.position[1]}, {self.height})"
+        return str(self.grid)
 
-    def __repr__(self):
-        return f"Point(position={self.position}, height={self.height})"
-
-
-class Hill:
-    """
-    A hill, which is a plane of 2-dimensional points with a corresponding height
-    value.
-    """
-
-    def __init__(
-        self, map_: dict[Position, Point], starting_point: Point, ending_letter: str
-    ):
+    @classmethod
+    def from_grid(cls, grid: Grid, starting_letter: str, ending_letter: str) -> Hill:
         """
-        Create a hill which is a grid of points, with a start point and end
-        point of the route to be found.
+        Create a Hill from a parsed grid, starting from the first point with the
+        starting letter.
         """
-        self.map_ = map_
-        self.starting_point = starting_point
-        self.routes: dict[int, list[Point]] = {
-            # Step number: points at step
-            0: [starting_point]
-        }
-        self.starting_point.visited = True
-        self.ending_letter = ending_letter
-        self.direction = 1 if ending_letter == "E" else -1
-
-    def __str__(self):
-        return str(self.map_)
+        return cls(grid, next(grid.find_all(starting_letter)), ending_letter)
 
     @classmethod
     def from_text(cls, text: str, starting_letter: str, ending_letter: str) -> Hill:
         """
         Parse a text representation of a map into a Hill.
         """
-        points = {}
-        for y, row in enumerate(text.split("\n")):
-            for x, z in enumerate(row):
-                pos = Position(x, -y)
-                point = Point(pos, Height(z))
-                points[pos] = point
-                if z == starting_letter:
-                    starting_point = point
-
-        return cls(points, starting_point, ending_letter)  # noqa
-
-    def print_visits(self, current_step: int = None) -> None:
+        return cls.from_grid(parse(text), starting_letter, ending_letter)
+
+    def print_route(self, route: search.SearchResult) -> None:
         """
-        Print the visitation of the points.
+        Print the points visited by the search, with the route to the end
+        highlighted.
         """
-        # Assumes that the positions are already in order
         image = ""
-        characters = {
-            True: "#",
-            False: ".",
-        }
-        for position, point in self.map_.items():
-            if position[0] == 0:
+        path = set(route.path()) if route.goal is not None else set()
+        for index_ in range(len(self.grid)):
+            if index_ % self.grid.width == 0:
                 image += "\n"
 
-            new_visit = point in self.routes[current_step]
-            character = "\033[92m@\033[0m" if new_visit else characters[point.visited]
-            image += character
+            if index_ in path:
+                image += "\033[92m@\033[0m"
+            else:
+                image += "#" if index_ in route.distances else "."
 
         print(image)
-        time.sleep(1)
 
-    def can_climb(self, current_height: Height, neighbour_height: Height) -> bool:
+    def can_climb(self, current_height: int, neighbour_height: int) -> bool:
         """
         Whether a neighbouring point can be climbed on.
         """
         return self.direction * (neighbour_height - current_height) <= 1
 
-    def find_route(self, print_image: bool = False) -> None:
+    def climbable_neighbours(self, index_: int) -> list[int]:
+        """
+        Return the neighbouring points that can be climbed on from the point.
+        """
+        heights, direction = self.heights, self.direction
+        height = heights[index_]
+        return [
+            neighbour
+            for neighbour in self.grid.neighbours(index_)
+            if direction * (heights[neighbour] - height) <= 1  # See can_climb
+        ]
+
+    def find_route(self) -> search.SearchResult:
         """
         Find the shortest route to the exit.
         """
-        end = Height(self.ending_letter)
-        end_found = False
-        step = 0
-
-        while not end_found:
-            if print_image:
-                self.print_visits(step)
-
-            self.routes[step + 1] = []
-            for point in self.routes[step]:
-                for neighbour_position in point.position.neighbours:
-                    if neighbour := self.map_.get(neighbour_position):
-                        if (
-                            self.can_climb(
-                                current_height=self.map_.get(point.position).height,
-                                neighbour_height=neighbour.height,
-                            )
-                            and not neighbour.visited
-                        ):
-                            self.routes[step + 1].append(neighbour)
-                            neighbour.visited = True
-                            if end_found := (neighbour.height == end):
-                                return  # Hack to quit, not sure why the while loop doesn't exit
-
-            step += 1
+        heights = self.heights
+        return search.bfs(
+            self.climbable_neighbours,
+            self.starting_index,
+            is_goal=lambda index_: heights[index_] == self.end,
+            size=len(self.grid),
+        )
+
+
+def parse(input_: str) -> Grid:
+    """
+    Parse the input into a grid of the points on the hill.
+
+    The parts only read the grid, so they can share it.
+    """
+    return Grid.from_text(input_.strip())
+
+
+def part_one(grid: Grid) -> int:
+    """
+    Solve part one of the day 12 problem!
+    """
+    hill = Hill.from_grid(grid, starting_letter="S", ending_letter="E")
+
+    return hill.find_route().distance
+
+
+def part_two(grid: Grid) -> int:
+    """
+    Solve part two of the day 12 problem!
+    """
+    hill = Hill.from_grid(grid, starting_letter="E", ending_letter="a")
+
+    return hill.find_route().distance
 
 
 def solution(input_: str) -> list[Any]:
     """
     Solve the day 12 problem!
     """
-    hill_1 = Hill.from_text(input_.strip(), starting_letter="S", ending_letter="E")
-    hill_1.find_route(print_image=False)
-    hill_2 = Hill.from_text(input_.strip(), starting_letter="E", ending_letter="a")
-    hill_2.find_route(print_image=False)
+    grid = parse(input_)
 
     return [
-        max(hill_1.routes.keys()),
-        max(hill_2.routes.keys()),
+        part_one(grid),
+        part_two(grid),
     ]
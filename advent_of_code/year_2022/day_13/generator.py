@@ -0,0 +1,36 @@
+"""
+Generate inputs for day 13 of any size.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+
+
+def _packet(rng: random.Random, depth: int = 0) -> list:
+    return [
+        (
+            _packet(rng, depth + 1)
+            if depth < 4 and rng.random() < 0.3
+            else rng.randint(0, 10)
+        )
+        for _ in range(rng.randint(0, 5))
+    ]
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return ``150 * scale`` pairs of different packets.
+    """
+    rng = random.Random(seed)
+    pairs = []
+    while len(pairs) < 150 * scale:
+        left, right = _packet(rng), _packet(rng)
+        if left != right:
+            pairs.append(
+                f"{json.dumps(left, separators=(',', ':'))}\n"
+                f"{json.dumps(right, separators=(',', ':'))}"
+            )
+
+    return "\n\n".join(pairs)
@@ -5,9 +5,12 @@ OOP solution for day 13.
 from __future__ import annotations
 
 import collections.abc
+import json
 import math
 from typing import Any
 
+from advent_of_code.utils.parsing import blocks
+
 
 def list_to_packet(value: Any) -> Packet | int | None:
     if value is None:
@@ -130,7 +133,7 @@ class Packet(collections.abc.MutableSequence):
         """
         Convert the text representation into a packet.
         """
-        return cls(list(eval(text)))
+        return cls(json.loads(text))
 
 
 class PacketPair:
@@ -167,10 +170,7 @@ class PacketPairs:
     @classmethod
     def from_text(cls, text: str) -> PacketPairs:
         return cls(
-            {
-                i + 1: PacketPair.from_text(text)
-                for i, text in enumerate(text.split("\n\n"))
-            }
+            {i + 1: PacketPair.from_text(text) for i, text in enumerate(blocks(text))}
         )
 
     def pairs_in_correct_order(self) -> int:
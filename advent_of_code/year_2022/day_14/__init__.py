@@ -4,4 +4,4 @@ Day 14: Regolith Reservoir
 https://adventofcode.com/2022/day/14/input
 """
 
-from advent_of_code.year_2022.day_14.main import solution
+from advent_of_code.year_2022.day_14.main import parse, part_one, part_two, solution
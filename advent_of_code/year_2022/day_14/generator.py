@@ -0,0 +1,36 @@
+"""
+Generate inputs for day 14 of any size.
+"""
+
+import math
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return ``150 * scale`` paths of rock in a cave that is ``sqrt(scale)``
+    times as wide and as deep as the puzzle's cave.
+
+    The rocks are all within a cone under the source that is narrower than
+    the pile of sand, so in part one the sand always falls past them in the
+    end. Part two's sand fills a triangle under the source, so its area grows
+    in proportion to the scale too.
+    """
+    rng = random.Random(seed)
+    depth = round(170 * math.sqrt(scale))
+
+    paths = []
+    for _ in range(150 * scale):
+        y = rng.randint(13, depth)
+        x = 500 + rng.randint(-y // 2, y // 2)
+        points = [(x, y)]
+        for i in range(rng.randint(1, 5)):
+            if i % 2:
+                y += rng.randint(1, 10)
+            else:
+                x = max(500 - y // 2, min(500 + y // 2, x + rng.randint(-10, 10)))
+            if (x, y) != points[-1]:
+                points.append((x, y))
+        paths.append(" -> ".join(f"{x},{y}" for x, y in points))
+
+    return "\n".join(paths)
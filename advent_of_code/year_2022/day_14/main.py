@@ -6,9 +6,10 @@ from __future__ import annotations
 
 import enum
 import itertools
-from typing import Any
+from typing import Any, Iterable
 
-from utils.geometry import Area, Position
+from utils.geometry import Area, BoundsTracker, Position
+from utils.parsing import coordinates
 
 
 class Material(enum.Enum):
@@ -40,49 +41,34 @@ class Cave:
         self.points: dict[Position, Point] = (
             {}
         )  # Point per coordinate within the dimensions
+        self.bounds = BoundsTracker()  # Kept up to date as points are added
         self.floor_level = 0
         self._add_starting_sand()
 
     @property
     def total_area(self) -> Area:
-        p_min = Position(
-            min(pos[0] for pos in self.points.keys()),
-            min(pos[1] for pos in self.points.keys()),
-        )
-        p_max = Position(
-            max(pos[0] for pos in self.points.keys()),
-            max(pos[1] for pos in self.points.keys()),
-        )
+        return self.bounds.area
 
-        return Area(p_min, p_max)
+    def _add_point(self, position: Position, filled_with: Material) -> None:
+        self.points[position] = Point(position=position, filled_with=filled_with)
+        self.bounds.add(position)
 
     def _add_starting_sand(self) -> None:
-        position = START
-        self.points[position] = Point(
-            position=position, filled_with=Material.STARTING_SAND
-        )
+        self._add_point(START, Material.STARTING_SAND)
 
-    def add_rocks(self, rock_text: str) -> None:
-        rock_coordinates = rock_text.split(" -> ")
-        for pair in itertools.pairwise(rock_coordinates):
-            for position in Area(
-                Position.from_text(pair[0]), Position.from_text(pair[1])
-            ):
-                self.points[position] = Point(
-                    position=position, filled_with=Material.ROCK
-                )
+    def add_rocks(self, rocks: Iterable[Position]) -> None:
+        for position in rocks:
+            self._add_point(position, Material.ROCK)
 
-        self.floor_level = max(pos[1] for pos in self.points.keys()) + 2
+        self.floor_level = self.bounds.max_y + 2
 
     def add_air(self) -> None:
         for position in self.total_area:
             if not self.points.get(position):
-                self.points[position] = Point(
-                    position=position, filled_with=Material.AIR
-                )
+                self._add_point(position, Material.AIR)
 
     def add_sand(self, position: Position) -> None:
-        self.points[position] = Point(position=position, filled_with=Material.SAND)
+        self._add_point(position, Material.SAND)
 
     def material_at(self, position: Position) -> Material:
         if position[1] >= self.floor_level:
@@ -114,14 +100,17 @@ class SandCycle:
         self.keep_cycling = True
 
     @classmethod
-    def from_text(cls, text: str) -> SandCycle:
+    def from_rocks(cls, rocks: frozenset[Position]) -> SandCycle:
         cave = Cave()
-        for formation in text.split("\n"):
-            cave.add_rocks(formation)
+        cave.add_rocks(rocks)
         cave.add_air()
 
         return cls(cave)
 
+    @classmethod
+    def from_text(cls, text: str) -> SandCycle:
+        return cls.from_rocks(parse(text))
+
     def move_sand_until_out_of_range(self) -> None:
         position = self.path[-1]
         while True:
@@ -204,14 +193,46 @@ RIGHT = Position(1, 0)
 START = Position(500, 0)
 
 
+def parse(input_: str) -> frozenset[Position]:
+    """
+    Parse the input into the positions of the rocks.
+
+    Each line of the input is a path of rock, such as ``498,4 -> 498,6 ->
+    496,6``.
+    """
+    return frozenset(
+        position
+        for formation in input_.strip().split("\n")
+        for start, end in itertools.pairwise(coordinates(formation))
+        for position in Area(Position(*start), Position(*end))
+    )
+
+
+def part_one(rocks: frozenset[Position]) -> int:
+    """
+    Solve part one of the day 14 problem!
+    """
+    sand_cycle = SandCycle.from_rocks(rocks)
+
+    return sand_cycle.watch_sand_fall_until_out_of_range()
+
+
+def part_two(rocks: frozenset[Position]) -> int:
+    """
+    Solve part two of the day 14 problem!
+    """
+    sand_cycle = SandCycle.from_rocks(rocks)
+
+    return sand_cycle.watch_sand_fall_until_hit_starting_point()
+
+
 def solution(input_: str) -> list[Any]:
     """
     Solve the day 14 problem!
     """
-    sand_cycles_1 = SandCycle.from_text(input_.strip())
-    sand_cycles_2 = SandCycle.from_text(input_.strip())
+    rocks = parse(input_)
 
     return [
-        sand_cycles_1.watch_sand_fall_until_out_of_range(),
-        sand_cycles_2.watch_sand_fall_until_hit_starting_point(),
+        part_one(rocks),
+        part_two(rocks),
     ]
@@ -0,0 +1,33 @@
+"""
+Generate inputs for day 15 of any size.
+"""
+
+import math
+import random
+
+SIZE = 4_000_000
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return ``30 * scale`` sensors spread over the puzzle's 4,000,000 by
+    4,000,000 search area.
+
+    The sensors' ranges get smaller as there are more of them, so that they
+    cover about the same area at every scale.
+    """
+    rng = random.Random(seed)
+    max_radius = round(SIZE / (3 * math.sqrt(scale)))
+
+    sensors = []
+    for _ in range(30 * scale):
+        sensor_x, sensor_y = rng.randrange(SIZE), rng.randrange(SIZE)
+        radius = rng.randint(max_radius // 10, max_radius)
+        dx = rng.randint(-radius, radius)
+        dy = (radius - abs(dx)) * rng.choice([-1, 1])
+        sensors.append(
+            f"Sensor at x={sensor_x}, y={sensor_y}: "
+            f"closest beacon is at x={sensor_x + dx}, y={sensor_y + dy}"
+        )
+
+    return "\n".join(sensors)
@@ -4,9 +4,11 @@ OOP solution for day 15.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
 from utils.geometry import Position, manhattan_distance
+from utils.intervals import IntervalIndex, IntervalSet
+from utils.parsing import coordinates
 
 
 class Sensor:
@@ -21,19 +23,40 @@ class Sensor:
 
     @classmethod
     def from_text(cls, text: str) -> Sensor:
-        sensor, beacon = text.split(":")
-        sensor = sensor.replace("Sensor at x=", "").replace(" y=", "")
-        beacon = beacon.replace(" closest beacon is at x=", "").replace(" y=", "")
+        sensor, beacon = coordinates(text)
 
-        return cls(
-            position=Position.from_text(sensor),
-            beacon=Position.from_text(beacon),
-        )
+        return cls(position=Position(*sensor), beacon=Position(*beacon))
 
     @property
     def tuning_frequency(self):
         return (self.position[0] * 4_000_000) + self.position[1]
 
+    @property
+    def square(self) -> tuple[int, int, int, int]:
+        """
+        The ``(min_u, max_u, min_v, max_v)`` of the positions the sensor
+        covers, in the rotated co-ordinates ``u = x + y`` and ``v = x - y``,
+        where the diamond of positions within the radius is a square.
+        """
+        x, y = self.position
+        return (
+            x + y - self.radius,
+            x + y + self.radius,
+            x - y - self.radius,
+            x - y + self.radius,
+        )
+
+    def row_interval(self, y: int) -> tuple[int, int] | None:
+        """
+        The ``[start, end)`` of the x values that the sensor covers in the
+        row, or ``None`` if the row is out of range.
+        """
+        half_width = self.radius - abs(self.position[1] - y)
+        if half_width < 0:
+            return None
+
+        return self.position[0] - half_width, self.position[0] + half_width + 1
+
     def set_neighbours(self) -> None:
         def quadrant():
             for x in range(self.radius + 1):
@@ -51,9 +74,99 @@ class Sensor:
         ]
 
 
+class SensorIndex:
+    """
+    An index over the positions that the sensors cover.
+
+    In the rotated co-ordinates ``u = x + y`` and ``v = x - y``, each
+    sensor's diamond is an axis-aligned square. The squares are kept in an
+    ``IntervalIndex`` over ``u`` whose buckets are ``IntervalIndex`` objects
+    over ``v``, so a point query visits ``O(log n)`` buckets of ``O(log n)``
+    nodes each, rather than computing the Manhattan distance to every sensor.
+    The rows that each sensor reaches are kept in an ``IntervalIndex`` over
+    ``y``.
+
+    Building the index takes ``O(n log² n)`` time and space for ``n``
+    sensors.
+    """
+
+    def __init__(self, sensors: Iterable[Sensor]):
+        sensors = list(sensors)
+        self._squares = IntervalIndex(
+            [
+                (min_u, max_u + 1, (min_v, max_v + 1, sensor))
+                for sensor in sensors
+                for min_u, max_u, min_v, max_v in [sensor.square]
+            ],
+            bucket=IntervalIndex,
+        )
+        self._rows = IntervalIndex(
+            (
+                sensor.position[1] - sensor.radius,
+                sensor.position[1] + sensor.radius + 1,
+                sensor,
+            )
+            for sensor in sensors
+        )
+
+    def covering(self, position: tuple[int, int]) -> list[Sensor]:
+        """
+        Return the sensors that cover the position, in ``O(log² n + k)`` time
+        for ``k`` covering sensors.
+        """
+        x, y = position
+        u, v = x + y, x - y
+
+        return [
+            sensor
+            for v_index in self._squares.buckets(u)
+            for sensor in v_index.containing(v)
+        ]
+
+    def is_covered(self, position: tuple[int, int]) -> bool:
+        """
+        Return whether any sensor covers the position, in ``O(log² n)`` time.
+        """
+        x, y = position
+        u, v = x + y, x - y
+
+        # Only the non-empty buckets are returned, so any bucket on the path
+        # to ``v`` holds a covering sensor
+        return any(v_index.buckets(v) for v_index in self._squares.buckets(u))
+
+    def covering_row(
+        self, y: int, min_x: int | None = None, max_x: int | None = None
+    ) -> list[tuple[Sensor, tuple[int, int]]]:
+        """
+        Return the sensors that cover some of the row between ``min_x`` and
+        ``max_x`` (inclusive, and unbounded by default), with the
+        ``[start, end)`` of the x values that each one covers.
+
+        This takes ``O(log n + k)`` time for the ``k`` sensors that reach the
+        row, which are then filtered by the bounds.
+        """
+        covering = []
+        for sensor in self._rows.containing(y):
+            interval = sensor.row_interval(y)
+            if min_x is not None and interval[1] <= min_x:
+                continue
+            if max_x is not None and interval[0] > max_x:
+                continue
+            covering.append((sensor, interval))
+
+        return covering
+
+    def row_coverage(self, y: int) -> IntervalSet:
+        """
+        Return the x values that the sensors cover in the row.
+        """
+        return IntervalSet(interval for _, interval in self.covering_row(y))
+
+
 class Sensors:
     def __init__(self, sensors: list[Sensor]):
         self.sensors = sensors
+        self.index = SensorIndex(sensors)
 
     def __str__(self):
         return f"Collection of {len(self.sensors)} sensors"
@@ -85,32 +198,16 @@ class Sensors:
         return len({position for position in positions if position not in beacons})
 
     def count_positions_with_no_beacons(self, y: int) -> int:
-        beacons = [sensor.beacon for sensor in self.sensors]
-        min_sensor_x = min(sensor.position[0] for sensor in self.sensors)
-        max_sensor_x = max(sensor.position[0] for sensor in self.sensors)
-        min_sensor_radius = max(
-            sensor.radius
-            for sensor in self.sensors
-            if sensor.position[0] == min_sensor_x
-        )
-        max_sensor_radius = max(
-            sensor.radius
+        # Each sensor covers one interval of the row, so the row is the union
+        # of (at most) one interval per sensor rather than a set of positions
+        covered = self.index.row_coverage(y)
+        beacons_in_row = {
+            sensor.beacon[0]
             for sensor in self.sensors
-            if sensor.position[0] == max_sensor_x
-        )
-
-        positions = []
-        for x in range(
-            min_sensor_x - min_sensor_radius, max_sensor_x + max_sensor_radius + 1
-        ):
-            position = Position(x, y)
-            positions.extend(
-                position
-                for sensor in self.sensors
-                if manhattan_distance(position, sensor.position) <= sensor.radius
-            )
+            if sensor.beacon[1] == y and sensor.beacon[0] in covered
+        }
 
-        return len({position for position in positions if position not in beacons})
+        return covered.length - len(beacons_in_row)
 
 
 # noinspection DuplicatedCode
@@ -0,0 +1,71 @@
+"""
+Generate inputs for day 16 of any size.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+
+
+def _name(index: int) -> str:
+    """
+    Return the valve name for the index, where the first valve is ``AA``.
+
+    Names have 2 letters while there are enough of them, and 3 after that.
+    """
+    letters = 2 if index < 26**2 else 3
+    index -= 0 if letters == 2 else 26**2
+    name = ""
+    for _ in range(letters):
+        index, letter = divmod(index, 26)
+        name = string.ascii_uppercase[letter] + name
+
+    return name
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return a network of ``58 * scale`` valves, of which ``15 * scale`` have
+    a flow rate.
+
+    The network is connected, and valves with a flow rate are at the end of
+    a single tunnel, so most of the network is valves that are passed
+    through without being opened. Valve ``AA`` has no flow rate.
+    """
+    rng = random.Random(seed)
+    count = 58 * scale
+    flow_rates = [0] * (count - 15 * scale) + [
+        rng.randint(3, 25) for _ in range(15 * scale)
+    ]
+    rng.shuffle(flow_rates)
+    flow_rates[0], flow_rates[flow_rates.index(0)] = 0, flow_rates[0]
+
+    tunnels: list[set[int]] = [set() for _ in range(count)]
+    # Join each valve to a valve with no flow rate before it, so that every
+    # valve can be reached from AA, then add some shortcuts between the valves
+    # with no flow rate
+    zeros = []
+    for valve in range(1, count):
+        if not flow_rates[valve - 1]:
+            zeros.append(valve - 1)
+        other = rng.choice(zeros)
+        tunnels[valve].add(other)
+        tunnels[other].add(valve)
+    for _ in range(len(zeros) // 2):
+        valve, other = rng.sample(zeros, 2)
+        tunnels[valve].add(other)
+        tunnels[other].add(valve)
+
+    lines = []
+    for valve in rng.sample(range(count), count):
+        leads_to = [_name(other) for other in sorted(tunnels[valve])]
+        if len(leads_to) == 1:
+            tunnel = f"tunnel leads to valve {leads_to[0]}"
+        else:
+            tunnel = f"tunnels lead to valves {', '.join(leads_to)}"
+        lines.append(
+            f"Valve {_name(valve)} has flow rate={flow_rates[valve]}; {tunnel}"
+        )
+
+    return "\n".join(lines)
@@ -1,3 +1,16 @@
+"""
+Graphs of named nodes, such as the valves and tunnels.
+"""
+
+from __future__ import annotations
+
+import array
+import functools
+from typing import Iterable, Mapping
+
+import advent_of_code.utils.search as search
+
+
 class Node:
     def __init__(self, name: str):
         self.name = name
@@ -14,18 +27,18 @@ class Node:
 class Nodes:
     def __init__(self):
         self.nodes: list[Node] = []
+        self._by_name: dict[str, Node] = {}
 
     def __iter__(self):
         yield from self.nodes
 
     def __getitem__(self, item: str | Node):
         name = item.name if isinstance(item, Node) else item
-        for node in self.nodes:
-            if node.name == name:
-                return node
+        return self._by_name.get(name)
 
     def append(self, item: Node):
         self.nodes.append(item)
+        self._by_name.setdefault(item.name, item)
 
 
 class Edge:
@@ -48,6 +61,84 @@ class Graph:
         self.nodes[edge.node_to].from_nodes.append(edge.node_from)
 
 
+class IndexedGraph:
+    """
+    A directed graph whose node names are interned to the dense integer ids
+    ``0`` to ``len(graph) - 1``, in the order that the names are first seen.
+
+    The edges are kept in compressed sparse row (CSR) form: the neighbours of
+    the node with id ``i`` are ``targets[offsets[i]:offsets[i + 1]]``. The
+    graph is never changed once it's built, so copies of it are shared rather
+    than copied.
+    """
+
+    names: list[str]
+    ids: dict[str, int]
+    offsets: array.array
+    targets: array.array
+
+    def __init__(self, adjacency: Mapping[str, Iterable[str]]):
+        self.names = []
+        self.ids = {}
+        for name, neighbours in adjacency.items():
+            self._intern(name)
+            for neighbour in neighbours:
+                self._intern(neighbour)
+
+        self.offsets = array.array("q", [0])
+        self.targets = array.array("q")
+        for name in self.names:
+            self.targets.extend(self.ids[n] for n in adjacency.get(name, ()))
+            self.offsets.append(len(self.targets))
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def __copy__(self) -> IndexedGraph:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> IndexedGraph:
+        return self
+
+    def _intern(self, name: str) -> int:
+        if name not in self.ids:
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+
+        return self.ids[name]
+
+    def neighbours(self, id_: int) -> array.array:
+        """
+        Return the ids of the nodes that the node has edges to.
+        """
+        return self.targets[self.offsets[id_] : self.offsets[id_ + 1]]
+
+    @functools.cached_property
+    def distances(self) -> list[array.array]:
+        """
+        The fewest edges between each pair of nodes, where
+        ``distances[i][j]`` is the distance from node ``i`` to node ``j``,
+        or ``-1`` if node ``j`` can't be reached from node ``i``.
+
+        This is a breadth-first search from every node, so it takes
+        ``O(V * (V + E))`` time, and is only computed the first time it's
+        needed.
+        """
+        distances = []
+        for id_ in range(len(self)):
+            row = array.array("q", [-1]) * len(self)
+            for node, distance in search.bfs(
+                self.neighbours, id_, size=len(self)
+            ).distances.items():
+                row[node] = distance
+            distances.append(row)
+
+        return distances
+
+
 def main() -> None:
     graph = Graph()
     node_a = Node("AA")
@@ -8,6 +8,8 @@ import copy
 import re
 from typing import Any
 
+from advent_of_code.year_2022.day_16.graphs import IndexedGraph
+
 
 class Valve:
     def __init__(self, name: str, flow_rate: int):
@@ -31,6 +33,10 @@ class Valves:
     def __init__(self, valves: list[Valve], tunnels: dict[str, list[str]]):
         self.valves = valves
         self.tunnels = tunnels
+        self.graph = IndexedGraph(tunnels)
+        self._by_id: list[Valve | None] = [None] * len(self.graph)
+        for valve in self.valves:
+            self._by_id[self.graph.ids[valve.name]] = valve
 
         for valve in self.valves:
             valve.leads_to = [self[v] for v in self.tunnels[valve.name]]
@@ -42,9 +48,35 @@ class Valves:
         yield from self.valves
 
     def __getitem__(self, item: str) -> Valve:
+        return self._by_id[self.graph.ids[item]]
+
+    def __deepcopy__(self, memo: dict) -> Valves:
+        # The tunnels never change, so only the valves (which can be opened)
+        # are copied, and then linked up again using the shared graph
+        copied = copy.copy(self)
+        memo[id(self)] = copied
+        copied.valves = []
+        copied._by_id = [None] * len(self.graph)
         for valve in self.valves:
-            if valve.name == item:
-                return valve
+            memo[id(valve)] = copied_valve = copy.copy(valve)
+            copied.valves.append(copied_valve)
+            copied._by_id[self.graph.ids[valve.name]] = copied_valve
+
+        for valve in copied.valves:
+            valve.leads_to = [
+                copied._by_id[id_]
+                for id_ in self.graph.neighbours(self.graph.ids[valve.name])
+            ]
+
+        return copied
+
+    def distance(self, from_valve: str, to_valve: str) -> int:
+        """
+        Return the fewest tunnels between the valves, or ``-1`` if there's no
+        route between them.
+        """
+        ids = self.graph.ids
+        return self.graph.distances[ids[from_valve]][ids[to_valve]]
 
     @classmethod
     def from_text(cls, text: str) -> Valves:
@@ -0,0 +1,14 @@
+"""
+Generate inputs for day 17 of any size.
+"""
+
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return a jet pattern of ``10_091 * scale`` pushes.
+    """
+    rng = random.Random(seed)
+
+    return "".join(rng.choices("<>", k=10_091 * scale))
@@ -0,0 +1,34 @@
+"""
+Generate inputs for day 1 of any size.
+"""
+
+import random
+import string
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return a calibration document of ``1_000 * scale`` lines.
+
+    Each line mixes letters, digits and spelled-out digits, and has at least
+    one digit so that both parts have an answer.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(1_000 * scale):
+        tokens = [
+            rng.choice(
+                [
+                    rng.choice(string.ascii_lowercase),
+                    rng.choice(string.digits[1:]),
+                    rng.choice(WORDS),
+                ]
+            )
+            for _ in range(rng.randint(2, 12))
+        ]
+        tokens.insert(rng.randint(0, len(tokens)), rng.choice(string.digits[1:]))
+        lines.append("".join(tokens))
+
+    return "\n".join(lines)
@@ -0,0 +1,26 @@
+"""
+Generate inputs for day 2 of any size.
+"""
+
+import random
+
+COLOURS = ["red", "green", "blue"]
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return the record of ``100 * scale`` games.
+    """
+    rng = random.Random(seed)
+    games = []
+    for game in range(1, 100 * scale + 1):
+        draws = [
+            ", ".join(
+                f"{rng.randint(1, 20)} {colour}"
+                for colour in rng.sample(COLOURS, k=rng.randint(1, 3))
+            )
+            for _ in range(rng.randint(1, 6))
+        ]
+        games.append(f"Game {game}: {'; '.join(draws)}")
+
+    return "\n".join(games)
@@ -0,0 +1,32 @@
+"""
+Generate inputs for day 3 of any size.
+"""
+
+import math
+import random
+
+SYMBOLS = "*#+$/@=%&-"
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return a square engine schematic with ``scale`` times as many characters
+    as the puzzle's 140 by 140 schematic.
+    """
+    rng = random.Random(seed)
+    size = round(140 * math.sqrt(scale))
+
+    rows = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.1:
+                row += str(rng.randint(1, 999)) + "."
+            elif roll < 0.15:
+                row += rng.choice(SYMBOLS)
+            else:
+                row += "."
+        rows.append(row[:size])
+
+    return "\n".join(rows)
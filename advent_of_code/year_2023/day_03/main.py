@@ -4,88 +4,49 @@ Solution for day 3.
 
 from __future__ import annotations
 
-import collections
 import copy
 import dataclasses
 import functools
 import logging
+import operator
 import pathlib
 from typing import Generator
 
 import advent_of_code.utils.geometry
+from advent_of_code.utils.grid import Grid
 
 
-# noinspection DuplicatedCode
 class Position(advent_of_code.utils.geometry.Position):
     """
-    A position on a 2-dimensional plane of integers.
-    """
+    A ``(row, column)`` position in the engine schematic.
 
-    @property
-    def neighbours(self) -> list[Position]:
-        """
-        Return the positions of the 8 immediate neighbours of the current
-        position.
-        """
-        return [
-            self + direction
-            for direction in [
-                UP,
-                DOWN,
-                LEFT,
-                RIGHT,
-                UP + LEFT,
-                UP + RIGHT,
-                DOWN + LEFT,
-                DOWN + RIGHT,
-            ]
-        ]
-
-
-# noinspection DuplicatedCode
-# Math co-ordinates
-ZERO = Position(0, 0)
-UP = Position(0, 1)
-DOWN = Position(0, -1)
-LEFT = Position(-1, 0)
-RIGHT = Position(1, 0)
-
-
-class Token:
-    """
-    A token in the engine schematic.
+    Positions are compared row first, which ``PartNumber.contains`` relies
+    on, so this isn't a ``Position2D``, whose ``x`` and ``y`` would be the
+    wrong way round.
     """
 
-    token: str
-    is_digit: bool
-    is_symbol: bool
+    __slots__ = ()
 
-    def __init__(self, token: str):
-        self.token = token
-        self.is_digit = token.isdigit()
-        self.is_symbol = token not in {".", " "} and not self.is_digit
-        self.is_gear = token == "*"
+    row = property(operator.itemgetter(0))
+    column = property(operator.itemgetter(1))
 
-    def __str__(self):
-        return str(self.token)
 
-    def __repr__(self):
-        return str(self)
+def is_symbol(character: int) -> bool:
+    """
+    Return whether the character (as a byte) is a symbol, which is anything
+    other than a digit or a ``.``.
+    """
+    return character != DOT and not is_digit(character)
 
 
-class Map(collections.UserDict):
+def is_digit(character: int) -> bool:
     """
-    A map representing a 2D plane made up of tokens.
+    Return whether the character (as a byte) is a digit.
     """
+    return ZERO <= character <= NINE
 
-    def __getitem__(self, item: Position):
-        try:
-            return super().__getitem__(item)
-        except KeyError:
-            return Token(" ")
 
-    def __setitem__(self, key: Position, value: Token):
-        super().__setitem__(key, value)
+DOT, ZERO, NINE, GEAR = b".09*"
 
 
 @dataclasses.dataclass
@@ -105,7 +66,7 @@ class PartNumber:
     def __repr__(self):
         return str(self)
 
-    def __add__(self, other: Token):
+    def __add__(self, other: str):
         self._number += other
         return self
 
@@ -134,14 +95,12 @@ class PartNumber:
         assert self.start_location is not None
         assert self.end_location is not None
 
-        # There's a bug somewhere that's causing these to be nested tuples
-        start_location = self.start_location[0]
-        end_location = self.end_location[0]
         logging.debug(
-            f"Checking if {start_location, end_location} contains {position}."
+            f"Checking if {self.start_location, self.end_location} contains"
+            f" {position}."
         )
 
-        return start_location <= position <= end_location
+        return self.start_location <= position <= self.end_location
 
 
 class EngineSchematic:
@@ -149,31 +108,24 @@ class EngineSchematic:
     The engine schematic.
     """
 
-    schematic: Map
-    size: tuple[int, int]
+    grid: Grid
 
-    def __init__(self, schematic: Map, size: tuple[int, int]):
-        self.schematic = schematic
-        self.size = size
+    def __init__(self, grid: Grid):
+        self.grid = grid
 
     def __str__(self):
-        return self.as_str
+        return str(self.grid)
 
     def __repr__(self):
         return str(self)
 
-    def __iter__(self):
-        for j in range(self.height):
-            for i in range(self.width):
-                yield Position(j, i)
-
     @property
     def width(self) -> int:
-        return self.size[0] + 1
+        return self.grid.width
 
     @property
     def height(self) -> int:
-        return self.size[1] + 1
+        return self.grid.height
 
     @classmethod
     def from_text(cls, text: str) -> EngineSchematic:
@@ -182,14 +134,7 @@ class EngineSchematic:
         """
         logging.debug(f"Parsing the following text into an engine schematic:\n{text}")
 
-        schematic = Map()
-        for i, line in enumerate(text.strip().splitlines()):
-            logging.debug(f"Line {i}: {line}")
-            for j, token in enumerate(line):
-                logging.debug(f"Token {j}: {token}")
-                schematic[Position(i, j)] = Token(token)
-
-        return cls(schematic, (i, j))  # noqa
+        return cls(Grid.from_text(text.strip()))
 
     @classmethod
     @functools.cache
@@ -202,56 +147,63 @@ class EngineSchematic:
 
         return cls.from_text(file.read_text("utf-8"))
 
-    @functools.cached_property
-    def as_str(self) -> str:
-        """
-        Return the schematic as a string.
+    def _part_numbers(self) -> Generator[tuple[PartNumber, range], None, None]:
         """
-        image = ""
-        for i, position in enumerate(self):
-            token = self.schematic[position]
-            image += "\n" if i % self.width == 0 else ""
-            image += token.token
-
-        return image
-
-    def _part_numbers(self) -> Generator[PartNumber, None, None]:
-        """
-        Return the part numbers in the schematic.
+        Return the part numbers in the schematic, with the indices of their
+        cells in the grid.
         """
+        cells = self.grid.cells
         current_number = PartNumber()
 
-        for i, position in enumerate(self):
-            token = self.schematic[position]
-            end_of_line = i % self.width == self.width - 1
+        for row in range(self.height):
+            start = row * self.width
+            for index_ in range(start, start + self.width):
+                column = index_ - start
+                end_of_line = column == self.width - 1
+
+                if is_digit(cells[index_]):
+                    if current_number.start_location is None:
+                        logging.debug(f"Found a new part number at {row, column}.")
+                        current_number.start_location = Position(row, column)
+
+                    current_number += chr(cells[index_])
+                    current_number.is_part_number = any(
+                        is_symbol(cells[neighbour])
+                        for neighbour in self.grid.neighbours(index_, diagonal=True)
+                    )
+                    if not end_of_line:
+                        continue
+                    column += 1  # The number ends at the end of the line
 
-            if token.is_digit:
-                neighbours = [self.schematic[pos] for pos in position.neighbours]
-
-                if current_number.start_location is None:
-                    logging.debug(f"Found a new part number at {position}.")
-                    current_number.start_location = position
-
-                current_number += token.token
-                current_number.is_part_number = any(
-                    neighbour.is_symbol for neighbour in neighbours
-                )
-
-            if end_of_line or not token.is_digit:
                 if current_number.is_part_number:
-                    current_number.end_location = position + (
-                        ZERO if end_of_line else DOWN
-                    )  # Confusing, but it works
-                    yield copy.deepcopy(current_number)
+                    current_number.end_location = Position(row, column - 1)
+                    first = start + current_number.start_location.column
+                    yield copy.deepcopy(current_number), range(first, start + column)
                 current_number.reset()
 
+    @functools.cached_property
+    def _located_part_numbers(self) -> list[tuple[PartNumber, range]]:
+        # Can't cache a generator, so we cache the list instead
+        return list(self._part_numbers())
+
     @functools.cached_property
     def part_numbers(self) -> list[PartNumber]:
         """
         Return the part numbers in the schematic.
         """
-        # Can't cache a generator, so we cache the list instead
-        return list(self._part_numbers())
+        return [part_number for part_number, _ in self._located_part_numbers]
+
+    @functools.cached_property
+    def part_number_cells(self) -> list[PartNumber | None]:
+        """
+        Return the part number that each cell of the grid belongs to, if any.
+        """
+        cells: list[PartNumber | None] = [None] * len(self.grid)
+        for part_number, indices in self._located_part_numbers:
+            for index_ in indices:
+                cells[index_] = part_number
+
+        return cells
 
     def gear_ratios(self) -> Generator[int, None, None]:
         """
@@ -260,17 +212,18 @@ class EngineSchematic:
         A gear is any * symbol that is adjacent to exactly two part numbers. Its
         gear ratio is the result of multiplying those two numbers together.
         """
-        parts = list(self.part_numbers)
-
-        for position in self:
-            if not self.schematic[position].is_gear:
-                continue
-
-            neighbours = [
-                part
-                for part in parts
-                if any(part.contains(neighbour) for neighbour in position.neighbours)
-            ]
+        part_number_cells = self.part_number_cells
+
+        for index_ in self.grid.find_all(chr(GEAR)):
+            # Part numbers can't be hashed, and a part number next to a gear is
+            # often next to it in several cells
+            neighbours = list(
+                {
+                    id(part): part
+                    for neighbour in self.grid.neighbours(index_, diagonal=True)
+                    if (part := part_number_cells[neighbour]) is not None
+                }.values()
+            )
 
             if len(neighbours) != 2:
                 continue
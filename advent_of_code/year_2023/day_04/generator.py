@@ -0,0 +1,32 @@
+"""
+Generate inputs for day 4 of any size.
+"""
+
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return ``200 * scale`` scratchcards, each with 10 winning numbers and 25
+    numbers that you have.
+
+    Like the puzzle inputs, no card wins copies of cards past the end of the
+    table.
+    """
+    rng = random.Random(seed)
+    count = 200 * scale
+    width = len(str(count))
+    cards = []
+    for card in range(1, count + 1):
+        numbers = rng.sample(range(1, 100), k=35)
+        winning, others = numbers[:10], numbers[10:]
+        matches = rng.randint(0, min(10, count - card))
+        held = rng.sample(winning, k=matches) + others[: 25 - matches]
+        rng.shuffle(held)
+        cards.append(
+            f"Card {card:>{width}}: "
+            f"{' '.join(f'{n:>2}' for n in winning)} | "
+            f"{' '.join(f'{n:>2}' for n in held)}"
+        )
+
+    return "\n".join(cards)
@@ -0,0 +1,56 @@
+"""
+Generate inputs for day 5 of any size.
+"""
+
+import random
+
+CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+LIMIT = 2**32
+
+
+def _map(rng: random.Random, ranges: int) -> list[str]:
+    """
+    Return the lines of a map that cuts ``[0, LIMIT)`` into pieces and lays
+    them out again in a random order.
+    """
+    cuts = sorted(rng.sample(range(1, LIMIT), k=ranges - 1))
+    pieces = list(zip([0] + cuts, cuts + [LIMIT]))
+
+    lines = []
+    destination_start = 0
+    for source_start, source_end in rng.sample(pieces, k=len(pieces)):
+        length = source_end - source_start
+        lines.append(f"{destination_start} {source_start} {length}")
+        destination_start += length
+
+    return lines
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return an almanac with ``10 * scale`` ranges of seeds and about
+    ``30 * scale`` ranges in each map.
+
+    The seed ranges are far shorter than in the puzzle inputs so that the
+    seeds in them can still be checked one at a time.
+    """
+    rng = random.Random(seed)
+    seeds = []
+    for _ in range(10 * scale):
+        seeds += [rng.randrange(LIMIT - 1_000), rng.randint(1, 1_000)]
+
+    blocks = [f"seeds: {' '.join(map(str, seeds))}"]
+    for source, destination in zip(CATEGORIES, CATEGORIES[1:]):
+        lines = _map(rng, 30 * scale)
+        blocks.append("\n".join([f"{source}-to-{destination} map:"] + lines))
+
+    return "\n\n".join(blocks)
@@ -8,6 +8,8 @@ import dataclasses
 import logging
 from typing import Any
 
+from advent_of_code.utils.intervals import IntervalSet
+
 ALMANAC_MAPS = [
     "seed-to-soil",
     "soil-to-fertilizer",
@@ -57,6 +59,18 @@ class MappingParser:
         else:
             return None
 
+    @property
+    def offset(self) -> tuple[int, int, int]:
+        """
+        Return the ``(start, end, offset)`` that moves the source range onto
+        the destination range.
+        """
+        return (
+            self.source_start,
+            self.source_end,
+            self.destination_start - self.source_start,
+        )
+
 
 class Map:
     """
@@ -117,6 +131,14 @@ class Map:
 
         return source
 
+    def get_destinations(self, sources: IntervalSet) -> IntervalSet:
+        """
+        Returns the destinations for a set of source indices.
+
+        If no mapping is found, the source index is kept.
+        """
+        return sources.map_offsets(mapping.offset for mapping in self.mappings)
+
 
 class Almanac:
     """
@@ -174,6 +196,21 @@ class Almanac:
         logging.debug(f"The location for seed {seed} is {destination}")
         return destination
 
+    def get_locations(self, seeds: IntervalSet) -> IntervalSet:
+        """
+        Returns the locations for a set of seeds.
+
+        The seeds are mapped a range at a time, so this takes time
+        proportional to the number of ranges rather than the number of seeds.
+        """
+        map_name = "seed-to-soil"
+        destinations = seeds
+        while map_name is not None:
+            destinations = self.maps[map_name].get_destinations(destinations)
+            map_name = _next_map(map_name)
+
+        return destinations
+
 
 class Seeds:
     """
@@ -185,23 +222,23 @@ class Seeds:
     def __init__(self, _seeds: str):
         self._seeds = _seeds
 
-    def parse_seeds(self, as_range: bool) -> set[int]:
+    def parse_seeds(self) -> set[int]:
         """
         Create a set of seeds from their text input.
         """
-        numbers = self._seeds.split()
-        if not as_range:
-            return {int(seed) for seed in numbers}
+        return {int(seed) for seed in self._seeds.split()}
 
-        # If it's a range, the numbers come in pairs. The first number is the
-        # starting seed number, and the second number is the number of seeds.
-        seeds = []
-        while numbers:
-            start = int(numbers.pop(0))
-            length = int(numbers.pop(0))
-            seeds += {start + i for i in range(length)}
+    def parse_seed_ranges(self) -> IntervalSet:
+        """
+        Create the set of seeds from their text input, where the numbers are
+        the starts and lengths of ranges of seeds.
+        """
+        numbers = [int(number) for number in self._seeds.split()]
 
-        return set(seeds)
+        return IntervalSet(
+            (start, start + length)
+            for start, length in zip(numbers[::2], numbers[1::2])
+        )
 
 
 def parse_input(text: str) -> tuple[Seeds, Almanac]:
@@ -228,6 +265,6 @@ def solution(input_: str) -> list[Any]:
     seeds, almanac = parse_input(input_)
 
     return [
-        min(almanac.get_location(seed) for seed in seeds.parse_seeds(as_range=False)),
-        min(almanac.get_location(seed) for seed in seeds.parse_seeds(as_range=True)),
+        min(almanac.get_location(seed) for seed in seeds.parse_seeds()),
+        almanac.get_locations(seeds.parse_seed_ranges()).start,
     ]
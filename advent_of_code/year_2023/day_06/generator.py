@@ -0,0 +1,27 @@
+"""
+Generate inputs for day 6 of any size.
+"""
+
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Return the records of ``4 * scale`` races.
+
+    Each record can be beaten. Part two joins the numbers together, so from
+    about 40 races its numbers are too big to be solved with floats.
+    """
+    rng = random.Random(seed)
+    times, distances = [], []
+    for _ in range(4 * scale):
+        time = rng.randint(40, 99)
+        times.append(time)
+        distances.append(rng.randint(time, (time // 2) * (time - time // 2) - 1))
+
+    return "\n".join(
+        [
+            f"Time:     {' '.join(f'{time:>4}' for time in times)}",
+            f"Distance: {' '.join(f'{distance:>4}' for distance in distances)}",
+        ]
+    )
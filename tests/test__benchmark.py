@@ -0,0 +1,99 @@
+"""
+Tests for the ``advent_of_code/benchmark.py`` module.
+"""
+
+import pytest
+
+import advent_of_code.benchmark as benchmark
+
+
+@pytest.mark.parametrize(
+    "values, pct, expected",
+    [
+        ([1.0], 95, 1.0),
+        ([3.0, 1.0, 2.0], 50, 2.0),
+        ([float(i) for i in range(1, 101)], 95, 95.0),
+        ([float(i) for i in range(1, 21)], 95, 19.0),
+    ],
+)
+def test__percentile(values: list[float], pct: float, expected: float):
+    """
+    Test that the nearest-rank percentile is returned.
+    """
+    assert benchmark.percentile(values, pct) == expected
+
+
+def _result(
+    day: int, times: list[float], part: int | None = 1
+) -> benchmark.BenchmarkResult:
+    return benchmark.BenchmarkResult(
+        year=2022,
+        day=day,
+        part=part,
+        input_file="input.data",
+        warmup=0,
+        repeat=len(times),
+        times=times,
+        peak_rss_kib=1024,
+    )
+
+
+def test__check_baselines(tmp_path):
+    """
+    Test that only the parts that are slower than their baselines by more
+    than the tolerance are regressions.
+    """
+    baselines = tmp_path / "baselines.json"
+    benchmark.save_baselines([_result(1, [1.0]), _result(2, [1.0])], baselines)
+
+    regressions = benchmark.check_baselines(
+        [_result(1, [1.1]), _result(2, [1.5]), _result(3, [9.9])],
+        tolerance=20,
+        file=baselines,
+    )
+
+    assert [result.day for result in regressions] == [2]
+
+
+def test__both_parts_are_saved_under_their_own_key(tmp_path):
+    """
+    Test that the results for the days that solve both parts at once are
+    kept apart from the results for each part.
+    """
+    baselines = tmp_path / "baselines.json"
+    benchmark.save_baselines([_result(1, [1.0], part=None)], baselines)
+
+    assert benchmark.read_baselines(baselines) == {
+        "year-2022": {"day-01": {"both-parts": {"median": 1.0, "peak_rss_kib": 1024}}}
+    }
+    assert benchmark.check_baselines(
+        [_result(1, [2.0], part=None), _result(1, [2.0], part=1)],
+        tolerance=20,
+        file=baselines,
+    ) == [_result(1, [2.0], part=None)]
+
+
+@pytest.mark.parametrize(
+    "day, parts, expected",
+    [
+        (12, (1, 2), (1, 2)),
+        (12, (2,), (2,)),
+        (6, (1, 2), (None,)),
+        (6, (1,), (None,)),
+    ],
+)
+def test__parts_to_time(day: int, parts: tuple[int, ...], expected: tuple):
+    """
+    Test that the days that only expose ``solution`` are timed solving both
+    parts at once, rather than once for each part.
+    """
+    assert benchmark._parts_to_time(2022, day, parts) == expected
+
+
+def test__fit_slope():
+    """
+    Test that the slope on log-log axes is the exponent of a power law.
+    """
+    points = [(x, 3 * x**2) for x in [10, 100, 1_000]]
+
+    assert benchmark.fit_slope(points) == pytest.approx(2)
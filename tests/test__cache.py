@@ -0,0 +1,53 @@
+"""
+Tests for the ``advent_of_code/cache.py`` module.
+"""
+
+import os
+import pathlib
+
+import pytest
+
+import advent_of_code.cache as cache
+from advent_of_code.constants import ROOT
+
+
+def test__answers_can_be_read_back(tmp_path: pathlib.Path):
+    """
+    Test that cached answers round-trip through the cache.
+    """
+    answer_cache = cache.AnswerCache(tmp_path)
+    answer_cache["abc"] = [123, "ABC"]
+
+    assert "abc" in answer_cache
+    assert answer_cache["abc"] == [123, "ABC"]
+    with pytest.raises(KeyError):
+        answer_cache["xyz"]  # noqa
+
+
+def test__least_recently_used_answers_are_evicted(tmp_path: pathlib.Path):
+    """
+    Test that the least recently used answers are removed when the cache is
+    too big.
+    """
+    answer_cache = cache.AnswerCache(tmp_path, max_bytes=12)
+    answer_cache["old"] = [1, 2]
+    os.utime(tmp_path / "old.json", (0, 0))
+    answer_cache["new"] = [3, 4]
+    answer_cache["newer"] = [5, 6]
+
+    assert "old" not in answer_cache
+    assert "new" in answer_cache
+    assert "newer" in answer_cache
+
+
+def test__answer_key_depends_on_the_input(tmp_path: pathlib.Path):
+    """
+    Test that the answer key changes with the input, but not otherwise.
+    """
+    path = ROOT / "year_2022/day_08"
+    input_1, input_2 = tmp_path / "1.data", tmp_path / "2.data"
+    input_1.write_text("123")
+    input_2.write_text("456")
+
+    assert cache.answer_key(input_1, path) == cache.answer_key(input_1, path)
+    assert cache.answer_key(input_1, path) != cache.answer_key(input_2, path)
@@ -0,0 +1,70 @@
+"""
+Tests for the ``generator.py`` modules of the days.
+"""
+
+import importlib.util
+import pathlib
+import types
+
+import pytest
+
+from advent_of_code.constants import ROOT
+from advent_of_code.solutions import Solution
+
+GENERATORS = sorted(ROOT.glob("year_*/day_*/generator.py"))
+# The days that take more than a second to solve a generated input
+SLOW_DAYS = {"year_2022/day_11", "year_2022/day_15", "year_2022/day_16"}
+
+
+def _day(path: pathlib.Path) -> str:
+    return "/".join(path.parts[-3:-1])
+
+
+def _load_generator(path: pathlib.Path) -> types.ModuleType:
+    """
+    Load the generator module on its own, since some of the days' packages
+    need ``advent_of_code`` on the path to be imported.
+    """
+    spec = importlib.util.spec_from_file_location("generator", path)
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+
+    return generator
+
+
+@pytest.mark.parametrize("path", GENERATORS, ids=_day)
+def test__generators_are_seeded(path: pathlib.Path):
+    """
+    Test that the inputs only depend on the seed, and grow with the scale.
+    """
+    generator = _load_generator(path)
+
+    assert generator.generate(scale=1, seed=0) == generator.generate(scale=1, seed=0)
+    assert generator.generate(scale=1, seed=0) != generator.generate(scale=1, seed=1)
+    assert len(generator.generate(scale=2)) > len(generator.generate(scale=1))
+
+
+@pytest.mark.parametrize(
+    "path",
+    [path for path in GENERATORS if _day(path) not in SLOW_DAYS],
+    ids=_day,
+)
+def test__generated_inputs_can_be_solved(
+    path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test that the days solve the inputs that their generators make, such as
+    the crates never running out in 2022 day 5, there always being a route up
+    the hill in 2022 day 12, and the cards never winning copies of cards past
+    the end of the table in 2023 day 4.
+    """
+    monkeypatch.syspath_prepend(str(ROOT))  # For the days that import bare `utils`
+    generator = _load_generator(path)
+    year, day = (int(part.split("_")[1]) for part in path.parts[-3:-1])
+
+    answers = Solution(day=day, year=year).solution(
+        input_=generator.generate(scale=1, seed=0).strip()
+    )
+
+    assert len(answers) == 2
+    assert None not in answers
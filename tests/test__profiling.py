@@ -0,0 +1,109 @@
+"""
+Tests for the ``advent_of_code/profiling.py`` module.
+"""
+
+import cProfile
+import pstats
+import time
+import types
+
+import pytest
+
+import advent_of_code.profiling as profiling
+import advent_of_code.solutions as solutions
+
+
+def _helper(n: int) -> int:
+    return sum(i * i for i in range(2_000 * n))
+
+
+def _recurse(n: int) -> int:
+    if n == 0:
+        return 0
+
+    return _helper(n) + _recurse(n - 1)
+
+
+def _root() -> int:
+    return _recurse(5) + _helper(10)
+
+
+def _frame(function: types.FunctionType) -> str:
+    code = function.__code__
+    return f"{code.co_name} (test__profiling.py:{code.co_firstlineno})"
+
+
+def test__collapsed_stacks():
+    """
+    Test that the stacks are rebuilt from the call graph, with the recursion
+    folded, and that their times add up to the time of the root.
+    """
+    profiler = cProfile.Profile()
+    profiler.runcall(_root)
+    stats = pstats.Stats(profiler)
+
+    stacks = profiling.collapsed_stacks(stats)
+
+    root, recurse, helper = _frame(_root), _frame(_recurse), _frame(_helper)
+    assert f"{root};{recurse};{helper}" in stacks
+    assert f"{root};{helper}" in stacks
+    assert not any(f"{recurse};{recurse}" in stack for stack in stacks)
+
+    root_stacks = {stack: t for stack, t in stacks.items() if stack.startswith(root)}
+    assert all(stack.split(";")[0] == root for stack in root_stacks)
+    _, _, _, cumulative_time, _ = next(
+        value for function, value in stats.stats.items() if function[2] == "_root"
+    )
+    assert sum(root_stacks.values()) == pytest.approx(
+        1_000_000 * cumulative_time, rel=0.01
+    )
+
+
+def test__collapsed_stacks_max_depth():
+    """
+    Test that the stacks are cut off at the maximum depth.
+    """
+    profiler = cProfile.Profile()
+    profiler.runcall(_root)
+
+    stacks = profiling.collapsed_stacks(pstats.Stats(profiler), max_depth=2)
+
+    assert stacks
+    assert all(stack.count(";") <= 1 for stack in stacks)
+
+
+def _allocate(input_: str) -> list[int]:
+    blocks = [bytearray(1024) for _ in range(1_000)]
+    time.sleep(0.1)  # Long enough for a snapshot to be taken in the background
+
+    return [len(blocks), len(input_)]
+
+
+def test__profile_memory_reports_the_allocation_sites(capsys):
+    """
+    Test that the allocations made inside the solution are reported.
+    """
+    solution = solutions.Solution(day=9, year=2022)
+    solution.__dict__["module"] = types.SimpleNamespace(solution=_allocate)
+    solution.read_input = lambda: "abc"
+
+    answers = profiling.profile_memory(solution, interval=0.01)
+
+    out = capsys.readouterr().out
+    assert answers == [1_000, 3]
+    assert "Peak memory traced" in out
+    line = _allocate.__code__.co_firstlineno + 1
+    assert f"test__profiling.py:{line}:" in out
+
+
+def test__profile_memory_without_a_snapshot(monkeypatch: pytest.MonkeyPatch, capsys):
+    """
+    Test that the answers are still returned when no snapshot was taken.
+    """
+    monkeypatch.setattr(profiling._PeakSnapshots, "take_snapshot", lambda self: None)
+    solution = solutions.Solution(day=9, year=2022)
+    solution.__dict__["module"] = types.SimpleNamespace(solution=lambda input_: [1, 2])
+    solution.read_input = lambda: "abc"
+
+    assert profiling.profile_memory(solution) == [1, 2]
+    assert "No memory was traced" in capsys.readouterr().out
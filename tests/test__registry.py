@@ -0,0 +1,42 @@
+"""
+Tests for the ``advent_of_code/registry.py`` module.
+"""
+
+import sys
+
+import pytest
+
+import advent_of_code.registry as registry
+
+
+def test__days_are_found_without_being_imported():
+    """
+    Test that the days are found from the directory names alone.
+    """
+    days = registry.find_days(2022)
+
+    assert days[0] == (2022, 1)
+    assert all(year == 2022 for year, _ in days)
+    assert registry.module_name(2022, 25) not in sys.modules
+
+
+def test__import_time_of_a_day_that_imports_bare_utils():
+    """
+    Test that the days that import the bare ``utils`` package can be timed.
+    """
+    assert registry.import_time(2022, 8) > 0
+
+
+def test__print_days_reports_import_errors(monkeypatch: pytest.MonkeyPatch, capsys):
+    """
+    Test that a day that can't be imported is reported next to the day, and
+    the rest of the days are still listed.
+    """
+    monkeypatch.setattr(registry, "find_days", lambda year: [(1999, 1), (2022, 2)])
+
+    registry.print_days(import_times=True)
+
+    first, second = capsys.readouterr().out.splitlines()
+    assert first.startswith("1999 day 01: Couldn't import advent_of_code.year_1999")
+    assert "ModuleNotFoundError" in first
+    assert second.startswith("2022 day 02: ") and second.endswith("ms")
@@ -0,0 +1,41 @@
+"""
+Tests for the ``advent_of_code/sandbox.py`` module.
+"""
+
+import time
+
+import advent_of_code.sandbox as sandbox
+
+
+def _allocate(size: int) -> int:
+    return len(bytearray(size))
+
+
+def test__run_in_sandbox_returns_the_value():
+    """
+    Test that the function's return value is sent back from the child.
+    """
+    outcome = sandbox.run_in_sandbox(_allocate, 1024, timeout=10)
+
+    assert (outcome.status, outcome.value) == (sandbox.OK, 1024)
+
+
+def test__run_in_sandbox_times_out():
+    """
+    Test that a function that runs for too long is stopped.
+    """
+    outcome = sandbox.run_in_sandbox(time.sleep, 10, timeout=0.1)
+
+    assert outcome.status == sandbox.TIMEOUT
+    assert outcome.seconds < 5
+
+
+def test__run_in_sandbox_runs_out_of_memory():
+    """
+    Test that a function that uses too much memory is reported as OOM.
+    """
+    outcome = sandbox.run_in_sandbox(
+        _allocate, 1024**3, timeout=10, max_bytes=512 * 1024**2
+    )
+
+    assert outcome.status == sandbox.OOM
@@ -2,4 +2,140 @@
 Tests for the ``advent_of_code/solutions.py`` module.
 """
 
+import pathlib
+import types
+
+import pytest
+
 import advent_of_code.solutions as solutions
+from advent_of_code.cache import AnswerCache
+from advent_of_code.utils.immutable import freeze
+
+
+def _fake_solution(input_: str, **functions) -> solutions.Solution:
+    """
+    Return a ``Solution`` whose module exposes just the functions, and whose
+    input is the text.
+    """
+    solution = solutions.Solution(day=9, year=2022)
+    solution.__dict__["module"] = types.SimpleNamespace(**functions)
+    solution.__dict__["cache_key"] = "abc"
+    solution.read_input = lambda: input_
+
+    return solution
+
+
+def test__solve_dispatches_to_the_part():
+    """
+    Test that solving a single part only calls that part's function.
+    """
+    solution = _fake_solution(
+        "1 2 3",
+        parse=lambda input_: [int(n) for n in input_.split()],
+        part_one=sum,
+        part_two=lambda numbers: pytest.fail("Part two shouldn't be solved"),
+        solution=lambda input_: pytest.fail("The solution shouldn't be called"),
+    )
+
+    assert solution.solve(part=1) == 6
+
+
+def test__solve_falls_back_to_the_solution():
+    """
+    Test that modules that only expose ``solution`` are still solved one part
+    at a time.
+    """
+    solution = _fake_solution("abc", solution=lambda input_: [input_, input_[::-1]])
+
+    assert solution.parts == {}
+    assert solution.solve(part=1) == "abc"
+    assert solution.solve(part=2) == "cba"
+    assert solution.solve() == ["abc", "cba"]
+
+
+def test__solve_parses_the_input_once():
+    """
+    Test that solving both parts parses the input once, and gives both parts
+    the same read-only parsed input.
+    """
+    parsed_inputs = []
+
+    def parse(input_: str) -> tuple[int, ...]:
+        parsed_inputs.append(freeze([int(n) for n in input_.split()]))
+        return parsed_inputs[-1]
+
+    seen_by_parts = []
+
+    def part(numbers: tuple[int, ...]) -> int:
+        seen_by_parts.append(numbers)
+        return len(seen_by_parts)
+
+    solution = _fake_solution("1 2 3", parse=parse, part_one=part, part_two=part)
+
+    assert solution.solve() == [1, 2]
+    assert parsed_inputs == [(1, 2, 3)]
+    assert seen_by_parts[0] is parsed_inputs[0]
+    assert seen_by_parts[1] is parsed_inputs[0]
+
+
+@pytest.mark.parametrize("part", [0, 3, "1"])
+def test__solve_part_rejects_bad_parts(part):
+    """
+    Test that only parts 1 and 2 can be solved.
+    """
+    solution = _fake_solution("abc", solution=lambda input_: [1, 2])
+
+    with pytest.raises(ValueError):
+        solution.solve_part(part, "abc")
+
+
+def test__answers_are_cached_per_part(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+):
+    """
+    Test that each part's answer is cached under its own key, apart from the
+    answers to both parts.
+    """
+    monkeypatch.setattr(solutions, "ANSWER_CACHE", AnswerCache(tmp_path))
+    solution = _fake_solution("abc", solution=lambda input_: [1, 2])
+
+    assert solution._part_cache_key(None) == "abc"
+    assert solution._part_cache_key(2) == "abc-part-2"
+
+    assert solution.solve(part=2, use_cache=True) == 2
+    assert solution.is_cached(2)
+    assert not solution.is_cached(1)
+    assert not solution.is_cached()
+
+    solution.__dict__["module"] = types.SimpleNamespace(solution=lambda input_: [3, 4])
+    assert solution.solve(part=2, use_cache=True) == 2
+    assert solution.solve(part=1, use_cache=True) == 3
+
+
+def test__print_solutions_in_parallel_with_no_days(capsys):
+    """
+    Test that there's nothing to print, rather than an error, when no days
+    match.
+    """
+    solutions.print_solutions_in_parallel([])
+
+    assert capsys.readouterr().out == ""
+
+
+def test__print_solutions_in_parallel_reports_errors(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path, capsys
+):
+    """
+    Test that a day that fails is reported in its place, rather than stopping
+    the days after it from being printed.
+    """
+    monkeypatch.setattr(solutions, "TIMINGS", tmp_path / "timings.json")
+
+    solutions.print_solutions_in_parallel([(1999, 1), (1999, 2)])
+
+    out = capsys.readouterr().out
+    assert out.count("ERROR") == 2
+    assert "Year 1999 Day 01" in out
+    assert "Year 1999 Day 02" in out
+    assert "ModuleNotFoundError" in out
+    assert (tmp_path / "timings.json").read_text() == "{}"
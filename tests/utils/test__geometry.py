@@ -0,0 +1,124 @@
+"""
+Tests for the ``advent_of_code/utils/geometry.py`` module.
+"""
+
+import copy
+
+import pytest
+
+from advent_of_code.utils.geometry import (
+    Area,
+    BoundsTracker,
+    Position,
+    Position2D,
+    Position3D,
+    PositionArray,
+)
+
+
+@pytest.mark.parametrize(
+    "args, expected_type",
+    [
+        ((1, 2), Position2D),
+        ((1, 2, 3), Position3D),
+        ((1,), Position),
+    ],
+)
+def test__position_has_fixed_arity_types(args: tuple, expected_type: type):
+    """
+    Test that plain positions get the fixed-arity type for their dimension.
+    """
+    position = Position(*args)
+
+    assert type(position) is expected_type
+    assert isinstance(position, Position)
+    assert position == args
+    assert type(copy.deepcopy(position)) is expected_type
+
+
+def test__position_2d_arithmetic():
+    """
+    Test that the arithmetic matches the generic ``Position`` arithmetic.
+    """
+    position = Position(3, 4)
+
+    assert (position.x, position.y) == (3, 4)
+    assert position + Position(0, 1) == (3, 5)
+    assert position + (1, 1) == (1, 1) + position == (4, 5)
+    assert position - (1, 1) == (2, 3)
+    assert (1, 1) - position == (-2, -3)
+    assert position * 2 == 2 * position == (6, 8)
+    assert position + Position(1, 1, 1) == (4, 5, 1)
+    assert type(position + (1, 1)) is Position2D
+
+
+def test__position_subclasses_keep_their_type():
+    """
+    Test that the arithmetic on a subclass returns the subclass.
+    """
+
+    class Point(Position2D):
+        pass
+
+    assert type(Point(1, 2) + Position(1, 1)) is Point
+
+
+def test__area_to_array_matches_iterating_over_the_area():
+    """
+    Test that the array has the area's positions in the same order.
+    """
+    area = Area(Position(3, 2), Position(1, -1))
+
+    assert list(area.to_array()) == list(area)
+
+
+def test__area_bounds_operations():
+    """
+    Test the size of an area and the operations with other areas.
+    """
+    area = Area(Position(3, 2), Position(1, -1))
+
+    assert (area.width, area.height, area.size) == (3, 4, 12)
+    assert (2, 0) in area
+    assert (4, 0) not in area
+    assert area.intersection(Area(Position(2, 1), Position(5, 5))) == Area(
+        Position(2, 1), Position(3, 2)
+    )
+    assert area.intersection(Area(Position(4, 0), Position(5, 5))) is None
+    assert area.union(Area(Position(4, 0), Position(5, 5))).bounds == (1, -1, 5, 5)
+    assert area.clip((10, -5)) == (3, -1)
+    assert area.clip((2, 0)) == (2, 0)
+
+
+def test__bounds_tracker():
+    """
+    Test that the tracked bounds grow with the positions added.
+    """
+    tracker = BoundsTracker()
+    assert not tracker
+    assert (0, 0) not in tracker
+
+    tracker.update([(500, 0), (498, 4), (503, 9)])
+
+    assert tracker.bounds == (498, 0, 503, 9)
+    assert tracker.area == Area(Position(498, 0), Position(503, 9))
+    assert (500, 5) in tracker
+    assert (500, 10) not in tracker
+
+    with pytest.raises(ValueError):
+        BoundsTracker().bounds  # noqa
+
+
+def test__position_array_operations():
+    """
+    Test the operations over the whole array against a single position.
+    """
+    positions = PositionArray.from_positions([(0, 0), (3, -4), (3, -4), (-1, 2)])
+
+    assert list(positions + (1, 1)) == [(1, 1), (4, -3), (4, -3), (0, 3)]
+    assert list(positions.manhattan_distance((1, 0))) == [1, 6, 6, 4]
+    assert list(positions.chebyshev_distance((1, 0))) == [1, 4, 4, 2]
+    assert list(positions.unique()) == [(-1, 2), (0, 0), (3, -4)]
+    assert positions.bounding_box().bounds == (-1, -4, 3, 2)
+    assert list(positions[[True, False, True, False]]) == [(0, 0), (3, -4)]
+    assert positions[1] == (3, -4)
@@ -0,0 +1,97 @@
+"""
+Tests for the ``advent_of_code/utils/grid.py`` module.
+"""
+
+import pytest
+
+from advent_of_code.utils.geometry import Position2D
+from advent_of_code.utils.grid import Grid
+
+TEXT = "abc\ndef\r\nghi\n"
+
+
+def test__grid_from_text():
+    """
+    Test that text is parsed row by row, ignoring line endings.
+    """
+    grid = Grid.from_text(TEXT.strip())
+
+    assert (grid.width, grid.height) == (3, 3)
+    assert grid.cells == bytearray(b"abcdefghi")
+    assert str(grid) == "abc\ndef\nghi"
+    assert grid[2, 0] == "c"
+    assert grid[0, 2] == "g"
+
+
+def test__grid_from_text_rejects_ragged_lines():
+    """
+    Test that lines of different lengths can't be parsed into a grid.
+    """
+    with pytest.raises(ValueError):
+        Grid.from_text("abc\nde")
+
+
+def test__grid_get_and_set():
+    """
+    Test that positions outside the grid are rejected or defaulted.
+    """
+    grid = Grid.from_text("ab\ncd")
+    grid[1, 1] = "x"
+
+    assert grid[1, 1] == "x"
+    assert grid.get((2, 0)) is None
+    assert grid.get((-1, 0), "#") == "#"
+    with pytest.raises(IndexError):
+        grid[0, 2]  # noqa
+
+
+def test__grid_index_and_position():
+    """
+    Test that indices and positions round-trip.
+    """
+    grid = Grid.from_text(TEXT.strip())
+
+    assert grid.index((1, 2)) == 7
+    assert grid.position(7) == Position2D(1, 2)
+
+
+@pytest.mark.parametrize(
+    "index_, diagonal, expected",
+    [
+        (4, False, [1, 3, 5, 7]),
+        (0, False, [1, 3]),
+        (5, False, [2, 4, 8]),
+        (8, True, [4, 5, 7]),
+        (4, True, [0, 1, 2, 3, 5, 6, 7, 8]),
+    ],
+)
+def test__grid_neighbours(index_: int, diagonal: bool, expected: list[int]):
+    """
+    Test that neighbours don't wrap around the edges of the grid.
+    """
+    grid = Grid.from_text(TEXT.strip())
+
+    assert sorted(grid.neighbours(index_, diagonal=diagonal)) == expected
+
+
+def test__grid_rows_and_columns_are_views():
+    """
+    Test that rows and columns are views onto the cells.
+    """
+    grid = Grid.from_text(TEXT.strip())
+
+    assert grid.row(1).tobytes() == b"def"
+    assert grid.column(1).tobytes() == b"beh"
+
+    grid.row(0)[0] = ord("z")
+    assert grid[0, 0] == "z"
+
+
+def test__grid_find_all():
+    """
+    Test that all the cells with a character are found in order.
+    """
+    grid = Grid.from_text("a.a\n.a.")
+
+    assert list(grid.find_all("a")) == [0, 2, 4]
+    assert list(grid.find_all("x")) == []
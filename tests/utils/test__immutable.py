@@ -0,0 +1,28 @@
+"""
+Tests for the ``advent_of_code/utils/immutable.py`` module.
+"""
+
+import pytest
+
+import advent_of_code.utils.immutable as immutable
+from advent_of_code.utils.geometry import Position
+
+
+def test__freeze_is_recursive():
+    """
+    Test that nested containers are made read-only.
+    """
+    frozen = immutable.freeze({1: ["a", "b"], 2: [{3}]})
+
+    assert frozen == {1: ("a", "b"), 2: (frozenset({3}),)}
+    with pytest.raises(TypeError):
+        frozen[3] = ()  # noqa
+
+
+def test__freeze_leaves_tuple_subclasses_alone():
+    """
+    Test that positions are not turned into plain tuples.
+    """
+    position = Position(1, 2)
+
+    assert type(immutable.freeze([position])[0]) is type(position)
@@ -0,0 +1,53 @@
+"""
+Tests for the ``advent_of_code/utils/inputs.py`` module.
+"""
+
+import pathlib
+
+import pytest
+
+import advent_of_code.utils.inputs as inputs
+
+TEXT = "1\n2\r\n\n\n3\n4\n"
+
+
+@pytest.fixture
+def mapped_input(tmp_path: pathlib.Path) -> inputs.MappedInput:
+    """
+    Return a memory-mapped input file.
+    """
+    file = tmp_path / "input.data"
+    file.write_bytes(TEXT.encode())
+    with inputs.MappedInput(file) as mapped_input:
+        yield mapped_input
+
+
+def test__lines_are_the_same_for_text_and_files(mapped_input: inputs.MappedInput):
+    """
+    Test that the lines are split the same way for text and mapped files.
+    """
+    expected = ["1", "2", "", "", "3", "4"]
+
+    assert list(inputs.iter_lines(TEXT)) == expected
+    assert list(inputs.iter_lines(mapped_input)) == expected
+
+
+def test__blocks_are_split_on_blank_lines(mapped_input: inputs.MappedInput):
+    """
+    Test that the blocks are split on (any number of) blank lines.
+    """
+    expected = [["1", "2"], ["3", "4"]]
+
+    assert list(inputs.iter_blocks(TEXT)) == expected
+    assert list(inputs.iter_blocks(mapped_input)) == expected
+
+
+def test__empty_files_can_be_mapped(tmp_path: pathlib.Path):
+    """
+    Test that empty files (which can't be memory-mapped) are still readable.
+    """
+    file = tmp_path / "input.data"
+    file.touch()
+    with inputs.MappedInput(file) as mapped_input:
+        assert list(mapped_input.lines()) == []
+        assert len(mapped_input) == 0
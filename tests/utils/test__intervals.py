@@ -0,0 +1,122 @@
+"""
+Tests for the ``advent_of_code/utils/intervals.py`` module.
+"""
+
+import random
+
+import pytest
+
+from advent_of_code.utils.intervals import IntervalIndex, IntervalSet
+
+
+def test__interval_set_merges_overlapping_and_touching_intervals():
+    """
+    Test that the intervals are sorted and merged on construction.
+    """
+    interval_set = IntervalSet([(10, 12), (2, 5), (4, 9), (9, 10), (20, 20)])
+
+    assert list(interval_set) == [(2, 12)]
+    assert interval_set.length == 10
+    assert (interval_set.start, interval_set.end) == (2, 12)
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        (5, 6, [(0, 2), (5, 6), (10, 12), (20, 25)]),
+        (2, 10, [(0, 12), (20, 25)]),
+        (11, 21, [(0, 2), (10, 25)]),
+        (-5, 30, [(-5, 30)]),
+        (3, 3, [(0, 2), (10, 12), (20, 25)]),
+    ],
+)
+def test__interval_set_add(start: int, end: int, expected: list[tuple[int, int]]):
+    """
+    Test that adding an interval merges it with the intervals it overlaps.
+    """
+    interval_set = IntervalSet([(0, 2), (10, 12), (20, 25)])
+    interval_set.add(start, end)
+
+    assert list(interval_set) == expected
+
+
+def test__interval_set_contains():
+    """
+    Test that points are looked up in the half-open intervals.
+    """
+    interval_set = IntervalSet([(0, 2), (10, 12)])
+
+    assert [point in interval_set for point in (-1, 0, 1, 2, 9, 10, 12)] == [
+        False,
+        True,
+        True,
+        False,
+        False,
+        True,
+        False,
+    ]
+
+
+def test__interval_set_operations():
+    """
+    Test the set operations against sets of the integers.
+    """
+    left = IntervalSet([(0, 5), (8, 15), (20, 22)])
+    right = IntervalSet([(3, 9), (12, 13), (14, 30)])
+
+    def points(interval_set: IntervalSet) -> set[int]:
+        return {point for start, end in interval_set for point in range(start, end)}
+
+    assert points(left | right) == points(left) | points(right)
+    assert points(left & right) == points(left) & points(right)
+    assert points(left - right) == points(left) - points(right)
+    assert points(right - left) == points(right) - points(left)
+    assert not IntervalSet() & left
+    assert left - IntervalSet() == left
+
+
+def test__interval_set_map_offsets():
+    """
+    Test that the integers in each piece are moved by its offset, and the
+    rest are left where they are.
+    """
+    seeds = IntervalSet([(79, 93), (55, 68)])
+
+    soil = seeds.map_offsets([(98, 100, -48), (50, 98, 2)])
+    assert soil == IntervalSet([(57, 70), (81, 95)])
+
+    moved = IntervalSet([(0, 10)]).map_offsets([(2, 4, 100), (6, 7, -6)])
+    assert moved == IntervalSet([(0, 2), (4, 6), (7, 10), (102, 104)])
+
+
+def test__interval_index_containing():
+    """
+    Test that the values whose intervals contain each point are found, against
+    checking every interval.
+    """
+    rng = random.Random(0)
+    intervals = []
+    for value in range(50):
+        start = rng.randint(-50, 50)
+        intervals.append((start, start + rng.randint(-5, 30), value))
+    intervals.append(intervals[0])  # The same interval twice
+
+    index_ = IntervalIndex(intervals)
+
+    for point in range(-60, 90):
+        assert sorted(index_.containing(point)) == sorted(
+            value for start, end, value in intervals if start <= point < end
+        )
+
+
+def test__interval_index_buckets():
+    """
+    Test that the values are split between the buckets, which are built with
+    the bucket type.
+    """
+    index_ = IntervalIndex([(0, 10, "a"), (0, 5, "b"), (20, 30, "c")], bucket=set)
+
+    assert all(isinstance(bucket, set) for bucket in index_.buckets(3))
+    assert set().union(*index_.buckets(3)) == {"a", "b"}
+    assert index_.buckets(15) == []
+    assert IntervalIndex([]).containing(0) == []
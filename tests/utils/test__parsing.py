@@ -0,0 +1,73 @@
+"""
+Tests for the ``advent_of_code/utils/parsing.py`` module.
+"""
+
+import array
+
+import pytest
+
+from advent_of_code.utils.parsing import (
+    blocks,
+    coordinate_arrays,
+    coordinates,
+    integers,
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Sensor at x=2, y=-18: closest beacon is at x=-2, y=15", [2, -18, -2, 15]),
+        (b"498,4 -> 498,6", [498, 4, 498, 6]),
+        (memoryview(b"Starting items: 79, 98"), [79, 98]),
+        ("no numbers here", []),
+    ],
+)
+def test__integers(text, expected: list[int]):
+    """
+    Test that the signed integers are pulled from strings and buffers.
+    """
+    assert integers(text) == expected
+
+
+def test__integers_unsigned():
+    """
+    Test that a ``-`` can be read as a separator rather than a minus sign.
+    """
+    assert integers("2-4,6-8", signed=False) == [2, 4, 6, 8]
+    assert integers(b"x=-3", signed=False) == [3]
+
+
+def test__blocks():
+    """
+    Test that blocks are split on blank lines, keeping their indentation.
+    """
+    text = "\n    [D]\n[N] [C]\n\n  \r\nmove 1\nmove 2\n\n"
+
+    assert blocks(text) == ["    [D]\n[N] [C]", "move 1\nmove 2"]
+
+
+def test__coordinates():
+    """
+    Test that coordinate lists are parsed into tuples.
+    """
+    assert coordinates("498,4 -> 498,6 -> 496,6") == [(498, 4), (498, 6), (496, 6)]
+    assert coordinates("1,2,3\n-4,5,6", dimensions=3) == [(1, 2, 3), (-4, 5, 6)]
+
+
+def test__coordinates_rejects_partial_coordinates():
+    """
+    Test that a dangling coordinate isn't silently dropped.
+    """
+    with pytest.raises(ValueError):
+        coordinates("1,2 -> 3")
+
+
+def test__coordinate_arrays():
+    """
+    Test that coordinate lists are parsed into one array per axis.
+    """
+    xs, ys = coordinate_arrays("498,4 -> 498,6 -> 496,6")
+
+    assert xs == array.array("q", [498, 498, 496])
+    assert ys == array.array("q", [4, 6, 6])
@@ -0,0 +1,115 @@
+"""
+Tests for the ``advent_of_code/utils/search.py`` module.
+"""
+
+import pytest
+
+from advent_of_code.utils.grid import Grid
+from advent_of_code.utils.search import Bitmap, a_star, bfs, dijkstra, multi_source_bfs
+
+MAZE = Grid.from_text(
+    """
+.#...
+.#.#.
+...#.
+""".strip()
+)
+
+WEIGHTED = {
+    "A": {"B": 1, "C": 4},
+    "B": {"C": 2, "D": 6},
+    "C": {"D": 3},
+}
+
+
+def _open_neighbours(index_: int) -> list[int]:
+    return [n for n in MAZE.neighbours(index_) if MAZE.cells[n] == ord(".")]
+
+
+def test__bitmap():
+    """
+    Test that integers are added to and found in the packed bits.
+    """
+    bitmap = Bitmap(20)
+    bitmap.add(0)
+    bitmap.add(9)
+    bitmap.add(19)
+
+    assert [i for i in range(20) if i in bitmap] == [0, 9, 19]
+    assert len(bitmap.bits) == 3
+
+
+def test__bfs_on_a_grid():
+    """
+    Test that the shortest route through the maze is found.
+    """
+    goal = MAZE.index((4, 0))
+    result = bfs(_open_neighbours, 0, is_goal=goal.__eq__, size=len(MAZE))
+
+    assert result.goal == goal
+    assert result.distance == 8
+    assert [MAZE.position(i) for i in result.path()][:4] == [
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (1, 2),
+    ]
+    assert len(result.path()) == 9
+
+
+def test__bfs_visits_everything_without_a_goal():
+    """
+    Test that every reachable node gets a distance when there's no goal.
+    """
+    result = bfs({1: [2, 3], 2: [4], 3: [4], 4: [1], 5: [1]}, 1)
+
+    assert result.goal is None
+    assert result.distance is None
+    assert result.distances == {1: 0, 2: 1, 3: 1, 4: 2}
+    with pytest.raises(ValueError):
+        result.path(5)
+
+
+def test__multi_source_bfs():
+    """
+    Test that distances are from the nearest source.
+    """
+    result = multi_source_bfs(MAZE, [0, 4])
+
+    assert result.distances[MAZE.index((0, 2))] == 2
+    assert result.distances[MAZE.index((4, 2))] == 2
+    assert result.path(MAZE.index((4, 2)))[0] == 4
+
+
+def test__dijkstra():
+    """
+    Test that the cheapest routes are found over a weighted mapping.
+    """
+    result = dijkstra(WEIGHTED, "A")
+
+    assert result.distances == {"A": 0, "B": 1, "C": 3, "D": 6}
+    assert result.path("D") == ["A", "B", "C", "D"]
+    assert dijkstra(WEIGHTED, "A", is_goal="C".__eq__).distance == 3
+
+
+def test__a_star_matches_dijkstra():
+    """
+    Test that A* finds a route as cheap as Dijkstra's.
+    """
+    goal = MAZE.index((4, 0))
+
+    def cost(node: int, neighbour: int) -> int:
+        return 1 + MAZE.position(neighbour)[1]
+
+    def heuristic(node: int) -> int:
+        x, y = MAZE.position(node)
+        return abs(x - 4) + y
+
+    expected = dijkstra(
+        _open_neighbours, 0, is_goal=goal.__eq__, cost=cost, size=len(MAZE)
+    )
+    result = a_star(
+        _open_neighbours, 0, goal.__eq__, heuristic, cost=cost, size=len(MAZE)
+    )
+
+    assert result.distance == expected.distance
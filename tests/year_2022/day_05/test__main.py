@@ -0,0 +1,73 @@
+"""
+Tests for the ``advent_of_code/year_2022/day_05/main.py`` module.
+"""
+
+import math
+import random
+
+import pytest
+
+from advent_of_code.year_2022.day_05.main import RopeStack, Stack, _Node
+
+
+@pytest.mark.parametrize("stack_type", [Stack, RopeStack])
+@pytest.mark.parametrize("one_at_a_time", [True, False])
+def test__moving_items_onto_the_same_stack(stack_type: type, one_at_a_time: bool):
+    """
+    Test that moving items from a stack onto itself leaves it unchanged.
+    """
+    stack = stack_type(["A", "B", "C", "D"])
+    stack.move_to(stack, 3, one_at_a_time=one_at_a_time)
+
+    assert list(stack) == ["A", "B", "C", "D"]
+    with pytest.raises(IndexError):
+        stack.move_to(stack, 5, one_at_a_time=one_at_a_time)
+
+
+@pytest.mark.parametrize("one_at_a_time", [True, False])
+def test__rope_stacks_match_stacks(one_at_a_time: bool):
+    """
+    Test that random moves leave rope stacks with the same items as
+    stacks.
+    """
+    rng = random.Random(0)
+    items = [[f"{i}-{j}" for j in range(rng.randrange(10))] for i in range(5)]
+    stacks = [Stack(stack_items) for stack_items in items]
+    rope_stacks = [RopeStack(stack_items) for stack_items in items]
+
+    for _ in range(500):
+        from_, to = rng.randrange(5), rng.randrange(5)
+        quantity = rng.randint(0, len(stacks[from_]))
+        stacks[from_].move_to(stacks[to], quantity, one_at_a_time)
+        rope_stacks[from_].move_to(rope_stacks[to], quantity, one_at_a_time)
+
+        assert [list(stack) for stack in rope_stacks] == stacks
+        assert [stack[-1] for stack in rope_stacks if stack] == [
+            stack[-1] for stack in stacks if stack
+        ]
+
+
+def _height(node: _Node | None) -> int:
+    if node is None:
+        return 0
+
+    return 1 + max(_height(node.left), _height(node.right))
+
+
+def test__rope_stacks_stay_balanced():
+    """
+    Test that the trees stay logarithmically deep while the same items are
+    moved back and forth, since each move takes time proportional to their
+    depth rather than to the number of items moved.
+    """
+    rng = random.Random(0)
+    size = 50_000
+    stacks = [RopeStack(map(str, range(size))), RopeStack(map(str, range(size)))]
+
+    for i in range(2_000):
+        from_, to = stacks[i % 2], stacks[1 - i % 2]
+        from_.move_to(to, rng.randint(1, len(from_) // 2), one_at_a_time=i % 3 == 0)
+
+    assert sum(map(len, stacks)) == 2 * size
+    for stack in stacks:
+        assert _height(stack._root) <= 4 * math.log2(2 * size)
@@ -0,0 +1,102 @@
+"""
+Tests for the ``advent_of_code/year_2022/day_15/main.py`` module.
+"""
+
+import importlib
+import random
+import types
+
+import pytest
+
+from advent_of_code.constants import ROOT
+
+
+@pytest.fixture
+def main(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """
+    The day 15 module, which imports bare ``utils``.
+    """
+    monkeypatch.syspath_prepend(str(ROOT))
+
+    return importlib.import_module("advent_of_code.year_2022.day_15.main")
+
+
+@pytest.fixture
+def sensors(main: types.ModuleType) -> list:
+    """
+    Random sensors, including some with the same position and beacon.
+    """
+    rng = random.Random(0)
+    sensors = []
+    for _ in range(20):
+        position = main.Position(rng.randint(-20, 20), rng.randint(-20, 20))
+        beacon = main.Position(rng.randint(-20, 20), rng.randint(-20, 20))
+        sensors.append(main.Sensor(position, beacon))
+
+    # Sensors with the same square can't be told apart by their squares
+    sensors.append(main.Sensor(sensors[0].position, sensors[0].beacon))
+    sensors.append(main.Sensor(sensors[5].position, sensors[5].beacon))
+
+    return sensors
+
+
+def test__sensor_index_covering(main: types.ModuleType, sensors: list):
+    """
+    Test that the sensors covering each position are the ones within their
+    radius of it.
+    """
+    index_ = main.SensorIndex(sensors)
+
+    for x in range(-60, 61):
+        for y in range(-60, 61):
+            expected = [
+                sensor
+                for sensor in sensors
+                if main.manhattan_distance(sensor.position, (x, y)) <= sensor.radius
+            ]
+            covering = index_.covering((x, y))
+
+            assert sorted(map(id, covering)) == sorted(map(id, expected))
+            assert index_.is_covered((x, y)) == bool(expected)
+
+
+def test__sensor_index_covering_row(main: types.ModuleType, sensors: list):
+    """
+    Test that the sensors covering some of each row segment, and the x values
+    they cover, are the ones within their radius of it.
+    """
+    index_ = main.SensorIndex(sensors)
+
+    for y in range(-60, 61):
+        covered_xs = {
+            id(sensor): [
+                x
+                for x in range(-120, 121)
+                if main.manhattan_distance(sensor.position, (x, y)) <= sensor.radius
+            ]
+            for sensor in sensors
+        }
+        for min_x, max_x in [(None, None), (-5, 5), (10, 10)]:
+            low = -120 if min_x is None else min_x
+            high = 120 if max_x is None else max_x
+            expected = {
+                sensor_id: (xs[0], xs[-1] + 1)
+                for sensor_id, xs in covered_xs.items()
+                if any(low <= x <= high for x in xs)
+            }
+
+            covering = index_.covering_row(y, min_x, max_x)
+
+            assert len(covering) == len(expected)
+            assert {id(sensor): interval for sensor, interval in covering} == expected
+
+
+def test__sensor_index_with_no_sensors(main: types.ModuleType):
+    """
+    Test that nothing is covered when there are no sensors.
+    """
+    index_ = main.SensorIndex([])
+
+    assert index_.covering((0, 0)) == []
+    assert not index_.is_covered((0, 0))
+    assert index_.covering_row(0) == []